@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Import-Time Profile for the API Entrypoint
+
+Runs ``python -X importtime -c "import src.api.main"`` in fresh interpreters,
+records the cumulative import time and the slowest modules, and fails when
+startup import time regresses more than ``--max-regression`` over the
+committed baseline report (``bench/baselines/importtime.json``) or when a
+deferred heavy dependency (see ``src/core/lazy_imports.py``) is imported
+eagerly again. Absolute times depend on the machine, so the baseline should
+be refreshed with ``--update-baseline`` on the machine that runs the check.
+
+Usage:
+    python bench/importtime.py
+    python bench/importtime.py --max-regression 0.1 --runs 5
+    python bench/importtime.py --update-baseline --runs 7
+    python bench/importtime.py --output bench/reports/importtime.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+BASELINE = ROOT / "bench" / "baselines" / "importtime.json"
+
+# Modules that must stay out of the entrypoint's import graph
+DEFERRED_MODULES = ("openai", "easyocr", "torch", "tweepy", "feedparser", "bs4", "sqlalchemy", "PIL")
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """``-X importtime`` output → {module: (self_us, cumulative_us)}."""
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        modules[name] = (int(parts[0]), int(parts[1]))
+    return modules
+
+
+def profile_once(module: str) -> Dict[str, Tuple[int, int]]:
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"importing {module} failed:\n{tail}")
+    return parse_importtime(proc.stderr)
+
+
+def profile(module: str, runs: int = 3, top: int = 15) -> Dict:
+    """Median cumulative import time of ``module`` over ``runs`` fresh interpreters.
+
+    One untimed warm-up run compiles bytecode first.
+    """
+    profile_once(module)
+    samples: List[Dict[str, Tuple[int, int]]] = [profile_once(module) for _ in range(max(1, runs))]
+    totals = [s[module][1] / 1000 for s in samples]
+    median_run = samples[totals.index(sorted(totals)[len(totals) // 2])]
+    slowest = sorted(median_run.items(), key=lambda kv: kv[1][0], reverse=True)[:top]
+    return {
+        "module": module,
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "runs": len(totals),
+        "total_ms": round(statistics.median(totals), 1),
+        "min_ms": round(min(totals), 1),
+        "max_ms": round(max(totals), 1),
+        "module_count": len(median_run),
+        "slowest_self_ms": {name: round(t[0] / 1000, 1) for name, t in slowest},
+        "deferred_imported": sorted(m for m in DEFERRED_MODULES if m in median_run),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Profile API import time and fail on regressions"
+    )
+    parser.add_argument(
+        "--module", "-m",
+        default="src.api.main",
+        help="Entrypoint module to import"
+    )
+    parser.add_argument(
+        "--runs", "-n",
+        type=int,
+        default=3,
+        help="Fresh interpreter runs (median is reported)"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=str(BASELINE),
+        help="Baseline report to compare against"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Fail when the median import time exceeds the baseline by more than this fraction"
+    )
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="Also fail when the median cumulative import time exceeds this many ms"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write this run's report as the new baseline instead of comparing"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help="Write the JSON report to this path"
+    )
+
+    args = parser.parse_args()
+
+    report = profile(args.module, runs=args.runs)
+    baseline_path = Path(args.baseline)
+    baseline = None
+    if baseline_path.exists() and not args.update_baseline:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        if baseline.get("module") != report["module"]:
+            baseline = None
+    if baseline is not None:
+        report["baseline_ms"] = baseline["total_ms"]
+        report["threshold_ms"] = round(baseline["total_ms"] * (1 + args.max_regression), 1)
+    if args.max_ms is not None:
+        report["threshold_ms"] = min(report.get("threshold_ms", args.max_ms), args.max_ms)
+
+    print(f"Import time for {report['module']}: {report['total_ms']:.1f} ms "
+          f"(median of {report['runs']}, min {report['min_ms']:.1f}, max {report['max_ms']:.1f}), "
+          f"{report['module_count']} modules")
+    print("\nSlowest modules (self time):")
+    for name, ms in report["slowest_self_ms"].items():
+        print(f"  {ms:8.1f} ms  {name}")
+
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nBaseline written to {baseline_path}")
+    elif baseline is None:
+        print(f"\nNo baseline for {report['module']} at {baseline_path}; "
+              f"run with --update-baseline to record one")
+    else:
+        change = report["total_ms"] / baseline["total_ms"] - 1
+        print(f"\nBaseline: {baseline['total_ms']:.1f} ms ({change:+.0%})")
+
+    if args.output:
+        out = Path(args.output)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nReport written to {out}")
+
+    failures = []
+    if "threshold_ms" in report and report["total_ms"] > report["threshold_ms"]:
+        failures.append(f"import time {report['total_ms']:.1f} ms exceeds {report['threshold_ms']:.1f} ms")
+    if report["deferred_imported"]:
+        failures.append(f"deferred modules imported eagerly: {', '.join(report['deferred_imported'])}")
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
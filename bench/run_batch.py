@@ -425,6 +425,8 @@ def run_batch(
     # Results
     results = []
     response_logs = []
+    pending = []
+    to_score = []
 
     # Process each claim
     for i, claim in enumerate(claims):
@@ -471,14 +473,23 @@ def run_batch(
         claim_type_values = [ct.value for ct in guardian_response.claim_analysis.claim_types]
         risk_level_value = guardian_response.claim_analysis.risk_level.value
 
-        score = scoreboard.score_response(
-            response_id=guardian_response.response_id,
-            response_text=response_text,
-            sources=source_urls,
-            risk_level=risk_level_value,
-            claim_types=claim_type_values
-        )
+        pending.append((claim_id, claim_text, cluster, guardian_response, selected_sources, response_text))
+        to_score.append({
+            "response_id": guardian_response.response_id,
+            "response_text": response_text,
+            "sources": source_urls,
+            "risk_level": risk_level_value,
+            "claim_types": claim_type_values,
+        })
 
+        print(f"  -> Tone: {guardian_response.tone_variant}")
+        print(f"  -> Sources: {len(selected_sources)}")
+        print(f"  -> Chars: {len(response_text)}")
+
+    # Score all responses in one pass over the compiled rule scanner
+    scores = scoreboard.score_batch(to_score)
+
+    for (claim_id, claim_text, cluster, guardian_response, selected_sources, response_text), score in zip(pending, scores):
         # Build result entry
         result = {
             "response_id": guardian_response.response_id,
@@ -547,11 +558,7 @@ def run_batch(
         }
         response_logs.append(response_log)
 
-        print(f"  -> Tone: {guardian_response.tone_variant}")
-        print(f"  -> Sources: {len(selected_sources)}")
-        print(f"  -> Violations: {score.violation_count}")
-        print(f"  -> Boundary: {score.boundary_type.value}")
-        print(f"  -> Chars: {len(response_text)}")
+        print(f"[{claim_id}] Violations: {score.violation_count}, Boundary: {score.boundary_type.value}")
 
     # Write outputs
     batch_id = batch_meta.get("batch_id", "batch")
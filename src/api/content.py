@@ -116,8 +116,8 @@ async def publish_enqueue(body: PublishEnqueueRequest):
     return {"queued": True, "entry": entry}
 
 @router.get("/publish/queue")
-async def publish_list():
-    return {"items": publish_queue.list()}
+async def publish_list(status: Optional[str] = None, limit: Optional[int] = None):
+    return {"items": publish_queue.list(status=status, limit=limit), "counts": publish_queue.counts()}
 
 
 
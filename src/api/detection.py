@@ -1,17 +1,27 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, UploadFile, File
+from fastapi import APIRouter, HTTPException, BackgroundTasks, UploadFile, File, Header, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, validator
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
+from contextlib import asynccontextmanager
+import json
 import logging
 from datetime import datetime
 
+from src.core.admission import (
+    AdmissionRejected, AdmissionTicket, classify_priority, get_admission_controller, is_trusted_caller,
+)
+from src.core.batch import BatchFactChecker
+from src.core.config import settings
 from src.core.detection import TruthShieldDetector, DetectionResult, CompanyFactCheckRequest
-from src.services.ocr_service import extract_text_from_image
+from src.core.quota import scheduler_snapshots
+from src.services.ocr_service import extract_text_from_image, OCRQueueFull
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/detect", tags=["Detection"])
 
 # Global detector instance
 detector = TruthShieldDetector()
+batch_checker = BatchFactChecker(detector)
 
 AVATAR_ALIAS_MAP = {
     "Guardian": "GuardianAvatar",
@@ -53,12 +63,24 @@ class ImageDetectionRequest(BaseModel):
     image_url: str
 
 # Enhanced request models
+class ReachSignals(BaseModel):
+    """Optional reach/harm signals of the post being checked; used to prioritize under load"""
+    views: Optional[float] = None
+    growth_rate_24h: Optional[float] = None
+    author_followers: Optional[float] = None
+    follower_spike_24h: Optional[float] = None
+    coordination_score: Optional[float] = None
+    astro_score: Optional[float] = None
+    harm_topic: Optional[str] = None
+    harm_weight_override: Optional[float] = None
+
 class FactCheckRequest(BaseModel):
     """Enhanced fact-checking request"""
     text: str
     company: str = "BMW"
     language: str = "de"
     generate_ai_response: bool = True
+    reach: Optional[ReachSignals] = None
     
     @validator('company')
     def validate_company(cls, v):
@@ -79,6 +101,7 @@ class QuickFactCheckRequest(BaseModel):
     """Quick fact-check without AI response"""
     text: str
     company: str = "BMW"
+    reach: Optional[ReachSignals] = None
 
     @validator('company')
     def validate_company(cls, v):
@@ -91,6 +114,7 @@ class UniversalFactCheckRequest(BaseModel):
     """Universal Guardian Avatar request"""
     text: str
     language: str = "de"
+    reach: Optional[ReachSignals] = None
     
     @validator('text')
     def validate_text(cls, v):
@@ -100,18 +124,90 @@ class UniversalFactCheckRequest(BaseModel):
             raise ValueError('Text must be less than 1000 characters')
         return v.strip()
 
+class BatchFactCheckRequest(BaseModel):
+    """Bulk fact-check; invalid claims are reported per item, not for the whole batch"""
+    claims: List[str]
+    company: str = "GuardianAvatar"
+    language: str = "de"
+    generate_ai_response: bool = False
+
+    @validator('company')
+    def validate_company(cls, v):
+        normalized = normalize_company(v)
+        if normalized not in SUPPORTED_COMPANIES:
+            raise ValueError(f'Company must be one of: {SUPPORTED_COMPANIES}')
+        return normalized
+
+    @validator('claims')
+    def validate_claims(cls, v):
+        if not v:
+            raise ValueError('At least one claim is required')
+        if len(v) > settings.batch_max_claims:
+            raise ValueError(f'At most {settings.batch_max_claims} claims per batch')
+        return v
+
 class OCRExtractResponse(BaseModel):
     extracted_text: str
     language_hint: Optional[str] = None
 
 # === OCR & IMAGE WORKFLOW ENDPOINTS ===
 
+def _request_priority(reach: Optional[ReachSignals], admission_key: Optional[str]) -> str:
+    """Self-declared reach only counts in full for callers with a trusted admission key."""
+    return classify_priority(
+        reach.model_dump(exclude_none=True) if reach else None,
+        max_priority=None if is_trusted_caller(admission_key) else settings.admission_untrusted_max_priority,
+    )
+
+
+async def _acquire_or_503(priority: str, response: Response) -> AdmissionTicket:
+    try:
+        ticket = await get_admission_controller().acquire(priority)
+    except AdmissionRejected as e:
+        logger.warning(f"⏳ Shedding fact-check: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Server busy ({e.reason}), retry later",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    response.headers["X-Admission-Priority"] = ticket.priority
+    if ticket.degraded:
+        response.headers["X-Admission-Degraded"] = "no-ai-response"
+    return ticket
+
+
+@asynccontextmanager
+async def _admission(
+    reach: Optional[ReachSignals], response: Response, admission_key: Optional[str] = None
+) -> AsyncIterator[Optional[AdmissionTicket]]:
+    """Hold an admission slot for the request; 503 + Retry-After when it is shed."""
+    if not settings.admission_enabled:
+        yield None
+        return
+    ticket = await _acquire_or_503(_request_priority(reach, admission_key), response)
+    try:
+        yield ticket
+    finally:
+        get_admission_controller().release(ticket)
+
+
+async def _ocr_or_429(file_bytes: bytes) -> str:
+    """Run OCR through the bounded pool; a full queue becomes 429 Too Many Requests."""
+    try:
+        return await extract_text_from_image(file_bytes)
+    except OCRQueueFull:
+        raise HTTPException(
+            status_code=429,
+            detail="OCR is busy, please retry shortly.",
+            headers={"Retry-After": "5"},
+        )
+
 @router.post("/ocr", response_model=OCRExtractResponse)
 async def ocr_extract_text(file: UploadFile = File(...)):
     """🖼️ Extract text from an uploaded image (OCR)"""
     try:
         file_bytes = await file.read()
-        extracted_text = await extract_text_from_image(file_bytes)
+        extracted_text = await _ocr_or_429(file_bytes)
 
         if not extracted_text:
             raise HTTPException(status_code=400, detail="No text detected in image.")
@@ -128,10 +224,12 @@ async def ocr_extract_text(file: UploadFile = File(...)):
 
 @router.post("/fact-check/image", response_model=DetectionResult)
 async def fact_check_image_upload(
+    response: Response,
     file: UploadFile = File(...),
     company: str = "GuardianAvatar",
     language: Optional[str] = None,
-    generate_ai_response: bool = True
+    generate_ai_response: bool = True,
+    x_admission_key: Optional[str] = Header(None),
 ):
     """🧠 Upload an image, run OCR, then fact-check the extracted text"""
     try:
@@ -140,21 +238,22 @@ async def fact_check_image_upload(
             raise HTTPException(status_code=400, detail=f"Company must be one of: {SUPPORTED_COMPANIES}")
 
         file_bytes = await file.read()
-        extracted_text = await extract_text_from_image(file_bytes)
+        extracted_text = await _ocr_or_429(file_bytes)
 
         if not extracted_text:
             raise HTTPException(status_code=400, detail="No text detected in image.")
 
         lang = detect_language(extracted_text) if language in (None, "", "auto") else language
 
-        company_request = CompanyFactCheckRequest(
-            text=extracted_text,
-            company=company,
-            language=lang,
-            generate_ai_response=generate_ai_response
-        )
+        async with _admission(None, response, x_admission_key) as ticket:
+            company_request = CompanyFactCheckRequest(
+                text=extracted_text,
+                company=company,
+                language=lang,
+                generate_ai_response=generate_ai_response and not (ticket and ticket.degraded)
+            )
 
-        result = await detector.fact_check_company_claim(company_request)
+            result = await detector.fact_check_company_claim(company_request)
         result.details = result.details or {}
         result.details.update({
             "ocr": {
@@ -196,23 +295,28 @@ async def detect_image(request: ImageDetectionRequest):
 # === NEW AI-POWERED ENDPOINTS ===
 
 @router.post("/fact-check", response_model=DetectionResult)
-async def fact_check_claim(request: FactCheckRequest):
+async def fact_check_claim(
+    request: FactCheckRequest, response: Response, x_admission_key: Optional[str] = Header(None)
+):
     """🧠 AI-powered fact-checking with brand response"""
     try:
         logger.info(f"🎯 Fact-checking claim for {request.company}")
         
-        company_request = CompanyFactCheckRequest(
-            text=request.text,
-            company=request.company,
-            language=request.language,
-            generate_ai_response=request.generate_ai_response
-        )
-        
-        result = await detector.fact_check_company_claim(company_request)
+        async with _admission(request.reach, response, x_admission_key) as ticket:
+            company_request = CompanyFactCheckRequest(
+                text=request.text,
+                company=request.company,
+                language=request.language,
+                generate_ai_response=request.generate_ai_response and not (ticket and ticket.degraded)
+            )
+            
+            result = await detector.fact_check_company_claim(company_request)
         
         logger.info(f"✅ Fact-check completed: {result.request_id}")
         return result
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -220,7 +324,9 @@ async def fact_check_claim(request: FactCheckRequest):
         raise HTTPException(status_code=500, detail=f"Fact-checking failed: {str(e)}")
 
 @router.post("/quick-check", response_model=DetectionResult)
-async def quick_fact_check(request: QuickFactCheckRequest):
+async def quick_fact_check(
+    request: QuickFactCheckRequest, response: Response, x_admission_key: Optional[str] = Header(None)
+):
     """⚡ Quick fact-check without AI response generation"""
     try:
         company_request = CompanyFactCheckRequest(
@@ -230,9 +336,12 @@ async def quick_fact_check(request: QuickFactCheckRequest):
             generate_ai_response=False
         )
         
-        result = await detector.fact_check_company_claim(company_request)
+        async with _admission(request.reach, response, x_admission_key):
+            result = await detector.fact_check_company_claim(company_request)
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Quick fact-check failed: {e}")
         raise HTTPException(status_code=500, detail=f"Quick check failed: {str(e)}")
@@ -240,35 +349,82 @@ async def quick_fact_check(request: QuickFactCheckRequest):
 # === NEW: UNIVERSAL GUARDIAN AVATAR ENDPOINT ===
 
 @router.post("/universal", response_model=DetectionResult)
-async def universal_fact_check(request: UniversalFactCheckRequest):
+async def universal_fact_check(
+    request: UniversalFactCheckRequest, response: Response, x_admission_key: Optional[str] = Header(None)
+):
     """🛡️ Universal Guardian Avatar - fact-checks any misinformation"""
     try:
         logger.info(f"🛡️ Guardian Avatar fact-checking: {request.text[:50]}...")
         
-        # Create request with Guardian Avatar as company
-        company_request = CompanyFactCheckRequest(
-            text=request.text,
-            company="GuardianAvatar",  # This triggers Guardian Avatar persona
-            language=request.language,
-            generate_ai_response=True  # Always generate response for Guardian Avatar
-        )
-        
-        # Use the universal fact check method if it exists, otherwise use regular
-        if hasattr(detector, 'universal_fact_check'):
-            result = await detector.universal_fact_check(company_request)
-        else:
-            # Fallback: use regular fact-check with Guardian Avatar company
-            result = await detector.fact_check_company_claim(company_request)
+        async with _admission(request.reach, response, x_admission_key) as ticket:
+            # Create request with Guardian Avatar as company
+            company_request = CompanyFactCheckRequest(
+                text=request.text,
+                company="GuardianAvatar",  # This triggers Guardian Avatar persona
+                language=request.language,
+                # Always generate response for Guardian Avatar, unless shedding load
+                generate_ai_response=not (ticket and ticket.degraded)
+            )
+            
+            # Use the universal fact check method if it exists, otherwise use regular
+            if hasattr(detector, 'universal_fact_check'):
+                result = await detector.universal_fact_check(company_request)
+            else:
+                # Fallback: use regular fact-check with Guardian Avatar company
+                result = await detector.fact_check_company_claim(company_request)
         
         logger.info(f"✅ Guardian Avatar check completed: {result.request_id}")
         return result
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"❌ Guardian Avatar failed: {e}")
         raise HTTPException(status_code=500, detail=f"Guardian Avatar check failed: {str(e)}")
 
+async def _ndjson(records: AsyncIterator[Dict]) -> AsyncIterator[str]:
+    async for record in records:
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+@router.post("/batch")
+async def batch_fact_check(request: BatchFactCheckRequest, response: Response):
+    """📦 Fact-check many claims; streams one NDJSON line per claim as it finishes, then a summary"""
+    logger.info(f"📦 Batch fact-check: {len(request.claims)} claims for {request.company}")
+    # Each claim pipeline holds its own slot at admission_batch_priority (see BatchFactChecker);
+    # a batch whose priority cannot get a slot right now is shed up front
+    admission = None
+    if settings.admission_enabled:
+        ticket = await _acquire_or_503(settings.admission_batch_priority, response)
+        admission = get_admission_controller()
+        admission.release(ticket)
+    records = batch_checker.run(
+        request.claims,
+        company=request.company,
+        language=request.language,
+        generate_ai_response=request.generate_ai_response,
+        admission=admission,
+        priority=settings.admission_batch_priority,
+    )
+    headers = {"X-Admission-Priority": settings.admission_batch_priority} if admission is not None else None
+    return StreamingResponse(_ndjson(records), media_type="application/x-ndjson", headers=headers)
+
+@router.delete("/cache")
+async def invalidate_fact_check_cache(text: Optional[str] = None, company: Optional[str] = None):
+    """🧹 Invalidate cached fact-check results for a claim and/or company (all when neither is given)
+
+    ``invalidated`` counts this worker's entries; other API and job workers drop
+    theirs within ``propagation_seconds``.
+    """
+    removed = detector.invalidate_cache(text=text, company=company)
+    logger.info(f"Fact-check cache invalidated: {removed} entries")
+    return {
+        "invalidated": removed,
+        "propagation_seconds": settings.claim_cache_invalidation_poll,
+        "cache": detector.result_cache.summary(),
+    }
+
 @router.get("/status")
 async def detection_status():
     """📊 Get enhanced detection engine status"""
@@ -276,9 +432,12 @@ async def detection_status():
         stats = await detector.get_detection_stats()
         return {
             **stats,
+            # Load detail lives here, not in the unauthenticated /health payload
+            "quotas": scheduler_snapshots(),
+            "admission": get_admission_controller().snapshot(),
             "endpoints": {
                 "legacy": ["/text", "/image"],
-                "ai_powered": ["/fact-check", "/quick-check", "/universal"],  # Added /universal
+                "ai_powered": ["/fact-check", "/quick-check", "/universal", "/batch"],
                 "monitoring": ["/status", "/health"]
             },
             "example_requests": {
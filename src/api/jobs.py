@@ -0,0 +1,86 @@
+"""
+Job API Endpoints
+Submit long-running fact-checks to the job queue and poll (or get a webhook) for the result
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import validator
+from typing import Optional
+import asyncio
+import logging
+
+from src.api.detection import FactCheckRequest
+from src.core.config import settings
+from src.core.jobs import JobQueue, get_job_queue, webhook_url_error
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/jobs", tags=["Jobs"])
+
+TERMINAL_STATES = (JobQueue.SUCCEEDED, JobQueue.FAILED)
+
+
+class FactCheckJobRequest(FactCheckRequest):
+    """Fact-check run by the worker pool instead of the API worker"""
+    priority: int = 5
+    webhook_url: Optional[str] = None
+
+    @validator('priority')
+    def validate_priority(cls, v):
+        if not 0 <= v <= 10:
+            raise ValueError('Priority must be between 0 and 10')
+        return v
+
+    @validator('webhook_url')
+    def validate_webhook_url(cls, v):
+        if v and not v.startswith(("http://", "https://")):
+            raise ValueError('Webhook URL must start with http:// or https://')
+        error = webhook_url_error(v) if v else None
+        if error:
+            raise ValueError(error)
+        return v or None
+
+
+@router.post("/fact-check", status_code=202)
+async def submit_fact_check(request: FactCheckJobRequest):
+    """📥 Queue a fact-check; poll ``poll_url`` or wait for the webhook"""
+    job = await asyncio.to_thread(
+        get_job_queue().submit,
+        "fact_check",
+        {
+            "text": request.text,
+            "company": request.company,
+            "language": request.language,
+            "generate_ai_response": request.generate_ai_response,
+        },
+        priority=request.priority,
+        max_attempts=settings.jobs_max_attempts,
+        webhook_url=request.webhook_url,
+    )
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "poll_url": f"/api/v1/jobs/{job['id']}",
+    }
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, wait: float = Query(0.0, ge=0.0, le=30.0)):
+    """📋 Job state and result; ``wait`` long-polls up to that many seconds for completion"""
+    queue = get_job_queue()
+    job = await asyncio.to_thread(queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    deadline = asyncio.get_running_loop().time() + wait
+    while job["status"] not in TERMINAL_STATES and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.25)
+        job = await asyncio.to_thread(queue.get, job_id)
+    return job
+
+
+@router.get("/")
+async def list_jobs(status: Optional[str] = None, kind: Optional[str] = None, limit: int = Query(50, ge=1, le=500)):
+    """📚 Recent jobs and queue counts by status"""
+    queue = get_job_queue()
+    jobs = await asyncio.to_thread(queue.list, status, kind, limit)
+    return {"jobs": jobs, "counts": await asyncio.to_thread(queue.counts)}
@@ -12,9 +12,12 @@ if os.getenv("DISABLE_SSL_VERIFY", "false").lower() == "true":
     os.environ['CURL_CA_BUNDLE'] = ''
     os.environ['REQUESTS_CA_BUNDLE'] = ''
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, Response, FileResponse
+from fastapi.responses import HTMLResponse, Response, FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 from pydantic import BaseModel
@@ -39,6 +42,7 @@ from src.api.content import router as content_router
 from src.api.compliance import router as compliance_router
 from src.api.ml import router as ml_router
 from src.api.ml_feedback import router as ml_feedback_router
+from src.api.jobs import router as jobs_router
 
 # Integrity guard: verify the immutable source authority weights have not been
 # tampered with. On mismatch this logs CRITICAL and raises, aborting startup.
@@ -49,17 +53,62 @@ verify_source_weights_integrity()
 # Startup LLM-model validation: confirm the configured generation model is
 # actually available on the account. Does NOT abort startup (the API runs
 # degraded), but logs CRITICAL and surfaces `llm: misconfigured` on /health.
+# The lookup and the subsystem warm-ups run concurrently in the background
+# from the lifespan below, so the app starts serving immediately; /ready
+# reports when they are done.
 from src.core.config import settings
 from src.core.llm_health import validate_llm_model
+from src.core.startup import StartupOrchestrator
+from src.core.jobs import get_job_queue
+from src.core.resilience import provider_states
+from src.core.ai_engine import ai_engine
+from src.core.ml_learning import ml_system
+from src.api.monitoring import social_monitor
 
-LLM_MODEL_STATUS = validate_llm_model(
-    settings.openai_model_generation, os.getenv("OPENAI_API_KEY")
+startup = StartupOrchestrator()
+startup.add_check(
+    "llm_model",
+    lambda: validate_llm_model(settings.openai_model_generation, os.getenv("OPENAI_API_KEY")),
 )
+if settings.startup_warm_subsystems:
+    startup.add_warmup(ai_engine)
+    startup.add_warmup(ml_system)
+    startup.add_check("twitter", social_monitor.connect, critical=False)
+
+
+def _llm_model_status() -> str:
+    """'ok' | 'misconfigured' | 'unknown' ('unknown' until the startup check finishes)."""
+    return startup.results.get("llm_model") or "unknown"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup.start()
+    # Single-container deployments (Procfile, Dockerfile) run jobs in this embedded
+    # worker; docker-compose turns it off and runs `python -m src.core.job_worker`.
+    worker_task = stop_worker = None
+    if settings.jobs_embedded_worker:
+        from src.core.job_worker import JobWorker
+
+        stop_worker = asyncio.Event()
+        worker = JobWorker(
+            get_job_queue(),
+            concurrency=settings.jobs_worker_concurrency,
+            poll_interval=settings.jobs_poll_interval,
+        )
+        worker_task = asyncio.create_task(worker.run(stop_worker))
+    yield
+    if worker_task is not None:
+        stop_worker.set()
+        await worker_task
+    await startup.stop()
+
 
 app = FastAPI(
     title="🛡️ TruthShield API",
     description="European AI Solution for Digital Information Integrity",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS MIDDLEWARE
@@ -92,6 +141,7 @@ app.include_router(content_router)
 app.include_router(compliance_router)
 app.include_router(ml_router)
 app.include_router(ml_feedback_router)
+app.include_router(jobs_router)
 
 # Explicit image route (more reliable than StaticFiles mount on some platforms)
 @app.get("/images/{filename}")
@@ -133,20 +183,24 @@ class HealthResponse(BaseModel):
     subsystems: dict
     llm_model: str                 # configured generation model id
     llm_model_status: str          # "ok" | "misconfigured" | "unknown"
+    ready: bool                    # startup checks finished (see /ready)
 
 
 def _subsystem_status() -> dict:
     """Lightweight per-subsystem status. No secrets, key fragments, or quota detail.
 
     LLM status is based on whether the API key is configured (no per-request
-    completion call). Result is cached for 60s to keep /health cheap.
+    completion call). Result is cached for 60s to keep /health cheap, once
+    the startup checks have finished. Provider circuit-breaker states are
+    live (not cached): a configured provider whose circuit is not closed
+    reports ``circuit_open`` / ``circuit_half_open``.
     """
     import time
 
     cache = getattr(_subsystem_status, "_cache", None)
     now = time.time()
     if cache and now - cache[0] < 60:
-        return cache[1]
+        return _with_circuit_breakers(cache[1])
 
     def _configured(var: str) -> str:
         return "ok" if os.getenv(var) else "unconfigured"
@@ -155,7 +209,7 @@ def _subsystem_status() -> dict:
     # misconfigured (the dead-model case); otherwise ok.
     if not os.getenv("OPENAI_API_KEY"):
         llm = "unavailable"
-    elif LLM_MODEL_STATUS == "misconfigured":
+    elif _llm_model_status() == "misconfigured":
         llm = "misconfigured"
     else:
         llm = "ok"
@@ -168,8 +222,19 @@ def _subsystem_status() -> dict:
         "mediawiki": "ok",   # public API, no key required
         "database": "ok",    # local SQLite (dev)
     }
-    _subsystem_status._cache = (now, subsystems)
-    return subsystems
+    if startup.ready:
+        _subsystem_status._cache = (now, subsystems)
+    return _with_circuit_breakers(subsystems)
+
+
+def _with_circuit_breakers(subsystems: dict) -> dict:
+    breakers = provider_states()
+    merged = dict(subsystems)
+    for name, state in breakers.items():
+        if state != "closed" and merged.get(name) == "ok":
+            merged[name] = f"circuit_{state}"
+    merged["circuit_breakers"] = breakers
+    return merged
 
 @app.get("/")
 async def root():
@@ -229,9 +294,23 @@ async def health_check():
         version="0.1.0",
         subsystems=subsystems,
         llm_model=settings.openai_model_generation,
-        llm_model_status=LLM_MODEL_STATUS,
+        llm_model_status=_llm_model_status(),
+        ready=startup.ready,
     )
 
+
+@app.get("/live")
+async def liveness_check():
+    """Liveness: the process is up and serving (no dependency checks)."""
+    return {"status": "alive"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: startup checks have finished. 503 while they are still running."""
+    status = startup.status()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
 if os.getenv("ENVIRONMENT", "production").lower() == "development":
     @app.get("/debug/env")
     async def debug_environment():
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, validator
 from typing import List, Optional, Dict
 from datetime import datetime
+import asyncio
 import logging
 
 from src.services.social_monitor import SocialMediaMonitor
@@ -16,8 +17,11 @@ from src.core.kpi import KPIDecider
 from src.core.qa import QASampler
 from src.core.coordinated_behavior import CoordinatedBehaviorDetector
 from src.core.publish import PublishQueue
+from src.core.jobs import get_job_queue
 from src.core.config import settings
 from src.core.audit import AuditLog
+from src.core.routing import BatchRouter
+from src.core.temporal import StreamingTemporalClusterer, parse_timestamp
 from random import random
 
 logger = logging.getLogger(__name__)
@@ -33,6 +37,17 @@ kpi_decider = KPIDecider()
 qa_sampler = QASampler(kpi_decider)
 publisher = PublishQueue()
 auditor = AuditLog()
+batch_router = BatchRouter(
+    social_monitor.prioritizer,
+    social_monitor.virality,
+    astro_detector,
+    kpi_decider,
+    qa_sampler,
+    watchlists,
+)
+# Long-lived so same-text bursts are tracked across background scans
+temporal_clusterer = StreamingTemporalClusterer()
+_cluster_sweeper: Optional[asyncio.Task] = None
 
 class MonitoringRequest(BaseModel):
     company_name: str
@@ -164,17 +179,22 @@ async def start_monitoring(request: MonitoringRequest):
     }
 
 @router.post("/campaigns/start")
-async def start_campaign_monitoring(request: CampaignMonitoringRequest, background_tasks: BackgroundTasks):
+async def start_campaign_monitoring(request: CampaignMonitoringRequest):
     """🚨 Start monitoring for coordinated campaigns against client"""
     try:
         logger.info(f"🔍 Starting campaign monitoring for {request.client_name}")
         
-        # Start background monitoring
-        background_tasks.add_task(
-            monitor_client_campaigns,
-            request.client_name,
-            request.platforms,
-            request.monitoring_duration_hours
+        # Queue the scan for the job workers (survives API worker restarts)
+        job = await asyncio.to_thread(
+            get_job_queue().submit,
+            "campaign_monitoring",
+            {
+                "client_name": request.client_name,
+                "platforms": request.platforms,
+                "duration_hours": request.monitoring_duration_hours,
+            },
+            priority=1,
+            max_attempts=settings.jobs_max_attempts,
         )
         
         return {
@@ -183,7 +203,9 @@ async def start_campaign_monitoring(request: CampaignMonitoringRequest, backgrou
             "platforms": request.platforms,
             "monitoring_duration_hours": request.monitoring_duration_hours,
             "message": f"Campaign monitoring started for {request.client_name}",
-            "started_at": datetime.now().isoformat()
+            "started_at": datetime.now().isoformat(),
+            "job_id": job["id"],
+            "status_url": f"/api/v1/jobs/{job['id']}"
         }
         
     except Exception as e:
@@ -342,91 +364,41 @@ async def pipeline_config():
 
 @router.post("/pipeline/route", response_model=List[RouteDecision])
 async def pipeline_route(items: List[PipelineItem]):
-    """Route items through pre-filter → astro score → action decision."""
-    decisions: List[RouteDecision] = []
-    for item in items:
-        base = item.model_dump()
-        virality = social_monitor.virality_score(base)
-        # Pre-filter: watchlist or virality ≥ threshold (client ROI can adjust)
-        watchlist = False
-        pools = social_monitor.prioritize_batch([base])[0].pools
-        if pools.get("track_pool") or pools.get("account_pool"):
-            watchlist = True
-        # ROI scaling: if author/topic in client watchlist, scale threshold down
-        roi_scale = 1.0
-        wl = None
-        if item.author_username:
-            wl = watchlists.get(item.author_username)
-        if not wl and base.get("content_text"):
-            wl = watchlists.get(base.get("content_text", "")[:32])  # naive topic key
-        vt = settings.virality_threshold * (wl.get("roi_threshold", 1.0) if wl else 1.0)
-        passes_prefilter = watchlist or virality >= vt
-
-        astro_score = 0.0
-        reasons: List[str] = []
-        if passes_prefilter:
-            signals = item.astro_signals.model_dump() if item.astro_signals else {}
-            astro = astro_detector.score(signals)
-            astro_score = astro.score_0_10
-            reasons.extend(astro.notes)
-
-        # KPI decision
-        kpi = kpi_decider.decide(
-            views=float(base.get("views") or 0.0),
-            growth_rate_24h=float(base.get("growth_rate_24h") or 0.0),
-            harm_topic=item.harm_topic,
-            harm_weight_override=item.harm_weight_override,
-            astro_score=astro_score,
-            avg_analyst_seconds=item.avg_analyst_seconds,
-            salary_rate_per_hour=item.salary_rate_per_hour,
-            client_max_cpr=item.client_max_cpr,
-        )
-
-        # Map KPI actions to routing actions
-        if not passes_prefilter:
-            action = "ARCHIVE"
-        elif kpi.action == "HITL":
-            action = "ALERT_HITL"
-        elif kpi.action == "SEMI_HITL":
-            action = "SEMI_HITL"
-        else:
-            action = "ARCHIVE"
+    """Route items through pre-filter → astro score → action decision.
 
+    Scoring runs column-wise over the whole batch (see ``BatchRouter``); only
+    items that are archived as evidence or auto-posted are touched one by one.
+    """
+    batch = batch_router.route(items)
+    decisions: List[RouteDecision] = []
+    for i, item in enumerate(items):
+        action = batch.action[i]
+        qa_selected = batch.qa_selected[i]
         evidence = None
-        if action != "ARCHIVE":
+        if action != "ARCHIVE" or qa_selected:
+            base = item.model_dump()
             provenance = {
                 "platform": base.get("platform"),
                 "content_id": base.get("content_id"),
                 "content_url": base.get("content_url"),
                 "author_username": base.get("author_username"),
             }
-            evidence = evidence_archiver.archive(base, action, provenance=provenance)
-
-        # QA sampling for low-score but high-spread (even if ARCHIVE)
-        qa = qa_sampler.evaluate(base, astro_score)
-        qa_selected = False
-        if action == "ARCHIVE" and qa.selected:
-            qa_selected = True
-            evidence = evidence_archiver.archive(base, "QA_SAMPLE", provenance={
-                "platform": base.get("platform"),
-                "content_id": base.get("content_id"),
-                "content_url": base.get("content_url"),
-                "author_username": base.get("author_username"),
-            })
+            # QA sampling for low-score but high-spread (even if ARCHIVE)
+            evidence = evidence_archiver.archive(base, "QA_SAMPLE" if qa_selected else action, provenance=provenance)
 
-        # Edge automation: enqueue verified items if enabled and action is HITL/SEMI
-        if settings.auto_post_enabled and base.get("verified") and action in ("ALERT_HITL", "SEMI_HITL"):
-            publisher.enqueue({
-                "action": action,
-                "content": base,
-            })
+            # Edge automation: enqueue verified items if enabled and action is HITL/SEMI
+            if settings.auto_post_enabled and base.get("verified") and action in ("ALERT_HITL", "SEMI_HITL"):
+                publisher.enqueue({
+                    "action": action,
+                    "content": base,
+                })
 
         decisions.append(RouteDecision(
             action=action,
-            watchlist=watchlist,
-            astro_score=astro_score,
-            virality_score=virality,
-            reasons=reasons + [f"kpi:{kpi.reasons}", f"qa:{qa.reason}:{qa.projected_reach_48h}"],
+            watchlist=batch.watchlist[i],
+            astro_score=batch.astro_score[i],
+            virality_score=batch.virality_score[i],
+            reasons=batch.reasons[i],
             evidence=evidence,
             qa_selected=qa_selected,
         ))
@@ -638,8 +610,46 @@ async def triage_item(body: TriageItemRequest):
 
 @router.post("/triage/batch", response_model=List[TriageItemResponse])
 async def triage_batch(items: List[TriageItemRequest]):
-    """Batch triage for multiple items."""
-    return [await triage_item(item) for item in items]
+    """Batch triage for multiple items (same output as ``/triage/item`` per item)."""
+    batch = batch_router.triage(items)
+    templates = []
+    playbook = get_playbook(1)
+    if "templates" in playbook:
+        templates = list(playbook["templates"].values())[:3]
+
+    responses: List[TriageItemResponse] = []
+    for i, item in enumerate(items):
+        astro_score = batch.astro_score[i]
+        virality = batch.virality_score[i]
+        verdict = "unsupported"
+        if astro_score >= 8.0:
+            verdict = "manipulated"
+        elif astro_score >= 5.0:
+            verdict = "misleading"
+        elif virality > 7.0:
+            verdict = "misleading"
+        network_cluster = None
+        if item.author_username:
+            network_cluster = {
+                "nodes": 1,
+                "edges": 0,
+                "cluster_id": "single",
+                "note": "Full graph analysis requires batch of related items"
+            }
+        responses.append(TriageItemResponse(
+            content_id=item.content_id,
+            verdict=verdict,
+            priority=batch.priority[i],
+            watchlist=batch.watchlist[i],
+            astro_score=astro_score,
+            virality_score=virality,
+            projected_reach_48h=batch.projected_reach_48h[i],
+            top_sources=[],
+            network_cluster=network_cluster,
+            suggested_templates=templates,
+            escalate_flag=batch.priority[i] == "high",
+        ))
+    return responses
 
 @router.post("/triage/action", response_model=TriageActionResponse)
 async def triage_action(body: TriageActionRequest):
@@ -675,8 +685,23 @@ async def triage_action(body: TriageActionRequest):
 
 # === HELPER FUNCTIONS ===
 
-async def monitor_client_campaigns(client_name: str, platforms: List[str], duration_hours: int):
-    """Background task to monitor client for campaigns"""
+async def _sweep_idle_clusters() -> None:
+    """Close same-text clusters that went quiet, even when no new scan arrives."""
+    while True:
+        await asyncio.sleep(settings.temporal_cluster_sweep_interval)
+        for event in temporal_clusterer.expire(datetime.utcnow()):
+            logger.info(f"🧩 Same-text cluster closed: signature={event.signature} size={event.size}")
+
+
+def _ensure_cluster_sweeper() -> None:
+    # Started on first use, so it runs in whichever process (API or job worker) does the scans
+    global _cluster_sweeper
+    loop = asyncio.get_running_loop()
+    if _cluster_sweeper is None or _cluster_sweeper.done() or _cluster_sweeper.get_loop() is not loop:
+        _cluster_sweeper = loop.create_task(_sweep_idle_clusters())
+
+async def monitor_client_campaigns(client_name: str, platforms: List[str], duration_hours: int) -> Dict:
+    """Monitor a client for campaigns (run as a ``campaign_monitoring`` job); returns a routing summary"""
     try:
         logger.info(f"🔍 Background monitoring started for {client_name}")
         
@@ -695,10 +720,25 @@ async def monitor_client_campaigns(client_name: str, platforms: List[str], durat
             # Placeholder for TikTok monitoring
             logger.info(f"TikTok monitoring for {client_name} - integration pending")
         
+        # Feed the long-running same-text clusterer (time-ordered; rescanned posts are skipped)
+        _ensure_cluster_sweeper()
+        for raw in sorted(content_batch, key=lambda r: parse_timestamp(r.get("created_at"))):
+            for event in temporal_clusterer.ingest(raw):
+                if event.kind == "open":
+                    logger.info(
+                        f"🧩 Same-text cluster opened for {client_name}: "
+                        f"signature={event.signature} size={event.size}"
+                    )
+                elif event.kind == "close":
+                    logger.info(f"🧩 Same-text cluster closed: signature={event.signature} size={event.size}")
+
         # Analyze + prioritize for watchlist + route decisions
+        counts = {"ALERT_HITL": 0, "SEMI_HITL": 0, "ARCHIVE": 0}
+        watchlist_count = 0
         if content_batch:
             prioritized = social_monitor.prioritize_batch(content_batch)
             watchlist_items = [p for p in prioritized if p.watchlist]
+            watchlist_count = len(watchlist_items)
 
             # Build pipeline items with minimal features; astro signals left empty for now
             pipeline_items = []
@@ -716,7 +756,6 @@ async def monitor_client_campaigns(client_name: str, platforms: List[str], durat
                 ))
 
             decisions = await pipeline_route(pipeline_items)  # reuse logic
-            counts = {"ALERT_HITL": 0, "SEMI_HITL": 0, "ARCHIVE": 0}
             for d in decisions:
                 counts[d.action] += 1
 
@@ -726,6 +765,13 @@ async def monitor_client_campaigns(client_name: str, platforms: List[str], durat
             )
         
         logger.info(f"✅ Background monitoring completed for {client_name}")
+        return {
+            "client_name": client_name,
+            "items": len(content_batch),
+            "watchlist": watchlist_count,
+            "routed": counts,
+        }
         
     except Exception as e:
-        logger.error(f"Background monitoring error for {client_name}: {e}")
\ No newline at end of file
+        logger.error(f"Background monitoring error for {client_name}: {e}")
+        raise  # the job queue retries with backoff
\ No newline at end of file
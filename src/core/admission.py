@@ -0,0 +1,313 @@
+"""
+Priority-aware admission control for the fact-check endpoints.
+
+Under a traffic spike every fact-check competes for the LLM and the source
+providers, so a flood of low-reach claims can starve high-harm ones.
+:class:`AdmissionController` sits in front of the detection pipeline:
+
+- each priority (``high`` / ``medium`` / ``low``, as produced by
+  ``PrioritizationEngine``) has its own concurrency pool
+  (``admission_slots_<priority>``); a request may also borrow a free slot
+  from a *lower* pool, never from a higher one, so high-priority capacity is
+  always held back;
+- requests that find no slot wait in one bounded queue ordered by
+  priority, then deadline (``admission_max_wait_<priority>`` seconds);
+  when the queue is full a newcomer displaces the lowest-ranked waiter, or
+  is rejected if it ranks lowest itself;
+- a request is rejected up front when its estimated wait (queue position ×
+  average service time) already exceeds its deadline. Every rejection
+  carries a ``retry_after`` hint, which the API turns into 503 +
+  ``Retry-After``;
+- requests at or below ``admission_degrade_priority`` admitted while
+  utilization is at least ``admission_degrade_utilization`` (or anyone is
+  queued) are marked ``degraded``: they skip LLM response generation.
+
+:func:`classify_priority` maps optional reach signals on a request to a
+priority with ``PrioritizationEngine.prioritize`` and ``KPIDecider.decide``.
+Reach signals are declared by the client, so unless the caller presents one
+of ``admission_trusted_keys`` (see :func:`is_trusted_caller`) they can raise
+a request to at most ``admission_untrusted_max_priority``.
+"""
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
+import heapq
+import hmac
+import itertools
+import math
+import time
+
+from src.core.config import settings
+from src.core.kpi import KPIDecider
+from src.core.prioritization import PrioritizationEngine
+
+PRIORITIES = ("high", "medium", "low")
+RANK = {p: i for i, p in enumerate(PRIORITIES)}
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed; ``retry_after`` is a hint in whole seconds."""
+
+    def __init__(self, reason: str, priority: str, retry_after: int) -> None:
+        super().__init__(f"{priority} request rejected ({reason})")
+        self.reason = reason
+        self.priority = priority
+        self.retry_after = retry_after
+
+
+@dataclass
+class AdmissionTicket:
+    priority: str
+    pool: str
+    degraded: bool
+    waited_ms: int
+    admitted_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass(order=True)
+class _Waiter:
+    rank: int
+    deadline: float
+    seq: int
+    priority: str = field(compare=False)
+    future: "asyncio.Future[AdmissionTicket]" = field(compare=False)
+    enqueued: float = field(compare=False)
+
+
+class AdmissionController:
+    """Per-priority concurrency pools with a bounded priority/deadline wait queue."""
+
+    def __init__(
+        self,
+        slots: Dict[str, int],
+        max_queue: int = 64,
+        max_wait: Optional[Dict[str, float]] = None,
+        degrade_priority: str = "low",
+        degrade_utilization: float = 0.75,
+        clock=time.monotonic,
+    ) -> None:
+        unknown = set(slots) - set(PRIORITIES)
+        if unknown:
+            raise ValueError(f"Unknown priorities: {sorted(unknown)}")
+        self.limits = {p: max(0, int(slots.get(p, 0))) for p in PRIORITIES}
+        if not any(self.limits.values()):
+            raise ValueError("At least one admission slot is required")
+        self.max_queue = max(0, int(max_queue))
+        self.max_wait = {p: float((max_wait or {}).get(p, 5.0)) for p in PRIORITIES}
+        self.degrade_rank = RANK[degrade_priority]
+        self.degrade_utilization = float(degrade_utilization)
+        self.clock = clock
+        self.in_use = {p: 0 for p in PRIORITIES}
+        self._queue: List[_Waiter] = []
+        self._queued = 0
+        self._seq = itertools.count()
+        self._service_time = 0.0  # EWMA of seconds a slot is held
+        self.stats = {
+            "admitted": 0, "queued": 0, "degraded": 0,
+            "rejected_queue_full": 0, "rejected_early": 0, "rejected_deadline": 0, "shed": 0,
+        }
+
+    # -- capacity -----------------------------------------------------------
+
+    def _free_pool(self, rank: int) -> Optional[str]:
+        """Own pool first, then lower ones; never a higher-priority pool."""
+        for p in PRIORITIES[rank:]:
+            if self.in_use[p] < self.limits[p]:
+                return p
+        return None
+
+    def _capacity(self, rank: int) -> int:
+        return sum(self.limits[p] for p in PRIORITIES[rank:])
+
+    @property
+    def utilization(self) -> float:
+        return sum(self.in_use.values()) / sum(self.limits.values())
+
+    def _estimated_wait(self, rank: int, ahead: int) -> float:
+        capacity = self._capacity(rank)
+        if not capacity:
+            return math.inf
+        return (ahead + 1) / capacity * self._service_time
+
+    def _retry_after(self, priority: str) -> int:
+        wait = self._estimated_wait(RANK[priority], self._queued)
+        if not wait or not math.isfinite(wait):
+            wait = self.max_wait[priority]
+        return max(1, math.ceil(wait))
+
+    def _grant(self, priority: str, pool: str, enqueued: float) -> AdmissionTicket:
+        self.in_use[pool] += 1
+        self.stats["admitted"] += 1
+        degraded = RANK[priority] >= self.degrade_rank and (
+            self.utilization >= self.degrade_utilization or self._queued > 0
+        )
+        self.stats["degraded"] += degraded
+        return AdmissionTicket(
+            priority=priority,
+            pool=pool,
+            degraded=degraded,
+            waited_ms=int((self.clock() - enqueued) * 1000),
+            admitted_at=self.clock(),
+        )
+
+    # -- acquire / release ----------------------------------------------------
+
+    async def acquire(self, priority: str) -> AdmissionTicket:
+        """Wait for a slot for ``priority``; raises :class:`AdmissionRejected` when shed."""
+        rank = RANK[priority]
+        now = self.clock()
+        pool = self._free_pool(rank)
+        if pool is not None:
+            return self._grant(priority, pool, now)
+
+        deadline = now + self.max_wait[priority]
+        ahead = sum(1 for w in self._queue if not w.future.done() and (w.rank, w.deadline) <= (rank, deadline))
+        if self._estimated_wait(rank, ahead) > self.max_wait[priority]:
+            self.stats["rejected_early"] += 1
+            raise AdmissionRejected("overloaded", priority, self._retry_after(priority))
+        if self._queued >= self.max_queue:
+            worst = max((w for w in self._queue if not w.future.done()), default=None)
+            if worst is None or (worst.rank, worst.deadline) <= (rank, deadline):
+                self.stats["rejected_queue_full"] += 1
+                raise AdmissionRejected("queue_full", priority, self._retry_after(priority))
+            self._drop(worst, AdmissionRejected("shed", worst.priority, self._retry_after(worst.priority)))
+            self.stats["shed"] += 1
+
+        waiter = _Waiter(
+            rank, deadline, next(self._seq), priority,
+            asyncio.get_running_loop().create_future(), now,
+        )
+        heapq.heappush(self._queue, waiter)
+        self._queued += 1
+        self.stats["queued"] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter.future), timeout=max(0.0, deadline - now))
+        except asyncio.TimeoutError:
+            if waiter.future.done() and not waiter.future.cancelled() and not waiter.future.exception():
+                # Granted just as the deadline hit: hand the slot back
+                self.release(waiter.future.result())
+            self._drop(waiter, None)
+            self.stats["rejected_deadline"] += 1
+            raise AdmissionRejected("deadline", priority, self._retry_after(priority))
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled() and not waiter.future.exception():
+                self.release(waiter.future.result())
+            self._drop(waiter, None)
+            raise
+
+    def _drop(self, waiter: _Waiter, error: Optional[Exception]) -> None:
+        # Lazy deletion: the heap entry is skipped once its future is done
+        if not waiter.future.done():
+            self._queued -= 1
+            if error is None:
+                waiter.future.cancel()
+            else:
+                waiter.future.set_exception(error)
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        self.in_use[ticket.pool] -= 1
+        held = self.clock() - ticket.admitted_at
+        self._service_time = held if not self._service_time else 0.8 * self._service_time + 0.2 * held
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        # The head outranks every other waiter and may use any pool they may,
+        # so if it cannot be placed nobody can.
+        while self._queue:
+            head = self._queue[0]
+            if head.future.done():
+                heapq.heappop(self._queue)
+                continue
+            pool = self._free_pool(head.rank)
+            if pool is None:
+                return
+            heapq.heappop(self._queue)
+            self._queued -= 1
+            head.future.set_result(self._grant(head.priority, pool, head.enqueued))
+
+    @asynccontextmanager
+    async def admit(self, priority: str) -> AsyncIterator[AdmissionTicket]:
+        ticket = await self.acquire(priority)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "in_use": dict(self.in_use),
+            "limits": dict(self.limits),
+            "waiting": self._queued,
+            "avg_service_ms": int(self._service_time * 1000),
+            **self.stats,
+        }
+
+
+_prioritizer: Optional[PrioritizationEngine] = None
+_kpi_decider = KPIDecider()
+
+
+def is_trusted_caller(key: Optional[str]) -> bool:
+    """Whether ``key`` (the ``X-Admission-Key`` header) is one of ``admission_trusted_keys``."""
+    if not key:
+        return False
+    trusted = [k.strip() for k in settings.admission_trusted_keys.split(",") if k.strip()]
+    return any(hmac.compare_digest(key.encode(), k.encode()) for k in trusted)
+
+
+def classify_priority(signals: Optional[Dict[str, Any]], max_priority: Optional[str] = None) -> str:
+    """Admission priority from reach/harm signals (``views``, ``growth_rate_24h``, ...).
+
+    Requests without signals get ``admission_default_priority``. A KPI
+    decision of HITL (high projected reach and harm) is ``high``; SEMI_HITL
+    lifts ``low`` to ``medium``. The result is never above ``max_priority``.
+    """
+    priority = _classify(signals)
+    if max_priority is not None and RANK[priority] < RANK[max_priority]:
+        return max_priority
+    return priority
+
+
+def _classify(signals: Optional[Dict[str, Any]]) -> str:
+    global _prioritizer
+    if not signals:
+        return settings.admission_default_priority
+    if _prioritizer is None:
+        _prioritizer = PrioritizationEngine(
+            track_pool_min_views=settings.track_pool_min_views,
+            track_pool_min_growth_rate_24h=settings.track_pool_min_growth_rate_24h,
+            account_pool_min_followers=settings.account_pool_min_followers,
+            account_pool_min_follower_spike_24h=settings.account_pool_min_follower_spike_24h,
+            coordination_min_score=settings.coordination_min_score,
+        )
+    priority = _prioritizer.prioritize(signals).priority
+    kpi = _kpi_decider.decide(
+        views=float(signals.get("views") or 0),
+        growth_rate_24h=float(signals.get("growth_rate_24h") or 0.0),
+        harm_topic=signals.get("harm_topic"),
+        harm_weight_override=signals.get("harm_weight_override"),
+        astro_score=float(signals.get("astro_score") or 0.0),
+    )
+    if kpi.action == "HITL":
+        return "high"
+    if kpi.action == "SEMI_HITL" and priority == "low":
+        return "medium"
+    return priority
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """The process-wide controller configured from ``admission_*`` settings."""
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController(
+            slots={p: getattr(settings, f"admission_slots_{p}") for p in PRIORITIES},
+            max_queue=settings.admission_max_queue,
+            max_wait={p: getattr(settings, f"admission_max_wait_{p}") for p in PRIORITIES},
+            degrade_priority=settings.admission_degrade_priority,
+            degrade_utilization=settings.admission_degrade_utilization,
+        )
+    return _controller
@@ -1,6 +1,7 @@
 import os
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 import json
@@ -12,9 +13,7 @@ from dotenv import load_dotenv
 load_dotenv()  # Force load .env file
 
 import httpx
-import openai
-from bs4 import BeautifulSoup
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # ML Pipeline Integration
 from src.ml.guardian.claim_router import (
@@ -32,14 +31,28 @@ from src.core.personas import COMPANY_PERSONAS
 from src.core.constraints import append_ai_disclosure
 from src.core.config import settings
 from src.core.llm_health import classify_llm_error
+from src.core.startup import LazySubsystem
+from src.core.lazy_imports import feature_enabled, lazy_import, module_available
+from src.core.retrieval_planner import RetrievalPlanner
+from src.core.factcheck_index import get_factcheck_index, index_documents, is_fact_check_hit
+from src.core.fast_path import TIER_CACHE, TIER_LLM, TIER_RULES, RuleVerdict, TierStats, rule_verdicts
+from src.core.result_cache import claim_cache_from_settings
+
+# The OpenAI SDK takes ~0.5 s to import; load it when the client is set up
+openai = lazy_import("openai")
 from src.core.text_detection import (
     detect_political_astroturfing,
     detect_astroturfing_indicators,
     detect_logical_contradictions,
+    analyze_text,
 )
 
 logger = logging.getLogger(__name__)
 
+# Provider results kept in the local fact-check index
+HARVESTED_PROVIDERS = ("google_fact_check", "news_api", "rss_freshness")
+
+
 class Source(BaseModel):
     """Fact-checking source"""
     url: str
@@ -69,6 +82,18 @@ class FactCheckResult(BaseModel):
     category: str  # "misinformation", "satire", "misleading", "true", "analysis_unavailable"
     sources: List[Source] = []
     processing_time_ms: int
+    # Which tier settled the verdict: "rules" | "cache" | "llm" (see src/core/fast_path.py)
+    decision_tier: Optional[str] = None
+    decision_rule: Optional[str] = None
+    # Per-call retrieval trace for the detection details; not part of the serialized result
+    api_usage: Optional[Dict[str, Any]] = Field(default=None, exclude=True)
+    mediawiki_results: List[Dict[str, Any]] = Field(default_factory=list, exclude=True)
+
+class SourceSearch(BaseModel):
+    """Sources found for one claim, with that lookup's provider usage"""
+    sources: List[Source] = []
+    api_usage: Dict[str, Any] = {}
+    mediawiki_results: List[Dict[str, Any]] = []
 
 class AIInfluencerResponse(BaseModel):
     """AI-generated brand influencer response"""
@@ -113,11 +138,14 @@ class TruthShieldAI:
     def __init__(self):
         self.openai_client = None
         self.setup_openai()
-        self.last_api_usage: Dict[str, Dict[str, Any]] = {}
-        self.last_mediawiki_results: List[Dict[str, Any]] = []
 
         # ML Pipeline Components
         self.claim_router = ClaimRouter()
+        self.retrieval_planner = RetrievalPlanner()
+        self.local_index = get_factcheck_index()
+        # Tiered fast path: tier-1 verdicts per (claim, company) and per-tier counters
+        self.verdict_cache = claim_cache_from_settings()
+        self.tier_stats = TierStats()
         self.bandit = get_bandit("demo_data/ml/bandit_state.json")
         self.last_claim_analysis: Optional[ClaimAnalysis] = None
         self.last_tone_variant: Optional[ToneVariant] = None
@@ -583,31 +611,77 @@ The claim is part of a coordinated narrative campaign.
         }.get(language, "en")
 
     async def fact_check_claim(self, text: str, company: str = "GuardianAvatar") -> FactCheckResult:
-        """Main fact-checking pipeline"""
+        """Main fact-checking pipeline: rules → cached verdict → LLM (src/core/fast_path.py)"""
         start_time = datetime.now()
-        
+
+        def elapsed_ms() -> int:
+            return int((datetime.now() - start_time).total_seconds() * 1000)
+
         try:
+            claim_analysis = None
+            cache_key = self.verdict_cache.key(text, company, "", False)
+            if settings.fast_path_enabled:
+                try:
+                    claim_analysis = self.claim_router.analyze_claim(text)
+                except Exception as e:
+                    logger.warning(f"ClaimRouter failed for fast path: {e}")
+
+                # Tier 0: deterministic rules and known narratives
+                rule = self._rule_verdict(text, claim_analysis)
+                if rule is not None:
+                    search = await self._search_sources(text, company)
+                    sources = self._finalize_sources(search.sources)
+                    verdict = self._apply_special_case_overrides(text, sources, rule.to_verdict())
+                    result = FactCheckResult(
+                        **verdict, sources=sources, processing_time_ms=elapsed_ms(),
+                        decision_tier=TIER_RULES, decision_rule=rule.rule,
+                        api_usage=search.api_usage, mediawiki_results=search.mediawiki_results,
+                    )
+                    self.tier_stats.record(TIER_RULES, result.processing_time_ms)
+                    return result
+
+                # Tier 1: verdict already computed for this claim
+                cached = self.verdict_cache.get(cache_key)
+                if cached is not None and (cached[0].confidence or 0.0) >= settings.fast_path_cache_min_confidence:
+                    self.verdict_cache.stats["hits"] += 1
+                    result = cached[0].model_copy(deep=True)
+                    result.processing_time_ms = elapsed_ms()
+                    result.decision_tier = TIER_CACHE
+                    result.api_usage = {}  # no provider was called for this request
+                    result.mediawiki_results = []
+                    self.tier_stats.record(TIER_CACHE, result.processing_time_ms)
+                    return result
+                self.verdict_cache.stats["misses"] += 1
+
+            # Tier 2: LLM analysis
             # Step 1: Analyze claim with AI
             analysis = await self._analyze_with_ai(text, company)
             
             # Step 2: Search for supporting sources
-            sources = await self._search_sources(text, company)
-            sources = self._finalize_sources(sources)
+            search = await self._search_sources(text, company)
+            sources = self._finalize_sources(search.sources)
 
             # Step 3: Determine final verdict
             verdict = self._determine_verdict(analysis, sources)
             verdict = self._apply_special_case_overrides(text, sources, verdict)
 
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
-
-            return FactCheckResult(
+            result = FactCheckResult(
                 is_fake=verdict["is_fake"],
                 confidence=verdict["confidence"],
                 explanation=verdict["explanation"],
                 category=verdict["category"],
                 sources=sources,
-                processing_time_ms=int(processing_time)
+                processing_time_ms=elapsed_ms(),
+                decision_tier=TIER_LLM,
+                api_usage=search.api_usage,
+                mediawiki_results=search.mediawiki_results,
             )
+            self.tier_stats.record(TIER_LLM, result.processing_time_ms)
+            if settings.fast_path_enabled and analysis.get("llm_ran"):
+                self.verdict_cache.put(
+                    cache_key, result.model_copy(deep=True), self.verdict_cache.ttl_for(claim_analysis)
+                )
+            return result
 
         except Exception as e:
             logger.error(f"Fact-checking failed: {e}")
@@ -621,6 +695,20 @@ The claim is part of a coordinated narrative campaign.
                 processing_time_ms=1000
             )
     
+    def _rule_verdict(self, text: str, claim_analysis: Optional[ClaimAnalysis]):
+        """The tier-0 verdict for ``text`` if one passes ``fast_path_min_confidence``, else None."""
+        candidates = rule_verdicts(analyze_text(text), claim_analysis, settings.fast_path_router_min_confidence)
+        neutral = {"is_fake": False, "confidence": None, "explanation": "", "category": "uncertain"}
+        narrative = self._apply_special_case_overrides(text, [], neutral)
+        if narrative["is_fake"]:
+            candidates.insert(0, RuleVerdict(rule="known_narrative", **narrative))
+        for candidate in candidates:
+            if candidate.confidence >= settings.fast_path_min_confidence:
+                return candidate
+        if candidates:
+            self.tier_stats.record_gated()
+        return None
+
     def _detect_political_astroturfing(self, text_lower: str) -> Dict[str, any]:
         """Detect specific political astroturfing patterns"""
         return detect_political_astroturfing(text_lower)
@@ -638,9 +726,10 @@ The claim is part of a coordinated narrative campaign.
         if not self.openai_client:
             return {"assessment": "limited", "reasoning": "No AI available", "llm_ran": False}
         
-        # First check for logical contradictions and astroturfing
-        contradiction_analysis = self._detect_logical_contradictions(text)
-        astroturfing_analysis = self._detect_astroturfing_indicators(text)
+        # First check for logical contradictions and astroturfing (one phrase scan)
+        text_analysis = analyze_text(text)
+        contradiction_analysis = text_analysis["logical_contradictions"]
+        astroturfing_analysis = text_analysis["astroturfing"]
         
         try:
             # Adjust prompt based on company type
@@ -820,16 +909,16 @@ The claim is part of a coordinated narrative campaign.
                 "misinformation_indicators": []
             }
     
-    async def _search_sources(self, query: str, company: str = "GuardianAvatar") -> List[Source]:
+    async def _search_sources(self, query: str, company: str = "GuardianAvatar") -> SourceSearch:
         """Search for sources to verify the claim using real fact-checking APIs and scrapers"""
         try:
-            self.last_mediawiki_results = []
+            mediawiki_results: List[Dict[str, Any]] = []
             # For political astroturfing claims, return minimal sources since they're not fact-checkable
             text_lower = query.lower()
             if any(politician in text_lower for politician in ["ursula", "von der leyen", "merkel", "biden", "trump", "macron"]):
                 if any(term in text_lower for term in ["corrupt", "crooked", "dirty", "shady"]):
                     # This is likely political astroturfing - return minimal sources
-                    return []
+                    return SourceSearch()
             
             # Trim overly long queries for site search endpoints
             truncated_query = (query or "").strip()
@@ -853,121 +942,87 @@ The claim is part of a coordinated narrative campaign.
             google_api_available = bool(settings.google_api_key and settings.google_api_key != "your_google_api_key_here")
             news_api_available = bool(settings.news_api_key and settings.news_api_key != "your_news_api_key_here")
             claimbuster_api_available = bool(settings.claimbuster_api_key and settings.claimbuster_api_key != "your_claimbuster_api_key_here")
-            api_usage = {
-                "google_fact_check": {"available": google_api_available, "called": False, "results": 0, "error": None},
-                "news_api": {"available": news_api_available, "called": False, "results": 0, "error": None},
-                "claimbuster": {"available": claimbuster_api_available, "called": False, "results": 0, "error": None},
-                "mediawiki": {"available": True, "called": False, "results": 0, "error": None},
-                "fallback_sources_added": 0
+            available = {
+                "google_fact_check": google_api_available,
+                "news_api": news_api_available,
+                "claimbuster": claimbuster_api_available,
+                "core": bool(settings.core_api_key),
+                "rss_freshness": feature_enabled("rss") and module_available("feedparser"),
             }
             logger.info(f"API Status - Google Fact Check: {'✅' if google_api_available else '❌'}, NewsAPI: {'✅' if news_api_available else '❌'}, ClaimBuster: {'✅' if claimbuster_api_available else '❌'}")
-            
-            # Start with real Google Fact Check API results
-            sources = []
-            
-            # 🔍 REAL GOOGLE FACT CHECK API INTEGRATION
-            if google_api_available:
-                try:
-                    from src.services.google_factcheck import search_google_factchecks
-                    google_results = await search_google_factchecks(truncated_query, detected_lang)
-                    api_usage["google_fact_check"]["called"] = True
-                    
-                    # Convert Google results to Source objects
-                    for result in google_results[:5]:  # Max 5 Google results
-                        source = Source(
-                            url=result['url'],
-                            title=result['title'],
-                            snippet=result['snippet'],
-                            credibility_score=result['credibility_score'],
-                            date_published=result.get('date_published', '')
-                        )
-                        sources.append(source)
-                        logger.info(f"✅ Google Fact Check: {result['publisher']} - {result['rating']}")
-                    api_usage["google_fact_check"]["results"] = len(google_results)
-                        
-                except Exception as e:
-                    logger.error(f"❌ Google Fact Check API error: {e}")
-                    api_usage["google_fact_check"]["error"] = str(e)
-            
-            # 📰 REAL NEWS API INTEGRATION
-            if news_api_available:
-                try:
-                    from src.services.news_api import search_news_context
-                    news_results = await search_news_context(truncated_query, detected_lang)
-                    api_usage["news_api"]["called"] = True
-                    
-                    # Convert News API results to Source objects
-                    for result in news_results[:3]:  # Max 3 News results for context
-                        source = Source(
-                            url=result['url'],
-                            title=result['title'],
-                            snippet=result['snippet'],
-                            credibility_score=result['credibility_score'],
-                            date_published=result.get('published_at', '')
-                        )
-                        sources.append(source)
-                        logger.info(f"✅ News Context: {result['source_name']} - {result['title'][:50]}...")
-                    api_usage["news_api"]["results"] = len(news_results)
-                        
-                except Exception as e:
-                    logger.error(f"❌ News API error: {e}")
-                    api_usage["news_api"]["error"] = str(e)
-            
-            # 📘 MEDIAWIKI (Wikipedia + Wikidata) CONTEXT
+
+            # Plan a minimal provider set from the claim analysis and run it concurrently
             try:
-                from src.services.wiki_api import search_mediawiki_sources
-                wiki_results = await search_mediawiki_sources(truncated_query, detected_lang)
-                if wiki_results:
-                    api_usage["mediawiki"]["called"] = True
-                    api_usage["mediawiki"]["results"] = len(wiki_results)
-                    self.last_mediawiki_results = wiki_results
-                    for result in wiki_results:
-                        source = Source(
-                            url=result["url"],
-                            title=result["title"],
-                            snippet=result.get("snippet", ""),
-                            # MediaWiki authority is taxonomy-fixed; finalize re-derives it.
-                            credibility_score=result.get("authority_score", 0.40),
-                            date_published=""
-                        )
-                        sources.append(source)
-                        logger.info(f"📚 MediaWiki: {result['project']} - {result['title']}")
-                else:
-                    self.last_mediawiki_results = []
+                claim_analysis = self.claim_router.analyze_claim(query)
             except Exception as e:
-                logger.error(f"❌ MediaWiki fetch error: {e}")
-                api_usage["mediawiki"]["error"] = str(e)
-                self.last_mediawiki_results = []
-            
-            # 🎯 REAL CLAIMBUSTER API INTEGRATION (Claim Scoring)
-            if claimbuster_api_available:
+                logger.warning(f"⚠️ Claim analysis failed, planning generic retrieval: {e}")
+                claim_analysis = None
+
+            # Previously harvested fact-checks answer most repeat narratives without a live call
+            local_hits, strong_local = [], 0
+            if self.local_index is not None:
+                local_start = time.perf_counter()
                 try:
-                    from src.services.claimbuster_api import score_claim_worthiness
-                    claimbuster_score = await score_claim_worthiness(truncated_query)
-                    api_usage["claimbuster"]["called"] = True
-                    
-                    # Add ClaimBuster analysis as a source if claim-worthy
-                    if claimbuster_score and claimbuster_score.get('claim_worthy', False):
-                        score = claimbuster_score['max_score']
-                        confidence = claimbuster_score['confidence']
-                        
-                        source = Source(
+                    local_hits = [
+                        # Off the event loop: a search may wait behind another thread's segment merge
+                        hit for hit in await asyncio.to_thread(self.local_index.search, truncated_query, 5)
+                        if hit["coverage"] >= settings.local_index_min_coverage
+                    ]
+                except Exception as e:
+                    # The index only saves live calls; never let it cost the live results
+                    logger.warning(f"⚠️ Local index search failed, using live providers only: {e}")
+                # Only published fact-checks answer the claim; news/RSS coverage does not
+                strong_local = sum(is_fact_check_hit(hit) for hit in local_hits)
+                local_ms = int((time.perf_counter() - local_start) * 1000)
+                logger.info(f"📇 Local index: {len(local_hits)} hits ({strong_local} strong) in {local_ms} ms")
+            plan = self.retrieval_planner.plan(
+                claim_analysis, available, local_sufficient=strong_local >= settings.local_index_min_hits
+            )
+            logger.info(f"🧭 Retrieval plan: {', '.join(plan.providers)} (skipped: {', '.join(plan.skipped) or '-'})")
+            outcomes = await self.retrieval_planner.execute(plan, truncated_query, detected_lang, claim_analysis)
+
+            api_usage = {
+                name: {
+                    "available": available.get(name, True),
+                    "called": name in outcomes,
+                    "results": 0,
+                    "error": outcomes[name].error if name in outcomes else None,
+                    **({"elapsed_ms": outcomes[name].elapsed_ms} if name in outcomes else {}),
+                }
+                for name in (*plan.providers, *plan.skipped)
+            }
+            api_usage["plan"] = plan.to_dict()
+            api_usage["local_index"] = {"hits": len(local_hits), "strong": strong_local}
+            api_usage["fallback_sources_added"] = 0
+
+            sources = [self._result_to_source(hit) for hit in local_hits]
+            for name in plan.providers:
+                results = outcomes[name].results
+                if not results:
+                    continue
+                if name == "claimbuster":
+                    # ClaimBuster returns a claim-worthiness score, added as a source if claim-worthy
+                    if results.get('claim_worthy', False):
+                        score = results['max_score']
+                        confidence = results['confidence']
+                        sources.append(Source(
                             url='https://claimbuster.org',
                             title=f"ClaimBuster Analysis: Claim-worthy statement detected",
-                            snippet=f"ClaimBuster scored this as claim-worthy (score: {score:.3f}, confidence: {confidence:.3f}). {claimbuster_score['claim_sentences']}/{claimbuster_score['total_sentences']} sentences contain factual claims requiring verification.",
+                            snippet=f"ClaimBuster scored this as claim-worthy (score: {score:.3f}, confidence: {confidence:.3f}). {results['claim_sentences']}/{results['total_sentences']} sentences contain factual claims requiring verification.",
                             credibility_score=0.85,  # ClaimBuster is high credibility
                             date_published=''
-                        )
-                        sources.append(source)
+                        ))
                         logger.info(f"✅ ClaimBuster: Claim-worthy detected (score: {score:.3f})")
-                        api_usage["claimbuster"]["results"] = 1
-                    else:
-                        api_usage["claimbuster"]["results"] = 0
-                        
-                except Exception as e:
-                    logger.error(f"❌ ClaimBuster API error: {e}")
-                    api_usage["claimbuster"]["error"] = str(e)
-            
+                        api_usage[name]["results"] = 1
+                    continue
+                if name == "mediawiki":
+                    mediawiki_results = results
+                sources.extend(self._result_to_source(result) for result in results)
+                api_usage[name]["results"] = len(results)
+                logger.info(f"✅ {name}: {len(results)} results in {outcomes[name].elapsed_ms} ms")
+                if self.local_index is not None and name in HARVESTED_PROVIDERS:
+                    await asyncio.to_thread(index_documents, results, name, self.local_index)
+
             # Add bot-specific sources with primary/secondary prioritization
             try:
                 prioritized_sources = self._get_prioritized_sources(query, company)
@@ -1030,7 +1085,6 @@ The claim is part of a coordinated narrative campaign.
             # Re-rank sources using SourceRanker for context-aware ordering
             try:
                 from src.core.source_adapter import rank_and_convert
-                claim_analysis = self.claim_router.analyze_claim(query)
                 ranking_keywords = claim_analysis.keywords if hasattr(claim_analysis, 'keywords') else []
                 claim_type = claim_analysis.claim_types[0].value if claim_analysis.claim_types else None
                 sources = rank_and_convert(sources, ranking_keywords, claim_type=claim_type)
@@ -1039,14 +1093,23 @@ The claim is part of a coordinated narrative campaign.
                 logger.warning(f"⚠️ SourceRanker failed, using original order: {e}")
 
             logger.info(f"Final source count: {len(sources)}")
-            self.last_api_usage = api_usage
-            return sources
+            return SourceSearch(sources=sources, api_usage=api_usage, mediawiki_results=mediawiki_results)
             
         except Exception as e:
             logger.error(f"Source search failed: {e}")
-            self.last_api_usage = {"error": str(e)}
-            return []
+            return SourceSearch(api_usage={"error": str(e)})
     
+    @staticmethod
+    def _result_to_source(result: Dict[str, Any]) -> Source:
+        return Source(
+            url=result["url"],
+            title=result["title"],
+            snippet=result.get("snippet", ""),
+            # MediaWiki authority is taxonomy-fixed; finalize re-derives it.
+            credibility_score=result.get("credibility_score", result.get("authority_score", 0.40)),
+            date_published=result.get("date_published") or result.get("published_at") or result.get("pub_date") or ""
+        )
+
     def _get_prioritized_sources(self, query: str, company: str = "GuardianAvatar") -> List[Source]:
         """
         Get sources with bot-specific prioritization.
@@ -2010,5 +2073,5 @@ The claim is part of a coordinated narrative campaign.
             "explanation_de": explanation_de
         }
 
-# Global AI engine instance
-ai_engine = TruthShieldAI()
+# Global AI engine instance (constructed on first use, see src/core/startup.py)
+ai_engine = LazySubsystem("ai_engine", TruthShieldAI)
@@ -0,0 +1,223 @@
+"""
+Batch fact-checking for bulk screening and nightly backfills.
+
+:class:`BatchFactChecker` takes a list of claims and:
+
+1. validates each claim (same length rules as ``/fact-check``);
+2. collapses identical and near-identical claims (MinHash LSH via
+   :class:`~src.core.signatures.NearDuplicateIndex`) onto one pipeline run;
+3. runs ClaimRouter over the whole batch, orders claims by risk so critical
+   ones finish first, and groups claims whose keywords overlap
+   (``batch_keyword_overlap`` Jaccard) so each provider is queried once per
+   group (:class:`~src.core.retrieval_planner.SharedRetrieval`);
+4. runs at most ``batch_concurrency`` pipelines at a time and yields one
+   record per input claim as soon as its result is ready, followed by a
+   summary record.
+
+With an :class:`~src.core.admission.AdmissionController`, every pipeline
+also holds its own admission slot, so a batch never runs more pipelines
+than its priority's pools allow. A batch is background work: a claim whose
+slot request is shed waits ``retry_after`` and asks again instead of failing.
+"""
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set
+import asyncio
+import logging
+import time
+
+from src.core.admission import AdmissionController, AdmissionRejected, AdmissionTicket
+from src.core.config import settings
+from src.core.retrieval_planner import SharedRetrieval, shared_retrieval
+from src.core.signatures import NearDuplicateIndex
+from src.ml.guardian.claim_router import ClaimAnalysis, RiskLevel
+
+logger = logging.getLogger(__name__)
+
+RISK_ORDER = {RiskLevel.CRITICAL: 0, RiskLevel.HIGH: 1, RiskLevel.MEDIUM: 2, RiskLevel.LOW: 3}
+
+
+def claim_error(text: Any) -> Optional[str]:
+    """Validation error for one batch claim, or None when it is acceptable."""
+    if not isinstance(text, str) or len(text.strip()) < 10:
+        return "Text must be at least 10 characters"
+    if len(text) > 1000:
+        return "Text must be less than 1000 characters"
+    return None
+
+
+@dataclass
+class BatchPlan:
+    """How a batch is executed: representatives, duplicates and keyword groups."""
+    texts: List[str]
+    errors: Dict[int, str] = field(default_factory=dict)
+    canonical: Dict[int, int] = field(default_factory=dict)  # index -> representative index
+    duplicates: Dict[int, List[int]] = field(default_factory=dict)  # representative -> duplicate indices
+    analyses: Dict[int, Optional[ClaimAnalysis]] = field(default_factory=dict)
+    groups: Dict[int, int] = field(default_factory=dict)  # representative -> lead representative
+    order: List[int] = field(default_factory=list)  # representatives, highest risk first
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "claims": len(self.texts),
+            "invalid": len(self.errors),
+            "unique": len(self.order),
+            "duplicates": sum(len(d) for d in self.duplicates.values()),
+            "keyword_groups": len(set(self.groups.values())),
+        }
+
+
+def _keywords(analysis: Optional[ClaimAnalysis]) -> Set[str]:
+    return {k.lower() for k in (analysis.keywords if analysis else [])}
+
+
+def plan_batch(
+    texts: Sequence[str],
+    claim_router: Any,
+    near_duplicate_threshold: float = 0.85,
+    keyword_overlap: float = 0.5,
+) -> BatchPlan:
+    plan = BatchPlan(texts=[t.strip() if isinstance(t, str) else "" for t in texts])
+    near_dups = NearDuplicateIndex(threshold=near_duplicate_threshold)
+    first_by_signature: Dict[str, int] = {}
+    for i, text in enumerate(texts):
+        error = claim_error(text)
+        if error:
+            plan.errors[i] = error
+            continue
+        signature = near_dups.canonical(plan.texts[i]) or f"#{i}"
+        rep = first_by_signature.setdefault(signature, i)
+        plan.canonical[i] = rep
+        if rep != i:
+            plan.duplicates.setdefault(rep, []).append(i)
+
+    representatives = [i for i, rep in plan.canonical.items() if rep == i]
+    for i in representatives:
+        try:
+            plan.analyses[i] = claim_router.analyze_claim(plan.texts[i])
+        except Exception as e:
+            logger.warning(f"ClaimRouter failed for batch claim {i}: {e}")
+            plan.analyses[i] = None
+
+    # Greedy leader clustering on keyword sets, via an inverted keyword index
+    leaders: Dict[int, Set[str]] = {}
+    by_keyword: Dict[str, List[int]] = {}
+    for i in representatives:
+        keywords = _keywords(plan.analyses[i])
+        lead = None
+        if len(keywords) >= 2:
+            candidates = {c for k in keywords for c in by_keyword.get(k, ())}
+            for c in sorted(candidates):
+                union = keywords | leaders[c]
+                if len(keywords & leaders[c]) / len(union) >= keyword_overlap:
+                    lead = c
+                    break
+        if lead is None:
+            lead = i
+            leaders[i] = keywords
+            for k in keywords:
+                by_keyword.setdefault(k, []).append(i)
+        plan.groups[i] = lead
+
+    plan.order = sorted(
+        representatives,
+        key=lambda i: (RISK_ORDER.get(plan.analyses[i].risk_level, 2) if plan.analyses[i] else 2, i),
+    )
+    return plan
+
+
+async def _admit(admission: AdmissionController, priority: str) -> AdmissionTicket:
+    """A slot for one batch claim, waiting out rejections."""
+    while True:
+        try:
+            return await admission.acquire(priority)
+        except AdmissionRejected as e:
+            await asyncio.sleep(e.retry_after)
+
+
+class BatchFactChecker:
+    """Runs many claims through ``TruthShieldDetector`` with shared work."""
+
+    def __init__(self, detector: Any, concurrency: Optional[int] = None) -> None:
+        self.detector = detector
+        self.concurrency = max(1, int(concurrency or settings.batch_concurrency))
+
+    async def run(
+        self,
+        texts: Sequence[str],
+        company: str = "GuardianAvatar",
+        language: str = "de",
+        generate_ai_response: bool = False,
+        admission: Optional[AdmissionController] = None,
+        priority: str = "low",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield one record per claim as results finish, then ``{"summary": ...}``.
+
+        With ``admission`` each claim's pipeline runs under a slot for ``priority``.
+        """
+        from src.core.detection import CompanyFactCheckRequest
+
+        start = time.perf_counter()
+        plan = plan_batch(
+            texts,
+            self.detector.ai_engine.claim_router,
+            near_duplicate_threshold=settings.batch_near_duplicate_threshold,
+            keyword_overlap=settings.batch_keyword_overlap,
+        )
+        for i, error in sorted(plan.errors.items()):
+            yield {"index": i, "status": "error", "error": error}
+
+        shared = SharedRetrieval()
+        for i, lead in plan.groups.items():
+            shared.assign(plan.texts[i], plan.texts[lead])
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def check(i: int):
+            async with semaphore:
+                ticket = await _admit(admission, priority) if admission is not None else None
+                try:
+                    request = CompanyFactCheckRequest(
+                        text=plan.texts[i], company=company, language=language,
+                        generate_ai_response=generate_ai_response and not (ticket and ticket.degraded),
+                    )
+                    return i, await self.detector.fact_check_company_claim(request), None
+                except Exception as e:
+                    logger.error(f"Batch claim {i} failed: {e}")
+                    return i, None, str(e) or type(e).__name__
+                finally:
+                    if ticket is not None:
+                        admission.release(ticket)
+
+        # Tasks copy the current context, so their provider lookups go through ``shared``
+        with shared_retrieval(shared):
+            tasks = [asyncio.create_task(check(i)) for i in plan.order]
+        failed = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                i, result, error = await next_done
+                failed += error is not None
+                payload = result.model_dump(mode="json") if result is not None else None
+                for index in [i, *plan.duplicates.get(i, [])]:
+                    record: Dict[str, Any] = {
+                        "index": index,
+                        "status": "error" if error else "ok",
+                        "duplicate_of": i if index != i else None,
+                        "group": plan.groups[i],
+                    }
+                    if error:
+                        record["error"] = error
+                    else:
+                        record["result"] = payload
+                    yield record
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        yield {
+            "summary": {
+                **plan.summary(),
+                "failed": failed,
+                "provider_lookups": shared.stats["lookups"],
+                "provider_lookups_shared": shared.stats["shared"],
+                "elapsed_ms": int((time.perf_counter() - start) * 1000),
+            }
+        }
@@ -73,6 +73,117 @@ class Settings(BaseSettings):
     qa_low_score_threshold: float = 5.0
     qa_high_spread_projected_reach: int = 20000
 
+    # Same-text burst clustering across monitoring scans
+    temporal_cluster_sweep_interval: float = 60.0  # seconds between closing idle clusters
+
+    # Feature flags for optional heavy dependencies (disabled = never imported)
+    feature_ocr: bool = True  # easyocr / torch
+    feature_twitter: bool = True  # tweepy
+    feature_rss: bool = True  # feedparser
+    feature_web_scraping: bool = True  # beautifulsoup4
+
+    # Startup: construct heavy subsystems in the background right after boot
+    # (otherwise they are built on first request)
+    startup_warm_subsystems: bool = True
+
+    # Source provider resilience (circuit breakers, adaptive timeouts, hedging)
+    provider_window: int = 100  # calls kept per provider for latency/error stats
+    provider_timeout_min: float = 1.0  # seconds
+    provider_timeout_max: float = 30.0  # hard cap and timeout until enough samples
+    provider_timeout_margin: float = 0.5  # added to 1.5 × p99 latency
+    provider_breaker_failures: int = 5  # consecutive failures that open the circuit
+    provider_breaker_error_rate: float = 0.5  # or this error rate over the window
+    provider_breaker_cooldown: float = 30.0  # seconds before a half-open probe
+    provider_hedging: bool = False  # hedge idempotent GETs after p95 latency
+
+    # Provider quotas (token bucket per provider; unset = unlimited)
+    quota_news_api_per_minute: float = 5.0
+    quota_news_api_burst: int = 5
+    quota_google_fact_check_per_minute: float = 60.0
+    quota_google_fact_check_burst: int = 10
+    quota_google_custom_search_per_minute: float = 10.0
+    quota_google_custom_search_burst: int = 5
+    quota_claimbuster_per_minute: float = 30.0
+    quota_claimbuster_burst: int = 5
+    quota_semantic_scholar_per_minute: float = 20.0
+    quota_semantic_scholar_burst: int = 5
+    quota_max_wait: float = 2.0  # seconds a call may queue for a token before it is shed
+    quota_max_queue: int = 32  # calls waiting per provider before new ones are shed
+
+    # Source retrieval planner: time budget per provider class (seconds)
+    retrieval_budget_fact_check: float = 6.0
+    retrieval_budget_news: float = 5.0
+    retrieval_budget_reference: float = 6.0
+    retrieval_budget_claim_scoring: float = 4.0
+    retrieval_budget_academic: float = 8.0
+    retrieval_budget_health: float = 6.0
+    retrieval_budget_freshness: float = 8.0
+
+    # Local BM25 index of harvested fact-checks (queried before live providers)
+    local_index_enabled: bool = True
+    local_index_dir: str = "demo_data/factcheck_index"
+    local_index_flush_docs: int = 200  # buffered docs per new on-disk segment
+    local_index_max_segments: int = 8  # merge segments beyond this
+    local_index_refresh_interval: float = 5.0  # seconds between reads of other processes' shards
+    local_index_min_hits: int = 3  # local fact-check hits needed to skip live providers
+    local_index_min_coverage: float = 0.6  # share of query terms a strong hit contains
+
+    # Batch fact-checking (/api/v1/detect/batch)
+    batch_max_claims: int = 2000
+    batch_concurrency: int = 8  # pipelines running at once per batch
+    batch_near_duplicate_threshold: float = 0.85  # MinHash Jaccard for "same claim"
+    batch_keyword_overlap: float = 0.5  # keyword Jaccard for sharing provider lookups
+
+    # Admission control for the fact-check endpoints (src/core/admission.py)
+    admission_enabled: bool = True
+    admission_slots_high: int = 8  # concurrent pipelines reserved per priority
+    admission_slots_medium: int = 6
+    admission_slots_low: int = 4
+    admission_max_queue: int = 64
+    admission_max_wait_high: float = 15.0  # seconds a request may wait for a slot
+    admission_max_wait_medium: float = 8.0
+    admission_max_wait_low: float = 3.0
+    admission_default_priority: str = "medium"  # requests without reach signals
+    admission_untrusted_max_priority: str = "medium"  # cap for reach signals sent without a trusted key
+    admission_trusted_keys: str = ""  # comma-separated X-Admission-Key values whose reach signals are trusted
+    admission_batch_priority: str = "low"  # priority of each /batch claim pipeline
+    admission_degrade_priority: str = "low"  # at or below: skip LLM generation under load
+    admission_degrade_utilization: float = 0.75
+
+    # Job queue for long-running work (python -m src.core.job_worker)
+    jobs_db_path: str = "demo_data/jobs.db"
+    jobs_visibility_timeout: float = 300.0  # seconds before a stalled job is re-claimed
+    jobs_max_attempts: int = 3
+    jobs_retry_backoff: float = 10.0  # seconds, doubled per failed attempt
+    jobs_worker_processes: int = 2
+    jobs_worker_concurrency: int = 4  # jobs in flight per worker process
+    jobs_poll_interval: float = 1.0
+    jobs_webhook_allowed_hosts: str = ""  # comma-separated; when set, the only webhook hosts allowed
+    jobs_embedded_worker: bool = True  # run one worker inside the API; disable when job_worker runs separately
+
+    # Tiered fast path before the LLM (src/core/fast_path.py)
+    fast_path_enabled: bool = True
+    fast_path_min_confidence: float = 0.9  # tier 0: rule verdicts at or above settle the claim
+    fast_path_router_min_confidence: float = 0.8  # ClaimRouter match needed to trust smear rules
+    fast_path_cache_min_confidence: float = 0.7  # tier 1: cached verdicts at or above are reused
+
+    # Claim-level fact-check result cache (TTL by claim volatility, seconds)
+    claim_cache_enabled: bool = True
+    claim_cache_max_entries: int = 5000
+    claim_cache_ttl_live: int = 60  # LIVE_REQUIRED / very high volatility
+    claim_cache_ttl_high: int = 600
+    claim_cache_ttl_medium: int = 3600
+    claim_cache_ttl_low: int = 6 * 3600
+    claim_cache_ttl_stable: int = 24 * 3600
+    claim_cache_invalidation_db: str = "demo_data/cache_invalidations.db"  # shared by API and job workers
+    claim_cache_invalidation_poll: float = 1.0  # max seconds before other processes apply an invalidation
+
+    # OCR worker pool (0 workers = one per CPU core)
+    ocr_workers: int = 0
+    ocr_max_queue: int = 16  # jobs waiting beyond the busy workers before 429
+    ocr_max_side: int = 1600  # downscale longest image side (px) before OCR
+    ocr_cache_size: int = 256  # cached results, keyed by image hash
+
     # Edge automation (auto-post)
     auto_post_enabled: bool = False
 
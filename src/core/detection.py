@@ -6,6 +6,8 @@ import uuid
 
 from .ai_engine import ai_engine, FactCheckResult as AIFactCheckResult, AIInfluencerResponse
 from .coordinated_behavior import CoordinatedBehaviorDetector
+from .config import settings
+from .result_cache import claim_cache_from_settings
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,7 @@ class TruthShieldDetector:
     def __init__(self):
         self.ai_engine = ai_engine
         self.astro_detector = CoordinatedBehaviorDetector()
+        self.result_cache = claim_cache_from_settings()
         logger.info("🛡️ TruthShield Detector initialized with AI engine")
     
     async def detect_text(self, text: str) -> DetectionResult:
@@ -97,7 +100,51 @@ class TruthShieldDetector:
             raise
     
     async def fact_check_company_claim(self, request: CompanyFactCheckRequest) -> DetectionResult:
-        """NEW: Complete fact-checking with AI response generation"""
+        """Complete fact-checking with AI response generation.
+
+        Results are cached per (normalized claim, company, language,
+        generate_ai_response) with a TTL from the claim's volatility, and
+        concurrent identical requests share one pipeline run. Every caller
+        gets its own copy with a fresh ``request_id``.
+        """
+        if not settings.claim_cache_enabled:
+            return await self._run_fact_check(request)
+
+        start_time = datetime.now()
+        key = self.result_cache.key(request.text, request.company, request.language, request.generate_ai_response)
+
+        async def compute():
+            result = await self._run_fact_check(request)
+            return result, self._cache_ttl(request.text, result)
+
+        result, cache_info = await self.result_cache.get_or_compute(key, compute)
+        result = result.model_copy(deep=True)
+        if cache_info["hit"]:
+            result.request_id = str(uuid.uuid4())
+            result.processing_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        result.details["cache"] = cache_info
+        return result
+
+    def _cache_ttl(self, text: str, result: DetectionResult) -> float:
+        """TTL for a finished result; 0 (not cached) for fallbacks and degraded runs."""
+        details = result.details or {}
+        if details.get("fallback_mode") or details.get("degraded"):
+            return 0
+        if result.fact_check is None or result.fact_check.category == "analysis_unavailable":
+            return 0
+        try:
+            analysis = self.ai_engine.claim_router.analyze_claim(text)
+        except Exception:
+            analysis = None
+        return self.result_cache.ttl_for(analysis)
+
+    def invalidate_cache(self, text: Optional[str] = None, company: Optional[str] = None) -> int:
+        """Drop cached results (and tier-1 verdicts) for a claim and/or company; returns the number removed."""
+        removed = self.result_cache.invalidate(text=text, company=company)
+        return removed + self.ai_engine.verdict_cache.invalidate(text=text, company=company)
+
+    async def _run_fact_check(self, request: CompanyFactCheckRequest) -> DetectionResult:
+        """Run the full fact-check pipeline (uncached)."""
         start_time = datetime.now()
         request_id = str(uuid.uuid4())
         
@@ -195,13 +242,13 @@ class TruthShieldDetector:
                     "background_institutions": [
                         s.model_dump() for s in (fact_check_result.sources or []) if not s.is_claim_specific
                     ],
-                    "mediawiki_sources": getattr(self.ai_engine, "last_mediawiki_results", []),
+                    "mediawiki_sources": fact_check_result.mediawiki_results,
                     # Task 12: the flag is true ONLY when a real LLM generation happened.
                     "ai_response_generated": ai_response is not None and not getattr(ai_response, "degraded", False),
                     "degraded": bool(getattr(ai_response, "degraded", False)) if ai_response else False,
                     "degradation_reason": getattr(ai_response, "degradation_reason", None) if ai_response else None,
                     "ai_responses": ai_responses if ai_responses else None,  # Include both language responses
-                    "api_usage": getattr(self.ai_engine, "last_api_usage", None),
+                    "api_usage": fact_check_result.api_usage,
                     "astroturfing_analysis": {
                         "astro_score": astro.score_0_10,
                         "category_scores": astro.category_scores,
@@ -310,6 +357,9 @@ class TruthShieldDetector:
             },
             "supported_companies": list(self.ai_engine.company_personas.keys()),
             "supported_languages": ["de", "en"],
+            "result_cache": self.result_cache.summary(),
+            "decision_tiers": self.ai_engine.tier_stats.snapshot(),
+            "verdict_cache": self.ai_engine.verdict_cache.summary(),
             "version": "1.1.0-guardian",
             "uptime": "active"
         }
\ No newline at end of file
@@ -0,0 +1,525 @@
+"""
+Local full-text index of harvested fact-checks.
+
+Most viral claims are repeat narratives that have already been checked, so
+every fact-check result, scraped fact-checker article and RSS item we see is
+added to :class:`FactCheckIndex` and the index is queried before any live
+provider (see ``TruthShieldAI._search_sources``).
+
+Every API worker and job worker opens the same index, so each process
+writes only to its own shard, ``shard_<n>/`` under ``settings.local_index_dir``,
+held through an exclusive ``flock`` on ``shard_<n>/writer.lock`` (a restarted
+process takes over a free shard). Other processes' shards are read-only and
+re-read every ``local_index_refresh_interval`` seconds. Per shard:
+
+- ``docs.jsonl`` — append-only document store; the line number is the doc id.
+  Writes go here first, so nothing is lost when the process dies between
+  flushes. A partial last line left by a crash is cut off on open; an
+  unreadable complete line keeps its id as an empty placeholder.
+- ``seg_<n>.post`` / ``seg_<n>.lex.json`` — immutable inverted-index segments
+  covering doc ids ``[doc_lo, doc_hi)``. Postings are packed ``(doc_id, tf)``
+  records read through ``numpy.memmap``; the lexicon maps each term to its
+  slice. New documents sit in an in-memory buffer until
+  ``local_index_flush_docs`` accumulate, then become a segment; more than
+  ``local_index_max_segments`` segments are merged into one.
+
+Ranking is Okapi BM25 (k1=1.2, b=0.75). Each hit also reports ``coverage``,
+the share of query terms it contains, and the ``provider`` it was harvested
+from. Callers judge whether the local hits are strong enough to skip live
+providers with :func:`is_fact_check_hit`: only published fact-checks count,
+never news or RSS coverage, and never the stored ``credibility_score``
+(for fact-checks that is derived from the claim's rating, not from the
+publisher).
+
+Writes, flushes and merges can take a second or more on a large index, so
+async callers run :meth:`FactCheckIndex.search` and :func:`index_documents`
+through ``asyncio.to_thread``; the index serializes them with its own lock.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from bisect import bisect_right
+from collections import Counter
+import itertools
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: single writer process assumed
+    fcntl = None
+
+import numpy as np
+
+from src.core.config import settings
+from src.core.result_cache import normalize_claim
+
+logger = logging.getLogger(__name__)
+
+POSTING = np.dtype([("doc", "<u4"), ("tf", "<u2")])
+
+STOPWORDS = frozenset(
+    "a an and are as at be been but by for from has have he her his i in is it its of on or "
+    "our she that the their them they this to was we were will with you "
+    "der die das und ist nicht mit ein eine einen dem den des ich sie er es wir auf für von zu im".split()
+)
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(normalize_claim(text)) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _url_key(url: str) -> str:
+    return (url or "").rstrip("/").lower()
+
+
+class _Segment:
+    """One immutable, memory-mapped postings file plus its lexicon."""
+
+    def __init__(self, post_path: Path, lex_path: Path) -> None:
+        self.post_path = post_path
+        self.lex_path = lex_path
+        self.seq = int(lex_path.name[4:10])
+        lex = json.loads(lex_path.read_text(encoding="utf-8"))
+        self.doc_hi: int = lex["doc_hi"]
+        self.terms: Dict[str, Tuple[int, int]] = {t: tuple(v) for t, v in lex["terms"].items()}
+        # numpy cannot map an empty file (a segment whose docs were all stopwords)
+        if post_path.stat().st_size:
+            self.postings = np.memmap(post_path, dtype=POSTING, mode="r")
+        else:
+            self.postings = np.zeros(0, dtype=POSTING)
+        if "doc_lo" in lex:
+            self.doc_lo: int = lex["doc_lo"]
+        else:  # segments written before doc_lo was recorded
+            self.doc_lo = int(self.postings["doc"].min()) if len(self.postings) else self.doc_hi
+
+    def get(self, term: str) -> Optional[np.ndarray]:
+        entry = self.terms.get(term)
+        if entry is None:
+            return None
+        offset, count = entry
+        return self.postings[offset:offset + count]
+
+    def covers(self, other: "_Segment") -> bool:
+        return self.doc_lo <= other.doc_lo and other.doc_hi <= self.doc_hi
+
+    @staticmethod
+    def write(
+        directory: Path,
+        seq: int,
+        postings: Dict[str, List[Tuple[int, int]]],
+        doc_lo: int,
+        doc_hi: int,
+    ) -> "_Segment":
+        post_path = directory / f"seg_{seq:06d}.post"
+        lex_path = directory / f"seg_{seq:06d}.lex.json"
+        terms: Dict[str, List[int]] = {}
+        chunks = []
+        offset = 0
+        for term in sorted(postings):
+            plist = sorted(postings[term])
+            chunks.append(np.array(plist, dtype=POSTING))
+            terms[term] = [offset, len(plist)]
+            offset += len(plist)
+        data = np.concatenate(chunks) if chunks else np.zeros(0, dtype=POSTING)
+        tmp = post_path.with_suffix(".tmp")
+        data.tofile(tmp)
+        os.replace(tmp, post_path)
+        # The lexicon is written last: a segment only exists once its lexicon does
+        tmp = lex_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"doc_lo": doc_lo, "doc_hi": doc_hi, "terms": terms}), encoding="utf-8")
+        os.replace(tmp, lex_path)
+        return _Segment(post_path, lex_path)
+
+
+class _Shard:
+    """Documents and segments of one writer process; read-only unless this process owns it."""
+
+    def __init__(self, directory: Path, writable: bool, flush_docs: int = 200, max_segments: int = 8) -> None:
+        self.directory = directory
+        self.writable = writable
+        self.flush_docs = flush_docs
+        self.max_segments = max_segments
+        self._docs: List[Dict[str, Any]] = []
+        self._lengths: List[int] = []
+        self._urls: Dict[str, int] = {}
+        self._segments: List[_Segment] = []
+        self._lex_names: List[str] = []
+        self._buffer: Dict[str, List[Tuple[int, int]]] = {}
+        self._buffered_docs = 0
+        self._offset = 0  # bytes of docs.jsonl already read
+        self.refresh()
+
+    @property
+    def _docs_path(self) -> Path:
+        return self.directory / "docs.jsonl"
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # -- loading -------------------------------------------------------------
+
+    def refresh(self) -> bool:
+        """Read documents and segments written since the last call; True when anything changed."""
+        changed = self._read_docs()
+        lex_names = sorted(p.name for p in self.directory.glob("seg_*.lex.json"))
+        if lex_names != self._lex_names:
+            self._load_segments(lex_names)
+            changed = True
+        if changed:
+            self._rebuffer()
+        return changed
+
+    def _read_docs(self) -> bool:
+        if not self._docs_path.exists():
+            return False
+        with self._docs_path.open("rb") as fh:
+            fh.seek(self._offset)
+            data = fh.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data) and self.writable:
+            # This shard's previous writer died mid-append: cut the partial line off
+            # so the next append starts on a line (and doc id) of its own.
+            logger.warning("Dropping truncated last line in local index document store")
+            with self._docs_path.open("r+b") as fh:
+                fh.truncate(self._offset + end)
+        # A read-only shard may just be mid-append; its partial line is read next time
+        for line in data[:end].splitlines():
+            try:
+                doc = json.loads(line)
+            except json.JSONDecodeError:
+                # Keep the doc id so later ids (and segment postings) stay aligned
+                logger.warning("Unreadable line in local index document store; keeping a placeholder")
+                doc = {"url": "", "title": "", "snippet": "", "len": 0}
+            self._remember(doc)
+        self._offset += end
+        return end > 0
+
+    def _load_segments(self, lex_names: List[str]) -> None:
+        loaded = {s.lex_path.name: s for s in self._segments}
+        segments = []
+        for name in lex_names:
+            segment = loaded.get(name)
+            if segment is None:
+                lex_path = self.directory / name
+                try:
+                    segment = _Segment(lex_path.with_name(name.replace(".lex.json", ".post")), lex_path)
+                except (OSError, ValueError):
+                    continue  # merged away by its writer in the meantime
+            segments.append(segment)
+        # A merge writes its output before deleting its inputs: drop segments it covers
+        kept: List[_Segment] = []
+        for segment in sorted(segments, key=lambda s: s.seq, reverse=True):
+            if not any(k.covers(segment) for k in kept):
+                kept.append(segment)
+        self._segments = sorted(kept, key=lambda s: s.seq)
+        self._lex_names = lex_names
+
+    def _rebuffer(self) -> None:
+        indexed = max((s.doc_hi for s in self._segments), default=0)
+        self._buffer = {}
+        self._buffered_docs = 0
+        for doc_id in range(indexed, len(self._docs)):
+            doc = self._docs[doc_id]
+            self._buffer_doc(doc_id, tokenize(f"{doc['title']} {doc['snippet']}"))
+
+    def _remember(self, doc: Dict[str, Any]) -> int:
+        doc_id = len(self._docs)
+        self._docs.append(doc)
+        self._lengths.append(int(doc.get("len", 0)))
+        if doc["url"]:
+            self._urls[_url_key(doc["url"])] = doc_id
+        return doc_id
+
+    def _buffer_doc(self, doc_id: int, tokens: List[str]) -> None:
+        for term, tf in Counter(tokens).items():
+            self._buffer.setdefault(term, []).append((doc_id, min(tf, 0xFFFF)))
+        self._buffered_docs += 1
+
+    # -- writes (owner only) -------------------------------------------------------
+
+    def append(self, records: List[Tuple[Dict[str, Any], List[str]]]) -> None:
+        with self._docs_path.open("a", encoding="utf-8") as fh:
+            fh.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record, _ in records))
+        self._offset = self._docs_path.stat().st_size
+        for record, tokens in records:
+            self._buffer_doc(self._remember(record), tokens)
+        if self._buffered_docs >= self.flush_docs:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffered_docs:
+            return
+        doc_lo = max((s.doc_hi for s in self._segments), default=0)
+        self._add_segment(_Segment.write(self.directory, self._next_seq(), self._buffer, doc_lo, len(self._docs)))
+        self._buffer = {}
+        self._buffered_docs = 0
+        if len(self._segments) > self.max_segments:
+            self._merge()
+
+    def _add_segment(self, segment: _Segment) -> None:
+        self._segments.append(segment)
+        self._lex_names = sorted(s.lex_path.name for s in self._segments)
+
+    def _next_seq(self) -> int:
+        return max((s.seq for s in self._segments), default=0) + 1
+
+    def _merge(self) -> None:
+        merged: Dict[str, List[Tuple[int, int]]] = {}
+        for segment in self._segments:
+            for term, (offset, count) in segment.terms.items():
+                block = segment.postings[offset:offset + count]
+                merged.setdefault(term, []).extend(zip(block["doc"].tolist(), block["tf"].tolist()))
+        old = self._segments
+        self._segments = []
+        self._add_segment(_Segment.write(
+            self.directory, max(s.seq for s in old) + 1, merged,
+            min(s.doc_lo for s in old), max(s.doc_hi for s in old),
+        ))
+        for segment in old:
+            del segment.postings
+            segment.lex_path.unlink(missing_ok=True)
+            segment.post_path.unlink(missing_ok=True)
+
+    # -- reads -------------------------------------------------------------
+
+    def blocks(self, term: str) -> List[np.ndarray]:
+        blocks = [p for p in (s.get(term) for s in self._segments) if p is not None and len(p)]
+        if term in self._buffer:
+            blocks.append(np.array(self._buffer[term], dtype=POSTING))
+        return blocks
+
+
+class FactCheckIndex:
+    """BM25 index over harvested fact-checks with mmap'd on-disk postings."""
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(
+        self,
+        directory: str,
+        flush_docs: int = 200,
+        max_segments: int = 8,
+        refresh_interval: float = 5.0,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_docs = max(1, int(flush_docs))
+        self.max_segments = max(1, int(max_segments))
+        self.refresh_interval = float(refresh_interval)
+        self._lock = threading.RLock()
+        self._lock_file = None
+        self._own = self._claim_shard()
+        self._shards: Dict[str, _Shard] = {self._own.directory.name: self._own}
+        self._refreshed = 0.0
+        self._lengths_key: Optional[Tuple[int, ...]] = None
+        self._lengths_arr: Optional[np.ndarray] = None
+        self._refresh_shards(force=True)
+        logger.info(
+            f"📇 Local fact-check index: {len(self)} docs in {len(self._shards)} shards "
+            f"(writing {self._own.directory.name})"
+        )
+
+    # -- shards -------------------------------------------------------------
+
+    def _claim_shard(self) -> _Shard:
+        """Take the first shard no other live process writes to."""
+        for n in itertools.count():
+            shard_dir = self.directory / f"shard_{n:03d}"
+            shard_dir.mkdir(exist_ok=True)
+            lock_file = open(shard_dir / "writer.lock", "a")
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    lock_file.close()
+                    continue
+            self._lock_file = lock_file
+            return _Shard(shard_dir, True, self.flush_docs, self.max_segments)
+
+    def _refresh_shards(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._refreshed < self.refresh_interval:
+            return
+        self._refreshed = now
+        shard_dirs = sorted(p for p in self.directory.glob("shard_*") if p.is_dir())
+        if (self.directory / "docs.jsonl").exists():
+            shard_dirs.insert(0, self.directory)  # single-writer layout from before shards
+        for shard_dir in shard_dirs:
+            name = shard_dir.name if shard_dir != self.directory else ""
+            shard = self._shards.get(name)
+            if shard is None:
+                self._shards[name] = _Shard(shard_dir, False)
+            elif shard is not self._own:
+                shard.refresh()
+
+    def _ordered(self) -> List[_Shard]:
+        return [self._shards[name] for name in sorted(self._shards)]
+
+    def close(self) -> None:
+        """Flush and give up this process's shard."""
+        with self._lock:
+            self._own.flush()
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = None
+
+    # -- writes ------------------------------------------------------------
+
+    def add(self, doc: Dict[str, Any], provider: str = "") -> bool:
+        """Index one result (needs ``url`` and ``title``); returns False for duplicates."""
+        return self.add_many([doc], provider) == 1
+
+    def add_many(self, docs: Iterable[Dict[str, Any]], provider: str = "") -> int:
+        """Index provider results, skipping duplicates and results without url/title."""
+        records = []
+        for doc in docs:
+            if not isinstance(doc, dict) or not doc.get("url") or not doc.get("title"):
+                continue
+            record = {
+                "url": doc["url"],
+                "title": doc["title"],
+                "snippet": (doc.get("snippet") or "")[:500],
+                "credibility_score": float(doc.get("credibility_score") or 0.5),
+                "date_published": doc.get("date_published") or doc.get("published_at") or doc.get("pub_date") or "",
+                "provider": provider or doc.get("source") or "",
+            }
+            tokens = tokenize(f"{record['title']} {record['snippet']}")
+            record["len"] = len(tokens)
+            records.append((record, tokens))
+        with self._lock:
+            self._refresh_shards()
+            shards = self._ordered()
+            fresh, seen = [], set()
+            for record, tokens in records:
+                key = _url_key(record["url"])
+                if key not in seen and not any(key in shard._urls for shard in shards):
+                    seen.add(key)
+                    fresh.append((record, tokens))
+            if fresh:
+                self._own.append(fresh)
+        return len(fresh)
+
+    def flush(self) -> None:
+        """Write buffered postings as a new segment (merging when there are too many)."""
+        with self._lock:
+            self._own.flush()
+
+    # -- reads -------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards.values())
+
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """Top-``k`` documents by BM25, each with ``score`` and ``coverage``."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            self._refresh_shards()
+            shards = self._ordered()
+            # Shards are laid end to end in one global doc-id space
+            offsets = [0]
+            for shard in shards:
+                offsets.append(offsets[-1] + len(shard))
+            n_docs = offsets[-1]
+            if not terms or not n_docs:
+                return []
+            key = tuple(len(shard) for shard in shards)
+            if key != self._lengths_key:
+                self._lengths_arr = np.concatenate([np.asarray(s._lengths, dtype=np.float32) for s in shards])
+                self._lengths_key = key
+            lengths = self._lengths_arr
+            avgdl = max(float(lengths.mean()), 1.0)
+            scores = np.zeros(n_docs, dtype=np.float32)
+            matched = np.zeros(n_docs, dtype=np.uint16)
+            for term in terms:
+                blocks = [(offset, p) for shard, offset in zip(shards, offsets) for p in shard.blocks(term)]
+                df = sum(len(p) for _, p in blocks)
+                if not df:
+                    continue
+                idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                for offset, block in blocks:
+                    ids = block["doc"].astype(np.int64) + offset
+                    tf = block["tf"].astype(np.float32)
+                    norm = self.K1 * (1.0 - self.B + self.B * lengths[ids] / avgdl)
+                    scores[ids] += idf * tf * (self.K1 + 1.0) / (tf + norm)
+                    matched[ids] += 1
+            candidates = np.flatnonzero(scores)
+            hits, seen = [], set()
+            for doc_id in candidates[np.argsort(-scores[candidates], kind="stable")].tolist():
+                i = bisect_right(offsets, doc_id) - 1
+                doc = shards[i]._docs[doc_id - offsets[i]]
+                url = _url_key(doc["url"])
+                if not url or url in seen:  # placeholder, or harvested by two processes at once
+                    continue
+                seen.add(url)
+                hit = {key: value for key, value in doc.items() if key != "len"}
+                hit["score"] = round(float(scores[doc_id]), 4)
+                hit["coverage"] = round(int(matched[doc_id]) / len(terms), 3)
+                hits.append(hit)
+                if len(hits) == k:
+                    break
+            return hits
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "documents": len(self),
+            "segments": sum(len(shard._segments) for shard in self._shards.values()),
+            "buffered_documents": sum(shard._buffered_docs for shard in self._shards.values()),
+        }
+
+
+_index: Optional[FactCheckIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_factcheck_index() -> Optional[FactCheckIndex]:
+    """The shared index at ``settings.local_index_dir`` (None when disabled or unusable)."""
+    global _index
+    if not settings.local_index_enabled:
+        return None
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                try:
+                    _index = FactCheckIndex(
+                        settings.local_index_dir,
+                        flush_docs=settings.local_index_flush_docs,
+                        max_segments=settings.local_index_max_segments,
+                        refresh_interval=settings.local_index_refresh_interval,
+                    )
+                except OSError as e:
+                    logger.error(f"Local fact-check index unavailable: {e}")
+                    return None
+    return _index
+
+
+# Providers whose documents are published fact-checks: the Google Fact Check
+# API and the fact-checker scrapers in src/services/web_scraper.py
+FACT_CHECK_PROVIDERS = frozenset({"google_fact_check", "factcheck_org", "snopes", "correctiv"})
+
+
+def is_fact_check_hit(hit: Dict[str, Any]) -> bool:
+    """Whether a search hit is a published fact-check (by the provider it was harvested from)."""
+    return hit.get("provider") in FACT_CHECK_PROVIDERS
+
+
+def index_documents(
+    docs: Iterable[Dict[str, Any]], provider: str, index: Optional[FactCheckIndex] = None
+) -> int:
+    """Harvest provider results into ``index`` (default: the shared index); never raises."""
+    if index is None:
+        index = get_factcheck_index()
+    if index is None:
+        return 0
+    try:
+        return index.add_many(docs, provider)
+    except Exception as e:
+        logger.warning(f"Local index harvest from {provider} failed: {e}")
+        return 0
@@ -0,0 +1,148 @@
+"""
+Tiered fact-check decisions: settle a claim before the LLM whenever we can.
+
+``TruthShieldAI.fact_check_claim`` resolves each claim at the cheapest tier
+whose confidence gate it passes:
+
+- tier 0, ``rules``: deterministic verdicts from :func:`rule_verdicts` and the
+  curated known-narrative overrides (``_apply_special_case_overrides``). The
+  rules only cover cases where the LLM path overrides the model anyway
+  (logical contradictions force plausibility 0, political smear patterns
+  force 5), so skipping the LLM does not change the verdict. A rule resolves
+  the claim when its confidence reaches ``fast_path_min_confidence``;
+- tier 1, ``cache``: a tier-2 verdict (with its sources) stored for the same
+  normalized claim and company, whatever the language or response settings,
+  reused while its volatility TTL lasts and its confidence reaches
+  ``fast_path_cache_min_confidence``;
+- tier 2, ``llm``: ``_analyze_with_ai`` + ``_determine_verdict``.
+
+:class:`TierStats` counts how many claims each tier resolved; it is reported
+by ``/api/v1/detect/status``.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import threading
+
+from src.ml.guardian.claim_router import ClaimAnalysis, TemporalMode
+
+TIER_RULES = "rules"
+TIER_CACHE = "cache"
+TIER_LLM = "llm"
+TIERS = (TIER_RULES, TIER_CACHE, TIER_LLM)
+
+
+@dataclass
+class RuleVerdict:
+    """A tier-0 candidate verdict and the rule that produced it."""
+    rule: str
+    is_fake: bool
+    confidence: float
+    category: str
+    explanation: str
+
+    def to_verdict(self) -> Dict[str, Any]:
+        return {
+            "is_fake": self.is_fake,
+            "confidence": self.confidence,
+            "explanation": self.explanation,
+            "category": self.category,
+        }
+
+
+def rule_verdicts(
+    text_analysis: Dict[str, Any],
+    claim_analysis: Optional[ClaimAnalysis],
+    router_min_confidence: float = 0.8,
+) -> List[RuleVerdict]:
+    """Deterministic candidate verdicts, most confident first.
+
+    ``text_analysis`` is :func:`src.core.text_detection.analyze_text` output.
+    Political smear patterns are only trusted at full confidence when
+    ClaimRouter also matches the claim with at least ``router_min_confidence``
+    and the claim does not need live sources.
+    """
+    candidates: List[RuleVerdict] = []
+    contradictions = text_analysis["logical_contradictions"]
+    if contradictions["has_contradictions"]:
+        candidates.append(RuleVerdict(
+            rule="logical_contradiction",
+            is_fake=True,
+            confidence=0.9,
+            category="misinformation",
+            explanation=(
+                "LOGICAL CONTRADICTION: this claim contains contradictory terms "
+                f"({', '.join(contradictions['contradictions'])}) that make it logically impossible."
+            ),
+        ))
+    elif contradictions["has_ambiguous_phrasing"]:
+        # Weaker signal than a contradiction: below the default gate, so the LLM still looks
+        candidates.append(RuleVerdict(
+            rule="ambiguous_phrasing",
+            is_fake=True,
+            confidence=0.8,
+            category="misinformation",
+            explanation=(
+                "AMBIGUOUS PHRASING: this claim uses intentionally confusing language "
+                f"({', '.join(contradictions['ambiguous_phrases'])})."
+            ),
+        ))
+
+    political = text_analysis["astroturfing"].get("political_astroturfing", {})
+    if political.get("is_political_astroturfing"):
+        router_match = (
+            claim_analysis is not None
+            and claim_analysis.confidence >= router_min_confidence
+            and claim_analysis.temporal_mode != TemporalMode.LIVE_REQUIRED
+        )
+        if political.get("targets_elected_politician"):
+            target = "elected politicians"
+        elif political.get("targets_appointed_official"):
+            target = "appointed officials"
+        else:
+            target = "legitimate politicians"
+        candidates.append(RuleVerdict(
+            rule="political_astroturfing",
+            is_fake=True,
+            confidence=0.9 if router_match else 0.8,
+            category="misinformation",
+            explanation=(
+                "POLITICAL ASTROTURFING DETECTED: this appears to be coordinated disinformation "
+                f"targeting {target} with unsubstantiated corruption claims."
+            ),
+        ))
+
+    candidates.sort(key=lambda c: c.confidence, reverse=True)
+    return candidates
+
+
+class TierStats:
+    """Thread-safe resolution counters and latency per decision tier."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.resolved = {tier: 0 for tier in TIERS}
+        self._total_ms = {tier: 0 for tier in TIERS}
+        self.gated = 0  # rule candidates that existed but were below the gate
+
+    def record(self, tier: str, elapsed_ms: int) -> None:
+        with self._lock:
+            self.resolved[tier] += 1
+            self._total_ms[tier] += int(elapsed_ms)
+
+    def record_gated(self) -> None:
+        with self._lock:
+            self.gated += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total = sum(self.resolved.values())
+            return {
+                "resolved": dict(self.resolved),
+                "llm_calls_avoided": self.resolved[TIER_RULES] + self.resolved[TIER_CACHE],
+                "fast_path_share": round((total - self.resolved[TIER_LLM]) / total, 3) if total else 0.0,
+                "avg_ms": {
+                    tier: int(self._total_ms[tier] / n) if n else None
+                    for tier, n in self.resolved.items()
+                },
+                "rules_below_gate": self.gated,
+            }
@@ -0,0 +1,215 @@
+"""
+Job Worker Pool
+
+Runs jobs from the shared :class:`~src.core.jobs.JobQueue` outside the API
+processes, so API workers only submit and poll. Each worker process runs an
+asyncio loop with up to ``--concurrency`` jobs in flight; a job that fails is
+retried with backoff, and jobs with a ``webhook_url`` get a POST with their
+final state (public hosts only, see :func:`~src.core.jobs.webhook_url_error`).
+While a job runs its worker renews the claim every third of the visibility
+timeout, so long jobs are not handed to a second worker.
+
+Usage:
+    python -m src.core.job_worker
+    python -m src.core.job_worker --processes 4 --concurrency 8
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import httpx
+
+from src.core.config import settings
+from src.core.jobs import JobQueue, get_job_queue, webhook_url_error
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+HANDLERS: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    def register(fn: JobHandler) -> JobHandler:
+        HANDLERS[kind] = fn
+        return fn
+    return register
+
+
+@lru_cache(maxsize=1)
+def _detector():
+    from src.core.detection import TruthShieldDetector
+
+    return TruthShieldDetector()
+
+
+@job_handler("fact_check")
+async def run_fact_check(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from src.core.detection import CompanyFactCheckRequest
+
+    result = await _detector().fact_check_company_claim(CompanyFactCheckRequest(**payload))
+    return result.model_dump(mode="json")
+
+
+@job_handler("campaign_monitoring")
+async def run_campaign_monitoring(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from src.api.monitoring import monitor_client_campaigns
+
+    return await monitor_client_campaigns(
+        payload["client_name"], payload.get("platforms") or [], payload.get("duration_hours", 24)
+    )
+
+
+class JobWorker:
+    """Claims jobs and runs up to ``concurrency`` of them at a time."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        worker_id: Optional[str] = None,
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        handlers: Optional[Dict[str, JobHandler]] = None,
+    ) -> None:
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = max(1, int(concurrency))
+        self.poll_interval = float(poll_interval)
+        self.handlers = HANDLERS if handlers is None else handlers
+        self._running: Set["asyncio.Task[None]"] = set()
+
+    async def run_once(self) -> int:
+        """Claim jobs for the free slots and start them; returns how many were started."""
+        for job in await asyncio.to_thread(self.queue.expire):
+            logger.warning(f"Job {job['id']} failed: worker lost after {job['attempts']} attempts")
+            if job.get("webhook_url"):
+                await self._notify(job["id"])
+        free = self.concurrency - len(self._running)
+        if free <= 0:
+            return 0
+        jobs = await asyncio.to_thread(self.queue.claim, self.worker_id, free, list(self.handlers))
+        for job in jobs:
+            task = asyncio.create_task(self._execute(job))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        return len(jobs)
+
+    async def drain(self) -> None:
+        """Wait for the jobs currently in flight."""
+        if self._running:
+            await asyncio.gather(*list(self._running), return_exceptions=True)
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        stop = stop or asyncio.Event()
+        logger.info(f"👷 Job worker {self.worker_id} started (concurrency={self.concurrency})")
+        try:
+            while not stop.is_set():
+                started = await self.run_once()
+                if not started:
+                    try:
+                        await asyncio.wait_for(stop.wait(), self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            await self.drain()
+            logger.info(f"👷 Job worker {self.worker_id} stopped")
+
+    async def _heartbeat(self, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.queue.visibility_timeout / 3)
+            if not await asyncio.to_thread(self.queue.extend, job_id, self.worker_id):
+                logger.warning(f"Job {job_id}: claim lost to another worker")
+                return
+
+    async def _execute(self, job: Dict[str, Any]) -> None:
+        handler = self.handlers.get(job["kind"])
+        heartbeat = asyncio.create_task(self._heartbeat(job["id"]))
+        try:
+            if handler is None:
+                raise LookupError(f"no handler for job kind '{job['kind']}'")
+            result = await handler(job["payload"])
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            status = await asyncio.to_thread(
+                self.queue.fail, job["id"], error, self.worker_id, handler is not None
+            )
+            logger.warning(f"Job {job['id']} attempt {job['attempts']} failed ({status}): {error}")
+        else:
+            status = self.queue.SUCCEEDED if await asyncio.to_thread(
+                self.queue.complete, job["id"], result, self.worker_id
+            ) else None
+        finally:
+            heartbeat.cancel()
+        if status in (self.queue.SUCCEEDED, self.queue.FAILED) and job.get("webhook_url"):
+            await self._notify(job["id"])
+
+    async def _notify(self, job_id: str) -> None:
+        job = await asyncio.to_thread(self.queue.get, job_id)
+        body = {key: job.get(key) for key in ("id", "kind", "status", "result", "error", "finished_at")}
+        # Re-checked at delivery: the name may resolve to an internal address by now
+        error = await asyncio.to_thread(webhook_url_error, job["webhook_url"], True)
+        if error:
+            status = f"rejected: {error}"
+        else:
+            try:
+                async with httpx.AsyncClient(timeout=10.0, follow_redirects=False) as client:
+                    response = await client.post(job["webhook_url"], json=body)
+                status = f"delivered ({response.status_code})"
+            except Exception as e:  # a bad endpoint must not take the job task down
+                status = f"failed: {type(e).__name__}"
+        await asyncio.to_thread(self.queue.set_webhook_status, job_id, status)
+        logger.info(f"Job {job_id} webhook {status}")
+
+
+def _worker_process(concurrency: int, poll_interval: float) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(levelname)s %(message)s")
+    worker = JobWorker(get_job_queue(), concurrency=concurrency, poll_interval=poll_interval)
+    try:
+        asyncio.run(worker.run())
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the TruthShield job worker pool")
+    parser.add_argument(
+        "--processes", "-p",
+        type=int,
+        default=settings.jobs_worker_processes,
+        help="Worker processes"
+    )
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        default=settings.jobs_worker_concurrency,
+        help="Jobs in flight per process"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=settings.jobs_poll_interval,
+        help="Seconds between queue polls when idle"
+    )
+    args = parser.parse_args(argv)
+
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(target=_worker_process, args=(args.concurrency, args.poll_interval), name=f"job-worker-{i}")
+        for i in range(max(1, args.processes))
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
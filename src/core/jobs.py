@@ -0,0 +1,331 @@
+import ipaddress
+import json
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+from datetime import datetime
+
+
+class JobQueue:
+    """SQLite-backed job queue for long-running work (fact-checks, monitoring).
+
+    Same storage model as ``PublishQueue``: WAL mode so API workers (submit,
+    poll) and separate worker processes (``python -m src.core.job_worker``)
+    share one file, one short transaction per operation.
+
+    Jobs are claimed highest ``priority`` first, then oldest. A claimed job is
+    hidden for ``visibility_timeout`` seconds, which its worker keeps pushing
+    back with :meth:`extend` while the job runs; if the worker dies the job
+    becomes claimable again. Failed and timed-out attempts are retried (failed
+    ones with exponential backoff) until ``max_attempts`` is reached.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        path: str = "demo_data/jobs.db",
+        visibility_timeout: float = 300.0,
+        retry_backoff: float = 10.0,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.visibility_timeout = float(visibility_timeout)
+        self.retry_backoff = float(retry_backoff)
+        self._local = threading.local()
+        self._init_db()
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite3 connections are not thread-safe.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                id TEXT NOT NULL UNIQUE,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                payload TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                webhook_url TEXT,
+                webhook_status TEXT,
+                claimed_by TEXT,
+                visible_at REAL NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs(status, priority DESC, seq)"
+        )
+
+    @staticmethod
+    def _new_id() -> str:
+        return f"job_{uuid.uuid4().hex}"
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+        job = {
+            "id": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "priority": row["priority"],
+            "payload": json.loads(row["payload"]),
+            "attempts": row["attempts"],
+            "max_attempts": row["max_attempts"],
+            "created_at": row["created_at"],
+        }
+        for key in ("started_at", "finished_at", "error", "claimed_by", "webhook_url", "webhook_status"):
+            if row[key]:
+                job[key] = row[key]
+        if row["result"] is not None:
+            job["result"] = json.loads(row["result"])
+        return job
+
+    def submit(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        priority: int = 0,
+        max_attempts: int = 3,
+        webhook_url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        job_id = self._new_id()
+        self._conn().execute(
+            "INSERT INTO jobs (id, kind, status, priority, payload, max_attempts, webhook_url, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                job_id, kind, self.QUEUED, int(priority), json.dumps(payload, ensure_ascii=False),
+                max(1, int(max_attempts)), webhook_url, datetime.utcnow().isoformat(),
+            ),
+        )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list(self, status: Optional[str] = None, kind: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        sql = "SELECT * FROM jobs"
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY seq DESC LIMIT ?"
+        params.append(int(limit))
+        return [self._row_to_job(r) for r in self._conn().execute(sql, params)]
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: n for status, n in rows}
+
+    def claim(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        kinds: Optional[List[str]] = None,
+        visibility_timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Atomically claim up to ``limit`` runnable jobs for ``worker_id``.
+
+        Runnable: queued jobs whose backoff has elapsed, plus running jobs
+        whose visibility timeout expired (crashed or stalled workers) and that
+        have attempts left; :meth:`expire` fails the ones that have none.
+        """
+        now = time.time()
+        visible_at = now + (self.visibility_timeout if visibility_timeout is None else float(visibility_timeout))
+        sql = (
+            "SELECT seq FROM jobs WHERE ((status = ? AND visible_at <= ?) "
+            "OR (status = ? AND visible_at <= ? AND attempts < max_attempts))"
+        )
+        params: list = [self.QUEUED, now, self.RUNNING, now]
+        if kinds:
+            sql += f" AND kind IN ({', '.join('?' for _ in kinds)})"
+            params += list(kinds)
+        sql += " ORDER BY priority DESC, seq LIMIT ?"
+        params.append(int(limit))
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            seqs = [r["seq"] for r in conn.execute(sql, params).fetchall()]
+            claimed = []
+            for seq in seqs:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, claimed_by = ?, visible_at = ?, attempts = attempts + 1, "
+                    "started_at = ? WHERE seq = ?",
+                    (self.RUNNING, worker_id, visible_at, datetime.utcnow().isoformat(), seq),
+                )
+                claimed.append(self._row_to_job(
+                    conn.execute("SELECT * FROM jobs WHERE seq = ?", (seq,)).fetchone()
+                ))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return claimed
+
+    def extend(self, job_id: str, worker_id: str, visibility_timeout: Optional[float] = None) -> bool:
+        """Heartbeat: keep a running job hidden. False when ``worker_id`` no longer holds it."""
+        timeout = self.visibility_timeout if visibility_timeout is None else float(visibility_timeout)
+        return self._conn().execute(
+            "UPDATE jobs SET visible_at = ? WHERE id = ? AND status = ? AND claimed_by = ?",
+            (time.time() + timeout, job_id, self.RUNNING, worker_id),
+        ).rowcount == 1
+
+    def expire(self) -> List[Dict[str, Any]]:
+        """Fail running jobs whose visibility timeout expired on their last attempt; returns them."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            seqs = [r["seq"] for r in conn.execute(
+                "SELECT seq FROM jobs WHERE status = ? AND visible_at <= ? AND attempts >= max_attempts",
+                (self.RUNNING, time.time()),
+            ).fetchall()]
+            expired = []
+            for seq in seqs:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE seq = ?",
+                    (
+                        self.FAILED, "visibility timeout expired on the last attempt",
+                        datetime.utcnow().isoformat(), seq,
+                    ),
+                )
+                expired.append(self._row_to_job(
+                    conn.execute("SELECT * FROM jobs WHERE seq = ?", (seq,)).fetchone()
+                ))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return expired
+
+    def complete(self, job_id: str, result: Any, worker_id: Optional[str] = None) -> bool:
+        """Store the result of a running job. With ``worker_id`` only the current claimant may complete it."""
+        sql = "UPDATE jobs SET status = ?, result = ?, error = NULL, finished_at = ? WHERE id = ? AND status = ?"
+        params: list = [
+            self.SUCCEEDED, json.dumps(result, ensure_ascii=False, default=str),
+            datetime.utcnow().isoformat(), job_id, self.RUNNING,
+        ]
+        if worker_id is not None:
+            sql += " AND claimed_by = ?"
+            params.append(worker_id)
+        return self._conn().execute(sql, params).rowcount == 1
+
+    def fail(self, job_id: str, error: str, worker_id: Optional[str] = None, retry: bool = True) -> Optional[str]:
+        """Record a failed attempt: requeue with backoff or fail for good.
+
+        Returns the new status, or None when ``worker_id`` no longer holds the job.
+        """
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ? AND status = ?", (job_id, self.RUNNING)).fetchone()
+            if row is None or (worker_id is not None and row["claimed_by"] != worker_id):
+                conn.execute("ROLLBACK")
+                return None
+            if retry and row["attempts"] < row["max_attempts"]:
+                delay = self.retry_backoff * (2 ** (row["attempts"] - 1))
+                conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, claimed_by = NULL, visible_at = ? WHERE id = ?",
+                    (self.QUEUED, error, time.time() + delay, job_id),
+                )
+                status = self.QUEUED
+            else:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                    (self.FAILED, error, datetime.utcnow().isoformat(), job_id),
+                )
+                status = self.FAILED
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return status
+
+    def set_webhook_status(self, job_id: str, status: str) -> None:
+        self._conn().execute("UPDATE jobs SET webhook_status = ? WHERE id = ?", (status, job_id))
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """The shared queue at ``settings.jobs_db_path``."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                from src.core.config import settings
+
+                _queue = JobQueue(
+                    settings.jobs_db_path,
+                    visibility_timeout=settings.jobs_visibility_timeout,
+                    retry_backoff=settings.jobs_retry_backoff,
+                )
+    return _queue
+
+
+def webhook_url_error(url: str, resolve: bool = False) -> Optional[str]:
+    """Why ``url`` may not receive job webhooks, or None when it may.
+
+    Webhooks are POSTed by the worker from inside the deployment, so they
+    must not reach loopback, private, link-local or otherwise non-public
+    addresses. Hosts in ``jobs_webhook_allowed_hosts`` are trusted as they
+    are; when that list is set, no other host is allowed. With ``resolve``
+    the host name is looked up and every address it resolves to is checked
+    (the worker does this right before each delivery).
+    """
+    from src.core.config import settings
+
+    parts = urlsplit(url or "")
+    host = (parts.hostname or "").rstrip(".").lower()
+    if parts.scheme not in ("http", "https") or not host:
+        return "webhook URL must be an http(s) URL with a host"
+    allowed = {h.strip().lower() for h in settings.jobs_webhook_allowed_hosts.split(",") if h.strip()}
+    if allowed:
+        return None if host in allowed else f"webhook host {host} is not in jobs_webhook_allowed_hosts"
+    if host == "localhost" or host.endswith(".localhost"):
+        return f"webhook host {host} is not public"
+    try:
+        addresses = [ipaddress.ip_address(host)]
+    except ValueError:
+        if not resolve:
+            return None
+        try:
+            infos = socket.getaddrinfo(host, parts.port or (443 if parts.scheme == "https" else 80))
+        except (socket.gaierror, UnicodeError) as e:
+            return f"webhook host {host} does not resolve ({e})"
+        addresses = [ipaddress.ip_address(info[4][0].split("%")[0]) for info in infos]
+    for address in addresses:
+        if not address.is_global or address.is_multicast:
+            return f"webhook host {host} is not public ({address})"
+    return None
@@ -1,6 +1,8 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class KPIDecision:
@@ -14,6 +16,17 @@ class KPIDecision:
     reasons: Dict[str, str]
 
 
+@dataclass
+class KPIBatchDecision:
+    """Column-wise :class:`KPIDecision` for a batch (one array entry per item)."""
+    action: np.ndarray  # str: HITL, SEMI_HITL, PREBUNK
+    projected_reach_48h: np.ndarray
+    harm_weight: np.ndarray
+    virality_probability: np.ndarray
+    cost_per_reach: np.ndarray  # NaN where not computed
+    reasons: List[Dict[str, str]]
+
+
 class KPIDecider:
     def __init__(self, harm_weights: Optional[Dict[str, float]] = None):
         # Defaults can be tuned; topics to weights
@@ -42,6 +55,11 @@ class KPIDecider:
         r = max(0.0, float(growth_rate_24h))
         return round(v * (1.0 + r) ** 2, 2)
 
+    def estimate_projected_reach_48h_batch(self, views: np.ndarray, growth_rate_24h: np.ndarray) -> np.ndarray:
+        v = np.maximum(0.0, views)
+        r = np.maximum(0.0, growth_rate_24h)
+        return np.array([round(x, 2) for x in (v * (1.0 + r) ** 2).tolist()])
+
     def virality_probability(self, growth_rate_24h: float) -> float:
         # Map growth rate to probability 0..1 (cap at 1.0)
         r = max(0.0, float(growth_rate_24h))
@@ -99,4 +117,61 @@ class KPIDecider:
             reasons=reasons,
         )
 
+    def decide_batch(
+        self,
+        *,
+        views: np.ndarray,
+        growth_rate_24h: np.ndarray,
+        harm_topics: Sequence[Optional[str]],
+        harm_weight_overrides: Sequence[Optional[float]],
+        astro_score: np.ndarray,
+        avg_analyst_seconds: Sequence[Optional[float]],
+        salary_rate_per_hour: Sequence[Optional[float]],
+        client_max_cpr: Sequence[Optional[float]],
+    ) -> KPIBatchDecision:
+        """Vectorized :meth:`decide`; ``None`` entries behave as in the scalar path."""
+        n = len(views)
+
+        def opt(values: Sequence[Optional[float]]) -> np.ndarray:
+            return np.fromiter((np.nan if v is None else float(v) for v in values), dtype=float, count=n)
+
+        projected = self.estimate_projected_reach_48h_batch(views, growth_rate_24h)
+        harm_w = np.fromiter(
+            (self.get_harm_weight(t, o) for t, o in zip(harm_topics, harm_weight_overrides)),
+            dtype=float, count=n,
+        )
+        vir_prob = np.minimum(1.0, np.maximum(0.0, growth_rate_24h) / 0.5)
 
+        # Primary KPI rules
+        hitl = (projected > 50000) & (harm_w >= 1.5)
+        semi = ~hitl & (projected >= 10000) & (projected <= 50000) & (astro_score >= 6.0)
+        action = np.where(hitl, "HITL", np.where(semi, "SEMI_HITL", "PREBUNK"))
+        primary = np.where(
+            hitl,
+            "projected>50k_and_harm>=1.5",
+            np.where(semi, "projected_10_50k_and_astro>=6", "did_not_meet_thresholds"),
+        )
+
+        # Secondary KPI cost-based filter
+        seconds, salary, max_cpr = opt(avg_analyst_seconds), opt(salary_rate_per_hour), opt(client_max_cpr)
+        has_cpr = ~np.isnan(seconds) & ~np.isnan(salary) & (projected > 0)
+        cpr = np.full(n, np.nan)
+        if has_cpr.any():
+            idx = np.flatnonzero(has_cpr)
+            cost = np.maximum(0.0, seconds[idx]) / 3600.0 * salary[idx]
+            cpr[idx] = [round(x, 6) for x in (cost / projected[idx]).tolist()]
+        over_budget = has_cpr & ~np.isnan(max_cpr) & (cpr > max_cpr)
+        action = np.where(over_budget, "PREBUNK", action)
+
+        reasons: List[Dict[str, str]] = [{"primary": p} for p in primary.tolist()]
+        for i in np.flatnonzero(over_budget).tolist():
+            reasons[i]["secondary"] = "cpr_above_client_max"
+
+        return KPIBatchDecision(
+            action=action,
+            projected_reach_48h=projected,
+            harm_weight=harm_w,
+            virality_probability=vir_prob,
+            cost_per_reach=cpr,
+            reasons=reasons,
+        )
@@ -0,0 +1,67 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+``lazy_import("tweepy", feature="twitter")`` returns a module stand-in that
+performs the real import on first attribute access, so importing the API does
+not pay for libraries whose features are unused. Features are switched with
+``feature_<name>`` settings (e.g. ``FEATURE_OCR=false``); a disabled
+feature's module is never imported and accessing it raises
+:class:`FeatureDisabled`. ``module_available`` checks installation without
+importing.
+"""
+from typing import Any, Optional
+from functools import lru_cache
+import importlib
+import importlib.util
+import threading
+
+
+class FeatureDisabled(ImportError):
+    """Raised when a lazily imported module belongs to a disabled feature."""
+
+
+def feature_enabled(feature: Optional[str]) -> bool:
+    """``settings.feature_<feature>`` (features without a flag are enabled)."""
+    if not feature:
+        return True
+    from src.core.config import settings
+
+    return bool(getattr(settings, f"feature_{feature}", True))
+
+
+@lru_cache(maxsize=None)
+def module_available(name: str) -> bool:
+    """Whether ``name`` is installed, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """Module stand-in that imports ``name`` on first attribute access."""
+
+    def __init__(self, name: str, feature: Optional[str] = None) -> None:
+        self.__dict__.update(_name=name, _feature=feature, _module=None, _lock=threading.Lock())
+
+    def _load(self) -> Any:
+        module = self._module
+        if module is not None:
+            return module
+        if not feature_enabled(self._feature):
+            raise FeatureDisabled(f"{self._name} is not loaded: feature '{self._feature}' is disabled")
+        with self._lock:
+            if self._module is None:
+                self.__dict__["_module"] = importlib.import_module(self._name)
+            return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "deferred"
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_import(name: str, feature: Optional[str] = None) -> LazyModule:
+    return LazyModule(name, feature)
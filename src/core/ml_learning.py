@@ -11,9 +11,13 @@ Components:
 """
 
 import asyncio
+import atexit
 import logging
 import json
 import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
@@ -21,6 +25,9 @@ from enum import Enum
 from pathlib import Path
 import sqlite3
 from collections import defaultdict
+from itertools import groupby
+
+from src.core.startup import LazySubsystem
 
 logger = logging.getLogger(__name__)
 
@@ -150,110 +157,414 @@ class FeatureExtractor:
         return features
 
 
+class MLStore:
+    """Shared SQLite access layer for ``truthshield_ml.db``.
+
+    - One persistent connection per thread (sqlite3 connections are not
+      thread-safe), opened with a statement cache so the fixed SQL below is
+      prepared once per connection.
+    - WAL journal with ``synchronous=NORMAL``: readers never block the writer
+      and several API workers can log into the same file.
+    - Writes are buffered and flushed as ``executemany`` runs inside one
+      transaction when ``batch_size`` rows are pending, ``flush_interval``
+      seconds after the first pending row, before every read, and at exit.
+      Size- and time-triggered flushes run on the store's executor thread, so
+      ``write`` never waits for (or fails with) the database.
+    - A flush that fails because the database is busy or unwritable keeps its
+      rows queued (at most ``max_pending``, oldest dropped first) and retries
+      after ``flush_interval``; rows the database rejects (constraint or
+      binding errors) are dropped and logged one by one, so they cannot take
+      the rest of their batch with them.
+    - ``run`` executes blocking work on a single-thread executor so async
+      handlers do not stall the event loop.
+
+    Use :func:`get_store` to share one instance per database file.
+    """
+
+    def __init__(
+        self, db_path: str, batch_size: int = 64, flush_interval: float = 0.5, max_pending: int = 10_000
+    ):
+        self.db_path = db_path
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+        self.max_pending = max(self.batch_size, int(max_pending))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: List[Tuple[str, tuple]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._flush_queued = False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ml-store")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None,
+                                   cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-16000")  # ~16 MB page cache
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA busy_timeout=30000")
+            # INSERT OR REPLACE must fire the delete trigger of the replaced row
+            conn.execute("PRAGMA recursive_triggers=ON")
+            self._local.conn = conn
+        return conn
+
+    def executescript(self, script: str) -> None:
+        self._conn().executescript(script)
+
+    def write(self, sql: str, params: tuple = ()) -> None:
+        """Queue one write; it is committed with the next batch."""
+        with self._lock:
+            self._pending.append((sql, params))
+            if len(self._pending) >= self.batch_size or self.flush_interval <= 0:
+                self._schedule_flush(0.0)
+            elif self._timer is None:
+                self._schedule_flush(self.flush_interval)
+
+    def _schedule_flush(self, delay: float) -> None:
+        # Caller holds self._lock
+        if delay <= 0:
+            if not self._flush_queued:
+                self._flush_queued = True
+                self._executor.submit(self._background_flush)
+        elif self._timer is None:
+            self._timer = threading.Timer(delay, self._executor.submit, args=(self._background_flush,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _background_flush(self) -> None:
+        with self._lock:
+            self._flush_queued = False
+        self.flush()
+
+    def flush(self) -> int:
+        """Commit pending writes in one transaction; returns the rows committed. Never raises."""
+        if not self._pending:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if not batch:
+                return 0
+            conn = self._conn()
+            try:
+                self._commit(conn, batch)
+                return len(batch)
+            except sqlite3.OperationalError as e:
+                self._requeue(batch, e)  # locked, I/O or disk full: not the rows' fault
+                return 0
+            except sqlite3.Error as e:
+                logger.warning(f"ML store batch rejected ({e}); committing its rows one by one")
+                return self._commit_rows(conn, batch)
+
+    @staticmethod
+    def _commit(conn: sqlite3.Connection, batch: List[Tuple[str, tuple]]) -> None:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Consecutive rows with the same statement go out as one executemany
+            for sql, group in groupby(batch, key=lambda w: w[0]):
+                conn.executemany(sql, [params for _, params in group])
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def _commit_rows(self, conn: sqlite3.Connection, batch: List[Tuple[str, tuple]]) -> int:
+        committed = 0
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for sql, params in batch:
+                try:
+                    conn.execute(sql, params)
+                    committed += 1
+                except sqlite3.OperationalError:
+                    raise
+                except sqlite3.Error as e:
+                    logger.error(f"ML store dropped a rejected write ({e}): {sql.split('(')[0].strip()}")
+            conn.execute("COMMIT")
+        except sqlite3.OperationalError as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            self._requeue(batch, e)
+            return 0
+        return committed
+
+    def _requeue(self, batch: List[Tuple[str, tuple]], error: Exception) -> None:
+        with self._lock:
+            self._pending = batch + self._pending
+            overflow = len(self._pending) - self.max_pending
+            if overflow > 0:
+                del self._pending[:overflow]
+                logger.error(f"ML store backlog full, dropped {overflow} oldest writes")
+            self._schedule_flush(max(self.flush_interval, 1.0))
+        logger.warning(f"ML store flush failed ({error}); {len(batch)} writes kept for retry")
+
+    def query(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Run a read after flushing pending writes (read-your-writes)."""
+        self.flush()
+        return self._conn().execute(sql, params)
+
+    async def run(self, fn, *args):
+        """Run blocking ``fn(*args)`` on the store's executor thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            self._executor.shutdown(wait=True)
+
+
+_stores: Dict[str, MLStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(db_path: str = "truthshield_ml.db") -> MLStore:
+    """Process-wide :class:`MLStore` for ``db_path`` (one per database file)."""
+    key = os.path.abspath(db_path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = MLStore(db_path)
+        return store
+
+
+@atexit.register
+def _flush_stores() -> None:
+    for store in list(_stores.values()):
+        try:
+            store.flush()
+        except Exception:
+            pass
+
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS interactions (
+        interaction_id TEXT PRIMARY KEY,
+        timestamp TEXT,
+        claim_text TEXT,
+        claim_hash TEXT,
+        claim_language TEXT,
+        claim_category TEXT,
+        avatar_used TEXT,
+        platform TEXT,
+        is_fake_detected INTEGER,
+        confidence REAL,
+        astroturfing_score REAL,
+        sources_used TEXT,
+        source_count INTEGER,
+        academic_sources_count INTEGER,
+        response_text TEXT,
+        response_length INTEGER,
+        features TEXT,
+        engagement_score REAL DEFAULT 0,
+        likes INTEGER DEFAULT 0,
+        replies INTEGER DEFAULT 0,
+        shares INTEGER DEFAULT 0,
+        top_comment_achieved INTEGER DEFAULT 0,
+        learning_signal TEXT DEFAULT 'neutral',
+        expert_correction TEXT,
+        user_feedback TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS claim_patterns (
+        pattern_id TEXT PRIMARY KEY,
+        pattern_type TEXT,
+        keywords TEXT,
+        context_signals TEXT,
+        confidence REAL,
+        occurrence_count INTEGER,
+        last_seen TEXT,
+        avg_detection_confidence REAL
+    );
+
+    CREATE TABLE IF NOT EXISTS model_performance (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT,
+        model_name TEXT,
+        accuracy REAL,
+        precision_score REAL,
+        recall_score REAL,
+        f1_score REAL,
+        sample_count INTEGER
+    );
+
+    CREATE TABLE IF NOT EXISTS engagement_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        interaction_id TEXT,
+        timestamp TEXT,
+        platform TEXT,
+        likes INTEGER,
+        replies INTEGER,
+        shares INTEGER,
+        top_comment INTEGER,
+        engagement_rate REAL,
+        FOREIGN KEY (interaction_id) REFERENCES interactions(interaction_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS pattern_ngrams (
+        ngram TEXT NOT NULL,
+        pattern_id TEXT NOT NULL,
+        PRIMARY KEY (ngram, pattern_id)
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS idx_pattern_ngrams_pattern ON pattern_ngrams(pattern_id);
+
+    -- Running per-(platform, avatar, signal) aggregates of ``interactions``,
+    -- maintained by the triggers below in the same transaction as each write
+    CREATE TABLE IF NOT EXISTS interaction_aggregates (
+        platform TEXT NOT NULL,
+        avatar_used TEXT NOT NULL,
+        learning_signal TEXT NOT NULL,
+        n INTEGER NOT NULL DEFAULT 0,
+        sum_engagement REAL NOT NULL DEFAULT 0,
+        sum_length REAL NOT NULL DEFAULT 0,
+        n_engaged INTEGER NOT NULL DEFAULT 0,
+        sum_engaged REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (platform, avatar_used, learning_signal)
+    ) WITHOUT ROWID;
+
+    CREATE TRIGGER IF NOT EXISTS trg_interactions_agg_insert AFTER INSERT ON interactions BEGIN
+        INSERT INTO interaction_aggregates
+            (platform, avatar_used, learning_signal, n, sum_engagement, sum_length, n_engaged, sum_engaged)
+        VALUES (
+            IFNULL(NEW.platform, ''), IFNULL(NEW.avatar_used, ''), IFNULL(NEW.learning_signal, ''), 1,
+            IFNULL(NEW.engagement_score, 0), IFNULL(NEW.response_length, 0),
+            NEW.engagement_score > 0, CASE WHEN NEW.engagement_score > 0 THEN NEW.engagement_score ELSE 0 END
+        )
+        ON CONFLICT (platform, avatar_used, learning_signal) DO UPDATE SET
+            n = n + 1,
+            sum_engagement = sum_engagement + excluded.sum_engagement,
+            sum_length = sum_length + excluded.sum_length,
+            n_engaged = n_engaged + excluded.n_engaged,
+            sum_engaged = sum_engaged + excluded.sum_engaged;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_interactions_agg_delete AFTER DELETE ON interactions BEGIN
+        UPDATE interaction_aggregates SET
+            n = n - 1,
+            sum_engagement = sum_engagement - IFNULL(OLD.engagement_score, 0),
+            sum_length = sum_length - IFNULL(OLD.response_length, 0),
+            n_engaged = n_engaged - (OLD.engagement_score > 0),
+            sum_engaged = sum_engaged - CASE WHEN OLD.engagement_score > 0 THEN OLD.engagement_score ELSE 0 END
+        WHERE platform = IFNULL(OLD.platform, '') AND avatar_used = IFNULL(OLD.avatar_used, '')
+          AND learning_signal = IFNULL(OLD.learning_signal, '');
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_interactions_agg_update
+    AFTER UPDATE OF platform, avatar_used, learning_signal, engagement_score, response_length ON interactions
+    BEGIN
+        UPDATE interaction_aggregates SET
+            n = n - 1,
+            sum_engagement = sum_engagement - IFNULL(OLD.engagement_score, 0),
+            sum_length = sum_length - IFNULL(OLD.response_length, 0),
+            n_engaged = n_engaged - (OLD.engagement_score > 0),
+            sum_engaged = sum_engaged - CASE WHEN OLD.engagement_score > 0 THEN OLD.engagement_score ELSE 0 END
+        WHERE platform = IFNULL(OLD.platform, '') AND avatar_used = IFNULL(OLD.avatar_used, '')
+          AND learning_signal = IFNULL(OLD.learning_signal, '');
+        INSERT INTO interaction_aggregates
+            (platform, avatar_used, learning_signal, n, sum_engagement, sum_length, n_engaged, sum_engaged)
+        VALUES (
+            IFNULL(NEW.platform, ''), IFNULL(NEW.avatar_used, ''), IFNULL(NEW.learning_signal, ''), 1,
+            IFNULL(NEW.engagement_score, 0), IFNULL(NEW.response_length, 0),
+            NEW.engagement_score > 0, CASE WHEN NEW.engagement_score > 0 THEN NEW.engagement_score ELSE 0 END
+        )
+        ON CONFLICT (platform, avatar_used, learning_signal) DO UPDATE SET
+            n = n + 1,
+            sum_engagement = sum_engagement + excluded.sum_engagement,
+            sum_length = sum_length + excluded.sum_length,
+            n_engaged = n_engaged + excluded.n_engaged,
+            sum_engaged = sum_engaged + excluded.sum_engaged;
+    END;
+"""
+
+_SQL_REBUILD_AGGREGATES = """
+    INSERT INTO interaction_aggregates
+        (platform, avatar_used, learning_signal, n, sum_engagement, sum_length, n_engaged, sum_engaged)
+    SELECT IFNULL(platform, ''), IFNULL(avatar_used, ''), IFNULL(learning_signal, ''), COUNT(*),
+           TOTAL(engagement_score), TOTAL(response_length),
+           SUM(engagement_score > 0), TOTAL(CASE WHEN engagement_score > 0 THEN engagement_score END)
+    FROM interactions
+    GROUP BY 1, 2, 3
+"""
+
+# Fixed statements, reused through each connection's statement cache
+_SQL_INSERT_INTERACTION = """
+    INSERT OR REPLACE INTO interactions
+    (interaction_id, timestamp, claim_text, claim_hash, claim_language, claim_category,
+     avatar_used, platform, is_fake_detected, confidence, astroturfing_score,
+     sources_used, source_count, academic_sources_count, response_text, response_length,
+     features, learning_signal)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_ENGAGEMENT = """
+    UPDATE interactions
+    SET likes = ?, replies = ?, shares = ?, top_comment_achieved = ?,
+        engagement_score = ?, learning_signal = ?
+    WHERE interaction_id = ?
+"""
+_SQL_INSERT_ENGAGEMENT_METRIC = """
+    INSERT INTO engagement_metrics
+    (interaction_id, timestamp, platform, likes, replies, shares, top_comment, engagement_rate)
+    SELECT interaction_id, ?, platform, ?, ?, ?, ?, ?
+    FROM interactions WHERE interaction_id = ?
+"""
+_SQL_EXPERT_FEEDBACK = """
+    UPDATE interactions
+    SET learning_signal = ?, expert_correction = ?
+    WHERE interaction_id = ?
+"""
+_SQL_UPSERT_PATTERN = """
+    INSERT OR REPLACE INTO claim_patterns
+    (pattern_id, pattern_type, keywords, context_signals, confidence,
+     occurrence_count, last_seen, avg_detection_confidence)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_PATTERN_NGRAM = "INSERT OR IGNORE INTO pattern_ngrams (ngram, pattern_id) VALUES (?, ?)"
+
+
 class InteractionLogger:
     """Logs all interactions for ML learning"""
 
-    def __init__(self, db_path: str = "truthshield_ml.db"):
+    def __init__(self, db_path: str = "truthshield_ml.db", store: Optional[MLStore] = None):
         self.db_path = db_path
+        self.store = store or get_store(db_path)
         self._init_db()
 
     def _init_db(self):
         """Initialize SQLite database for interaction logging"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Interactions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS interactions (
-                interaction_id TEXT PRIMARY KEY,
-                timestamp TEXT,
-                claim_text TEXT,
-                claim_hash TEXT,
-                claim_language TEXT,
-                claim_category TEXT,
-                avatar_used TEXT,
-                platform TEXT,
-                is_fake_detected INTEGER,
-                confidence REAL,
-                astroturfing_score REAL,
-                sources_used TEXT,
-                source_count INTEGER,
-                academic_sources_count INTEGER,
-                response_text TEXT,
-                response_length INTEGER,
-                features TEXT,
-                engagement_score REAL DEFAULT 0,
-                likes INTEGER DEFAULT 0,
-                replies INTEGER DEFAULT 0,
-                shares INTEGER DEFAULT 0,
-                top_comment_achieved INTEGER DEFAULT 0,
-                learning_signal TEXT DEFAULT 'neutral',
-                expert_correction TEXT,
-                user_feedback TEXT
-            )
-        """)
-
-        # Claim patterns table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS claim_patterns (
-                pattern_id TEXT PRIMARY KEY,
-                pattern_type TEXT,
-                keywords TEXT,
-                context_signals TEXT,
-                confidence REAL,
-                occurrence_count INTEGER,
-                last_seen TEXT,
-                avg_detection_confidence REAL
-            )
-        """)
-
-        # Model performance table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS model_performance (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
-                model_name TEXT,
-                accuracy REAL,
-                precision_score REAL,
-                recall_score REAL,
-                f1_score REAL,
-                sample_count INTEGER
-            )
-        """)
-
-        # Engagement metrics table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS engagement_metrics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                interaction_id TEXT,
-                timestamp TEXT,
-                platform TEXT,
-                likes INTEGER,
-                replies INTEGER,
-                shares INTEGER,
-                top_comment INTEGER,
-                engagement_rate REAL,
-                FOREIGN KEY (interaction_id) REFERENCES interactions(interaction_id)
-            )
-        """)
-
-        conn.commit()
-        conn.close()
+        self.store.executescript(_SCHEMA)
+        self._backfill_aggregates()
         logger.info(f"✅ ML database initialized at {self.db_path}")
 
-    def log_interaction(self, record: InteractionRecord) -> str:
-        """Log a new interaction"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO interactions
-            (interaction_id, timestamp, claim_text, claim_hash, claim_language, claim_category,
-             avatar_used, platform, is_fake_detected, confidence, astroturfing_score,
-             sources_used, source_count, academic_sources_count, response_text, response_length,
-             features, learning_signal)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    def _backfill_aggregates(self) -> None:
+        """Build ``interaction_aggregates`` for databases created before it existed"""
+        self.store.flush()
+        conn = self.store._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if (conn.execute("SELECT 1 FROM interaction_aggregates LIMIT 1").fetchone() is None
+                    and conn.execute("SELECT 1 FROM interactions LIMIT 1").fetchone() is not None):
+                conn.execute(_SQL_REBUILD_AGGREGATES)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _interaction_row(record: InteractionRecord) -> tuple:
+        return (
             record.interaction_id,
             record.timestamp,
             record.claim_text,
@@ -272,41 +583,28 @@ class InteractionLogger:
             record.response_length,
             json.dumps(record.features),
             record.learning_signal
-        ))
-
-        conn.commit()
-        conn.close()
+        )
 
+    def log_interaction(self, record: InteractionRecord) -> str:
+        """Log a new interaction"""
+        self.store.write(_SQL_INSERT_INTERACTION, self._interaction_row(record))
         logger.info(f"📝 Logged interaction {record.interaction_id}")
         return record.interaction_id
 
+    def log_interactions(self, records: List[InteractionRecord]) -> List[str]:
+        """Log many interactions in one batched write"""
+        for record in records:
+            self.store.write(_SQL_INSERT_INTERACTION, self._interaction_row(record))
+        self.store.flush()
+        return [r.interaction_id for r in records]
+
     def update_engagement(self, interaction_id: str, likes: int, replies: int,
                          shares: int, top_comment: bool) -> None:
         """Update engagement metrics for an interaction"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         # Calculate engagement score (weighted)
         engagement_score = (likes * 1.0 + replies * 2.0 + shares * 3.0 +
                           (10.0 if top_comment else 0)) / 16.0  # Normalized to ~0-1
 
-        # Update interaction
-        cursor.execute("""
-            UPDATE interactions
-            SET likes = ?, replies = ?, shares = ?, top_comment_achieved = ?,
-                engagement_score = ?
-            WHERE interaction_id = ?
-        """, (likes, replies, shares, int(top_comment), engagement_score, interaction_id))
-
-        # Log to engagement metrics
-        cursor.execute("""
-            INSERT INTO engagement_metrics
-            (interaction_id, timestamp, platform, likes, replies, shares, top_comment, engagement_rate)
-            SELECT interaction_id, ?, platform, ?, ?, ?, ?, ?
-            FROM interactions WHERE interaction_id = ?
-        """, (datetime.utcnow().isoformat(), likes, replies, shares, int(top_comment),
-              engagement_score, interaction_id))
-
         # Update learning signal based on engagement
         if engagement_score > 0.7:
             learning_signal = LearningSignal.POSITIVE.value
@@ -315,51 +613,42 @@ class InteractionLogger:
         else:
             learning_signal = LearningSignal.NEUTRAL.value
 
-        cursor.execute("""
-            UPDATE interactions SET learning_signal = ? WHERE interaction_id = ?
-        """, (learning_signal, interaction_id))
+        # Update interaction
+        self.store.write(_SQL_UPDATE_ENGAGEMENT, (
+            likes, replies, shares, int(top_comment), engagement_score, learning_signal, interaction_id
+        ))
 
-        conn.commit()
-        conn.close()
+        # Log to engagement metrics
+        self.store.write(_SQL_INSERT_ENGAGEMENT_METRIC, (
+            datetime.utcnow().isoformat(), likes, replies, shares, int(top_comment),
+            engagement_score, interaction_id
+        ))
 
         logger.info(f"📊 Updated engagement for {interaction_id}: score={engagement_score:.2f}, signal={learning_signal}")
 
     def add_expert_feedback(self, interaction_id: str, is_correct: bool,
                            correction: Optional[str] = None) -> None:
         """Add expert verification/correction"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         if is_correct:
             learning_signal = LearningSignal.EXPERT_VERIFIED.value
         else:
             learning_signal = LearningSignal.EXPERT_CORRECTED.value
 
-        cursor.execute("""
-            UPDATE interactions
-            SET learning_signal = ?, expert_correction = ?
-            WHERE interaction_id = ?
-        """, (learning_signal, correction, interaction_id))
-
-        conn.commit()
-        conn.close()
+        self.store.write(_SQL_EXPERT_FEEDBACK, (learning_signal, correction, interaction_id))
 
         logger.info(f"👨‍🔬 Expert feedback added for {interaction_id}: {'correct' if is_correct else 'corrected'}")
 
     def get_training_data(self, signal_filter: Optional[str] = None,
                          limit: int = 1000) -> List[Dict]:
         """Get labeled training data"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         if signal_filter:
-            cursor.execute("""
+            cursor = self.store.query("""
                 SELECT * FROM interactions
                 WHERE learning_signal = ?
                 ORDER BY timestamp DESC LIMIT ?
             """, (signal_filter, limit))
         else:
-            cursor.execute("""
+            cursor = self.store.query("""
                 SELECT * FROM interactions
                 WHERE learning_signal != 'neutral'
                 ORDER BY timestamp DESC LIMIT ?
@@ -367,26 +656,55 @@ class InteractionLogger:
 
         columns = [desc[0] for desc in cursor.description]
         rows = cursor.fetchall()
-        conn.close()
 
         return [dict(zip(columns, row)) for row in rows]
 
 
 class PatternLearner:
-    """Learns patterns from claims for better detection"""
+    """Learns patterns from claims for better detection.
 
-    def __init__(self, db_path: str = "truthshield_ml.db"):
+    Keywords are mirrored in the ``pattern_ngrams`` table. Similarity counts a
+    keyword when it occurs anywhere in the claim, even inside longer words
+    ("vaccines cause" in "vaccines causes"), so the in-memory index is keyed
+    by each keyword's second word: wherever a keyword occurs, its second word
+    starts a claim word. A query looks up every prefix of every claim word and
+    only scores the patterns found.
+    """
+
+    def __init__(self, db_path: str = "truthshield_ml.db", store: Optional[MLStore] = None):
         self.db_path = db_path
+        self.store = store or get_store(db_path)
         self.patterns: Dict[str, ClaimPattern] = {}
+        self._anchor_index: Dict[str, set] = defaultdict(set)
+        self._order: Dict[str, int] = {}
+        self._index_lock = threading.Lock()
         self._load_patterns()
 
+    @staticmethod
+    def _ngrams(text: str) -> List[str]:
+        """2-word then 3-word phrases of the lowercased text"""
+        words = text.lower().split()
+        grams = [" ".join(words[i:i+2]) for i in range(len(words) - 1)]
+        grams += [" ".join(words[i:i+3]) for i in range(len(words) - 2)]
+        return grams
+
+    def _add_pattern(self, pattern: ClaimPattern) -> None:
+        with self._index_lock:
+            self._order[pattern.pattern_id] = len(self._order)
+            self.patterns[pattern.pattern_id] = pattern
+            for kw in pattern.keywords:
+                words = kw.split()
+                if len(words) > 1:
+                    self._anchor_index[words[1]].add(pattern.pattern_id)
+
     def _load_patterns(self):
         """Load existing patterns from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM claim_patterns")
-        for row in cursor.fetchall():
+        try:
+            self.store.executescript(_SCHEMA)
+            rows = self.store.query("SELECT * FROM claim_patterns").fetchall()
+        except sqlite3.OperationalError:
+            rows = []  # Table might not exist yet
+        for row in rows:
             pattern = ClaimPattern(
                 pattern_id=row[0],
                 pattern_type=row[1],
@@ -397,21 +715,22 @@ class PatternLearner:
                 last_seen=row[6],
                 avg_detection_confidence=row[7]
             )
-            self.patterns[pattern.pattern_id] = pattern
+            self._add_pattern(pattern)
+
+        # Backfill the n-gram table for patterns learned before it existed
+        if rows:
+            indexed = self.store.query("SELECT COUNT(DISTINCT pattern_id) FROM pattern_ngrams").fetchone()[0]
+            if indexed < len(self.patterns):
+                for pattern in self.patterns.values():
+                    self._save_ngrams(pattern)
+                self.store.flush()
 
-        conn.close()
         logger.info(f"📚 Loaded {len(self.patterns)} claim patterns")
 
     def learn_pattern(self, claim: str, claim_type: str, confidence: float) -> str:
         """Learn a new pattern or update existing one"""
-        # Extract key phrases
-        words = claim.lower().split()
-        # Simple n-gram extraction (2-3 word phrases)
-        keywords = []
-        for i in range(len(words) - 1):
-            keywords.append(" ".join(words[i:i+2]))
-        for i in range(len(words) - 2):
-            keywords.append(" ".join(words[i:i+3]))
+        # Extract key phrases (2-3 word n-grams)
+        keywords = self._ngrams(claim)
 
         # Create pattern ID from keywords hash
         pattern_hash = hashlib.md5(" ".join(sorted(keywords[:5])).encode()).hexdigest()[:12]
@@ -438,24 +757,22 @@ class PatternLearner:
                 last_seen=datetime.utcnow().isoformat(),
                 avg_detection_confidence=confidence
             )
-            self.patterns[pattern_id] = pattern
+            self._add_pattern(pattern)
+            self._save_ngrams(pattern)
 
         # Save to database
         self._save_pattern(pattern)
 
         return pattern_id
 
+    def _save_ngrams(self, pattern: ClaimPattern):
+        """Mirror a pattern's keywords into the n-gram table"""
+        for kw in set(pattern.keywords):
+            self.store.write(_SQL_INSERT_PATTERN_NGRAM, (kw, pattern.pattern_id))
+
     def _save_pattern(self, pattern: ClaimPattern):
         """Save pattern to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO claim_patterns
-            (pattern_id, pattern_type, keywords, context_signals, confidence,
-             occurrence_count, last_seen, avg_detection_confidence)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self.store.write(_SQL_UPSERT_PATTERN, (
             pattern.pattern_id,
             pattern.pattern_type,
             json.dumps(pattern.keywords),
@@ -466,15 +783,29 @@ class PatternLearner:
             pattern.avg_detection_confidence
         ))
 
-        conn.commit()
-        conn.close()
+    def candidate_patterns(self, claim: str) -> List[ClaimPattern]:
+        """Every pattern with a keyword that may occur in the claim, in learn order"""
+        ids = set()
+        with self._index_lock:
+            for word in set(claim.lower().split()):
+                for end in range(1, len(word) + 1):
+                    ids |= self._anchor_index.get(word[:end], set())
+            order = self._order
+            return [self.patterns[pid] for pid in sorted(ids, key=order.__getitem__)]
 
     def find_similar_patterns(self, claim: str, threshold: float = 0.3) -> List[ClaimPattern]:
         """Find patterns similar to a claim"""
         claim_lower = claim.lower()
         similar = []
 
-        for pattern in self.patterns.values():
+        # Patterns outside the candidates have no keyword in the claim, so
+        # only a non-positive threshold needs the full scan
+        if threshold > 0:
+            candidates = self.candidate_patterns(claim)
+        else:
+            candidates = list(self.patterns.values())
+
+        for pattern in candidates:
             # Calculate keyword overlap
             matches = sum(1 for kw in pattern.keywords if kw in claim_lower)
             similarity = matches / max(len(pattern.keywords), 1)
@@ -490,27 +821,26 @@ class PatternLearner:
 class ResponseOptimizer:
     """Optimizes responses based on learned engagement patterns"""
 
-    def __init__(self, db_path: str = "truthshield_ml.db"):
+    def __init__(self, db_path: str = "truthshield_ml.db", store: Optional[MLStore] = None):
         self.db_path = db_path
+        self.store = store or get_store(db_path)
         self.engagement_weights = self._load_engagement_weights()
 
     def _load_engagement_weights(self) -> Dict[str, Dict[str, float]]:
         """Load learned engagement weights per platform/avatar"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         weights = defaultdict(lambda: defaultdict(float))
 
         try:
-            # Get average engagement by platform and avatar
-            cursor.execute("""
-                SELECT platform, avatar_used,
-                       AVG(engagement_score) as avg_engagement,
-                       AVG(response_length) as avg_length,
-                       COUNT(*) as count
-                FROM interactions
+            # Average engagement by platform and avatar, from the running aggregates
+            cursor = self.store.query("""
+                SELECT NULLIF(platform, ''), NULLIF(avatar_used, ''),
+                       SUM(sum_engagement) / SUM(n) as avg_engagement,
+                       SUM(sum_length) / SUM(n) as avg_length,
+                       SUM(n) as count
+                FROM interaction_aggregates
                 WHERE learning_signal IN ('positive', 'expert_verified')
                 GROUP BY platform, avatar_used
+                HAVING SUM(n) > 0
             """)
 
             for row in cursor.fetchall():
@@ -522,7 +852,6 @@ class ResponseOptimizer:
         except sqlite3.OperationalError:
             pass  # Table might not exist yet
 
-        conn.close()
         return dict(weights)
 
     def get_optimal_response_params(self, platform: str, avatar: str) -> Dict[str, Any]:
@@ -575,9 +904,10 @@ class TruthShieldMLSystem:
 
     def __init__(self, db_path: str = "truthshield_ml.db"):
         self.db_path = db_path
-        self.logger = InteractionLogger(db_path)
-        self.pattern_learner = PatternLearner(db_path)
-        self.response_optimizer = ResponseOptimizer(db_path)
+        self.store = get_store(db_path)
+        self.logger = InteractionLogger(db_path, store=self.store)
+        self.pattern_learner = PatternLearner(db_path, store=self.store)
+        self.response_optimizer = ResponseOptimizer(db_path, store=self.store)
         self.feature_extractor = FeatureExtractor()
 
     async def record_fact_check(self,
@@ -591,8 +921,19 @@ class TruthShieldMLSystem:
                                sources: List[str],
                                response: str,
                                category: str = "unknown") -> str:
-        """Record a fact-check interaction for learning"""
+        """Record a fact-check interaction for learning.
+
+        Feature extraction and the database writes run on the store's
+        executor thread, so the event loop is not blocked.
+        """
+        return await self.store.run(
+            self._record_fact_check_sync, claim, language, avatar, platform, is_fake,
+            confidence, astroturfing_score, sources, response, category
+        )
 
+    def _record_fact_check_sync(self, claim: str, language: str, avatar: str, platform: str,
+                                is_fake: bool, confidence: float, astroturfing_score: float,
+                                sources: List[str], response: str, category: str = "unknown") -> str:
         # Generate interaction ID
         interaction_id = f"fc_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}_{hashlib.md5(claim.encode()).hexdigest()[:8]}"
 
@@ -641,6 +982,10 @@ class TruthShieldMLSystem:
                                     likes: int, replies: int,
                                     shares: int, top_comment: bool) -> None:
         """Update learning with engagement metrics"""
+        await self.store.run(self._update_with_engagement_sync, interaction_id, likes, replies, shares, top_comment)
+
+    def _update_with_engagement_sync(self, interaction_id: str, likes: int, replies: int,
+                                     shares: int, top_comment: bool) -> None:
         self.logger.update_engagement(interaction_id, likes, replies, shares, top_comment)
 
         # Refresh optimizer weights
@@ -666,57 +1011,59 @@ class TruthShieldMLSystem:
         return self.response_optimizer.get_optimal_response_params(platform, avatar)
 
     def get_learning_stats(self) -> Dict[str, Any]:
-        """Get statistics about ML learning"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Get statistics about ML learning.
 
+        Interaction figures come from ``interaction_aggregates`` (one row per
+        platform/avatar/signal), not from scanning ``interactions``.
+        """
+        query = self.store.query
         stats = {}
 
         try:
             # Total interactions
-            cursor.execute("SELECT COUNT(*) FROM interactions")
-            stats["total_interactions"] = cursor.fetchone()[0]
+            stats["total_interactions"] = query(
+                "SELECT IFNULL(SUM(n), 0) FROM interaction_aggregates"
+            ).fetchone()[0]
 
             # By learning signal
-            cursor.execute("""
-                SELECT learning_signal, COUNT(*)
-                FROM interactions
+            stats["by_signal"] = dict(query("""
+                SELECT NULLIF(learning_signal, ''), SUM(n)
+                FROM interaction_aggregates
                 GROUP BY learning_signal
-            """)
-            stats["by_signal"] = dict(cursor.fetchall())
+                HAVING SUM(n) > 0
+            """).fetchall())
 
             # By platform
-            cursor.execute("""
-                SELECT platform, COUNT(*), AVG(engagement_score)
-                FROM interactions
+            rows = query("""
+                SELECT NULLIF(platform, ''), SUM(n), SUM(sum_engagement) / SUM(n)
+                FROM interaction_aggregates
                 GROUP BY platform
-            """)
+                HAVING SUM(n) > 0
+            """).fetchall()
             stats["by_platform"] = {row[0]: {"count": row[1], "avg_engagement": row[2]}
-                                   for row in cursor.fetchall()}
+                                   for row in rows}
 
             # Total patterns learned
-            cursor.execute("SELECT COUNT(*) FROM claim_patterns")
-            stats["patterns_learned"] = cursor.fetchone()[0]
+            stats["patterns_learned"] = query("SELECT COUNT(*) FROM claim_patterns").fetchone()[0]
 
             # Average engagement by avatar
-            cursor.execute("""
-                SELECT avatar_used, AVG(engagement_score), COUNT(*)
-                FROM interactions
-                WHERE engagement_score > 0
+            rows = query("""
+                SELECT NULLIF(avatar_used, ''), SUM(sum_engaged) / SUM(n_engaged), SUM(n_engaged)
+                FROM interaction_aggregates
                 GROUP BY avatar_used
-            """)
+                HAVING SUM(n_engaged) > 0
+            """).fetchall()
             stats["avatar_performance"] = {row[0]: {"avg_engagement": row[1], "count": row[2]}
-                                          for row in cursor.fetchall()}
+                                          for row in rows}
 
         except sqlite3.OperationalError as e:
             stats["error"] = str(e)
 
-        conn.close()
         return stats
 
 
-# Global ML system instance
-ml_system = TruthShieldMLSystem()
+# Global ML system instance (constructed on first use, see src/core/startup.py)
+ml_system = LazySubsystem("ml_system", TruthShieldMLSystem)
 
 
 async def record_interaction(claim: str, language: str, avatar: str, platform: str,
@@ -1,15 +1,30 @@
-from typing import List, Dict, Tuple
-from collections import defaultdict
+from array import array
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 
-def build_co_posting_graph(items: List[Dict]) -> Dict[str, Dict[str, int]]:
-    """Simple adjacency map where edges connect authors who posted same signature."""
+
+def build_co_posting_graph(items: List[Dict], near_duplicates: bool = False) -> Dict[str, Dict[str, int]]:
+    """Simple adjacency map where edges connect authors who posted same signature.
+
+    With ``near_duplicates`` near-identical texts share a signature (MinHash
+    LSH, see ``src/core/signatures.py``). Quadratic in bucket size; for large
+    or streaming inputs use CoPostingGraph.
+    """
     # Compute signature buckets
     from .temporal import text_signature
 
+    signature_fn = text_signature
+    if near_duplicates:
+        from .signatures import NearDuplicateIndex
+
+        signature_fn = NearDuplicateIndex().canonical
+
     sig_to_authors: Dict[str, List[str]] = defaultdict(list)
     for it in items:
-        sig = text_signature(it.get("content_text") or "")
+        sig = signature_fn(it.get("content_text") or "")
         author = (it.get("author_username") or "").lower()
         if sig and author:
             sig_to_authors[sig].append(author)
@@ -48,3 +63,273 @@ def connected_components(adj: Dict[str, Dict[str, int]], min_weight: int = 1) ->
     return comps
 
 
+
+
+# ---------------------------------------------------------------------------
+# Scalable co-posting graph
+# ---------------------------------------------------------------------------
+# build_co_posting_graph() above expands every signature bucket into a clique,
+# which is O(k²) per bucket: one copy-paste campaign with 5,000 accounts yields
+# 12.5M dict entries. CoPostingGraph keeps memory linear instead:
+#   - authors are interned to dense integer ids,
+#   - small buckets are expanded into pairwise edges (stored in flat int
+#     arrays, exported as CSR),
+#   - buckets above ``hub_threshold`` members (or any bucket once the edge
+#     budget is spent) are kept as a star/hub: just the member id list,
+#   - components come from a union-find over edges and hubs,
+#   - buckets are evicted least recently used first past ``max_buckets`` /
+#     ``max_members``, so a long-running graph stays bounded.
+
+
+class UnionFind:
+    """Disjoint-set forest over dense integer ids (path halving, union by size)."""
+
+    def __init__(self, n: int = 0) -> None:
+        self.parent = array("q", range(n))
+        self.size = array("q", [1]) * n
+
+    def add(self) -> int:
+        i = len(self.parent)
+        self.parent.append(i)
+        self.size.append(1)
+        return i
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> int:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        return ra
+
+
+@dataclass
+class CSRAdjacency:
+    """Symmetric weighted adjacency in compressed sparse row form.
+
+    Neighbours of node ``u`` are ``indices[indptr[u]:indptr[u + 1]]`` with the
+    matching ``weights`` slice.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def from_edges(cls, n: int, src: np.ndarray, dst: np.ndarray) -> "CSRAdjacency":
+        """Build from undirected edge endpoints; repeated edges add up to weights."""
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        keys, counts = np.unique(rows * max(n, 1) + cols, return_counts=True)
+        rows_u = keys // max(n, 1)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows_u, minlength=n), out=indptr[1:])
+        return cls(
+            indptr=indptr,
+            indices=(keys % max(n, 1)).astype(np.int32),
+            weights=counts.astype(np.int32),
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices) // 2
+
+    def neighbors(self, u: int) -> Tuple[np.ndarray, np.ndarray]:
+        lo, hi = self.indptr[u], self.indptr[u + 1]
+        return self.indices[lo:hi], self.weights[lo:hi]
+
+    def degree(self, u: int) -> int:
+        return int(self.indptr[u + 1] - self.indptr[u])
+
+
+class _Bucket:
+    __slots__ = ("members", "seen", "hub", "paired")
+
+    def __init__(self) -> None:
+        self.members = array("q")
+        self.seen: set = set()
+        self.hub = False
+        self.paired = 0  # leading members expanded into pairwise edges
+
+
+class CoPostingGraph:
+    """Incremental author co-posting graph with bounded memory.
+
+    Feed posts with :meth:`add` (or :meth:`add_items`). Authors sharing a
+    signature are linked; repeated co-posting across signatures raises the
+    edge weight. Buckets larger than ``hub_threshold`` stop growing edges and
+    are kept as hubs, and no more than ``max_edges`` pairwise edges are ever
+    stored.
+
+    At most ``max_buckets`` signatures and ``max_members`` bucket entries are
+    kept: past either cap the least recently posted-to buckets are evicted
+    with their edges, and authors left in no bucket are forgotten, so a
+    long-running graph covers a sliding window of recent signatures.
+
+    In :meth:`components`, hub members are always connected: a bucket that
+    large is coordination evidence on its own, whatever ``min_weight`` is.
+    ``min_weight`` applies to pairwise edges from small buckets.
+    """
+
+    def __init__(
+        self,
+        hub_threshold: int = 64,
+        max_edges: int = 5_000_000,
+        max_buckets: int = 1_000_000,
+        max_members: int = 10_000_000,
+    ) -> None:
+        self.hub_threshold = max(2, int(hub_threshold))
+        self.max_edges = int(max_edges)
+        self.max_buckets = max(1, int(max_buckets))
+        self.max_members = max(1, int(max_members))
+        self.author_ids: Dict[str, int] = {}
+        self.authors: List[Optional[str]] = []
+        self._free_ids: List[int] = []
+        self._refs = array("q")  # buckets each author id is a member of
+        self._buckets: "OrderedDict[str, _Bucket]" = OrderedDict()
+        self._num_edges = 0
+        self._num_members = 0
+        self.evicted = 0
+
+    def _author_id(self, author: str) -> int:
+        aid = self.author_ids.get(author)
+        if aid is None:
+            if self._free_ids:
+                aid = self._free_ids.pop()
+                self.authors[aid] = author
+            else:
+                aid = len(self.authors)
+                self.authors.append(author)
+                self._refs.append(0)
+            self.author_ids[author] = aid
+        return aid
+
+    def _release_author(self, aid: int) -> None:
+        self._refs[aid] -= 1
+        if not self._refs[aid]:
+            del self.author_ids[self.authors[aid]]
+            self.authors[aid] = None
+            self._free_ids.append(aid)
+
+    def _evict_oldest(self) -> None:
+        _, bucket = self._buckets.popitem(last=False)
+        self._num_edges -= bucket.paired * (bucket.paired - 1) // 2
+        self._num_members -= len(bucket.members)
+        for aid in bucket.members:
+            self._release_author(aid)
+        self.evicted += 1
+
+    def add(self, author: str, signature: str) -> None:
+        author = (author or "").lower()
+        if not signature or not author:
+            return
+        bucket = self._buckets.get(signature)
+        if bucket is None:
+            while len(self._buckets) >= self.max_buckets:
+                self._evict_oldest()
+            bucket = self._buckets[signature] = _Bucket()
+        else:
+            self._buckets.move_to_end(signature)
+        aid = self.author_ids.get(author)
+        if aid is not None and aid in bucket.seen:
+            return
+        while self._num_members >= self.max_members and len(self._buckets) > 1:
+            self._evict_oldest()
+        if self._num_members >= self.max_members:
+            return  # this bucket alone fills the budget
+        aid = self._author_id(author)
+        members = bucket.members
+        if not bucket.hub:
+            if len(members) >= self.hub_threshold or self._num_edges + len(members) > self.max_edges:
+                bucket.hub = True
+            else:
+                self._num_edges += len(members)
+                bucket.paired += 1
+        members.append(aid)
+        bucket.seen.add(aid)
+        self._refs[aid] += 1
+        self._num_members += 1
+
+    def add_items(self, items: Iterable[Dict], signature_fn: Optional[Callable[[str], str]] = None) -> None:
+        if signature_fn is None:
+            from .temporal import text_signature as signature_fn
+        for it in items:
+            self.add(it.get("author_username") or "", signature_fn(it.get("content_text") or ""))
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.authors)
+
+    @property
+    def num_buckets(self) -> int:
+        return len(self._buckets)
+
+    @property
+    def hubs(self) -> List[List[str]]:
+        return [
+            [self.authors[a] for a in bucket.members]
+            for bucket in self._buckets.values() if bucket.hub
+        ]
+
+    def adjacency(self) -> CSRAdjacency:
+        """Pairwise edges (small buckets only) as CSR arrays."""
+        src, dst = [], []
+        for bucket in self._buckets.values():
+            if bucket.paired > 1:
+                ids = np.frombuffer(bucket.members, dtype=np.int64)[:bucket.paired]
+                i, j = np.triu_indices(bucket.paired, 1)
+                src.append(ids[i])
+                dst.append(ids[j])
+        empty = np.zeros(0, dtype=np.int64)
+        return CSRAdjacency.from_edges(
+            self.num_nodes,
+            np.concatenate(src) if src else empty,
+            np.concatenate(dst) if dst else empty,
+        )
+
+    def components(self, min_weight: int = 1, min_size: int = 2) -> List[List[str]]:
+        """Connected author groups with at least ``min_size`` members, largest first."""
+        uf = UnionFind(self.num_nodes)
+        linked = np.zeros(self.num_nodes, dtype=bool)
+        if min_weight <= 1:
+            # A chain over the paired members links the same set as their clique
+            for bucket in self._buckets.values():
+                if bucket.paired > 1:
+                    paired = bucket.members[:bucket.paired]
+                    for m in paired:
+                        uf.union(paired[0], m)
+                    linked[list(paired)] = True
+        elif self._num_edges:
+            csr = self.adjacency()
+            rows = np.repeat(np.arange(self.num_nodes), np.diff(csr.indptr))
+            keep = (csr.weights >= min_weight) & (rows < csr.indices)
+            for a, b in zip(rows[keep].tolist(), csr.indices[keep].tolist()):
+                uf.union(a, b)
+                linked[a] = linked[b] = True
+        for bucket in self._buckets.values():
+            if bucket.hub:
+                members = bucket.members
+                for m in members:
+                    uf.union(members[0], m)
+                linked[list(members)] = True
+
+        groups: Dict[int, List[str]] = defaultdict(list)
+        for aid in np.flatnonzero(linked).tolist():
+            groups[uf.find(aid)].append(self.authors[aid])
+        comps = [g for g in groups.values() if len(g) >= min_size]
+        comps.sort(key=len, reverse=True)
+        return comps
@@ -1,6 +1,8 @@
-from typing import Dict
+from typing import Dict, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class PrioritizedItem:
@@ -89,4 +91,29 @@ class PrioritizationEngine:
             },
         )
 
+    def prioritize_batch(
+        self,
+        views: np.ndarray,
+        growth_rate_24h: np.ndarray,
+        author_followers: np.ndarray,
+        follower_spike_24h: np.ndarray,
+        coordination_score: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized pool membership and priority.
 
+        Returns ``(in_track_pool, in_account_pool, priority)`` arrays; the
+        watchlist flag is ``in_track_pool | in_account_pool``.
+        """
+        in_track_pool = (views >= self.track_pool_min_views) | (
+            growth_rate_24h >= self.track_pool_min_growth_rate_24h
+        )
+        in_account_pool = (author_followers >= self.account_pool_min_followers) | (
+            follower_spike_24h >= self.account_pool_min_follower_spike_24h
+        )
+        watchlist = in_track_pool | in_account_pool
+        priority = np.where(
+            watchlist & (coordination_score >= self.coordination_min_score),
+            "high",
+            np.where(watchlist, "medium", "low"),
+        )
+        return in_track_pool, in_account_pool, priority
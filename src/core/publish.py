@@ -1,50 +1,216 @@
 import json
+import sqlite3
+import threading
+import time
+import uuid
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
 class PublishQueue:
-    """File-backed publish queue for auto-posts (mock processing)."""
+    """SQLite-backed publish queue for auto-posts (mock processing).
 
-    def __init__(self, path: str = "demo_data/publish_queue.json") -> None:
+    Runs in WAL mode so several API workers and a separate publisher process
+    can share one queue file. Each entry is a single row keyed by a random id:
+    enqueue, claim and ack are one short transaction each, status updates hit
+    the primary key, and listing by status uses the ``(status, seq)`` index.
+
+    Workers ``claim`` entries for ``visibility_timeout`` seconds; an entry that
+    is not acked in time becomes claimable again.
+    """
+
+    QUEUED = "queued"
+    CLAIMED = "claimed"
+
+    def __init__(
+        self,
+        path: str = "demo_data/publish_queue.db",
+        visibility_timeout: float = 300.0,
+    ) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.path.exists():
-            self._write({"items": []})
+        self.visibility_timeout = float(visibility_timeout)
+        self._local = threading.local()
+        self._init_db()
+        self._import_legacy_json()
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite3 connections are not thread-safe.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS publish_queue (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                id TEXT NOT NULL UNIQUE,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                processed_at TEXT,
+                claimed_by TEXT,
+                visible_at REAL NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                item TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_publish_queue_status ON publish_queue(status, seq)"
+        )
 
-    def _read(self) -> Dict:
+    def _import_legacy_json(self) -> None:
+        """Import entries from the old ``publish_queue.json`` document into an empty queue."""
+        legacy = self.path.with_suffix(".json")
+        if not legacy.exists():
+            return
         try:
-            return json.loads(self.path.read_text(encoding="utf-8"))
+            items = json.loads(legacy.read_text(encoding="utf-8")).get("items", [])
         except Exception:
-            return {"items": []}
+            return
+        conn = self._conn()
+        if not items or conn.execute("SELECT 1 FROM publish_queue LIMIT 1").fetchone():
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for e in items:
+                conn.execute(
+                    "INSERT OR IGNORE INTO publish_queue (id, status, created_at, processed_at, item) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        e.get("id") or self._new_id(),
+                        e.get("status") or self.QUEUED,
+                        e.get("created_at") or datetime.utcnow().isoformat(),
+                        e.get("processed_at"),
+                        json.dumps(e.get("item") or {}, ensure_ascii=False),
+                    ),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
-    def _write(self, obj: Dict) -> None:
-        self.path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+    @staticmethod
+    def _new_id() -> str:
+        return f"q_{uuid.uuid4().hex}"
 
-    def list(self) -> List[Dict]:
-        return self._read().get("items", [])
+    @staticmethod
+    def _row_to_entry(row: sqlite3.Row) -> Dict:
+        entry = {
+            "id": row["id"],
+            "status": row["status"],
+            "created_at": row["created_at"],
+            "item": json.loads(row["item"]),
+        }
+        if row["processed_at"]:
+            entry["processed_at"] = row["processed_at"]
+        if row["claimed_by"]:
+            entry["claimed_by"] = row["claimed_by"]
+            entry["attempts"] = row["attempts"]
+        return entry
+
+    def list(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        sql = "SELECT * FROM publish_queue"
+        params: list = []
+        if status:
+            sql += " WHERE status = ?"
+            params.append(status)
+        sql += " ORDER BY seq"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [self._row_to_entry(r) for r in self._conn().execute(sql, params)]
+
+    def get(self, entry_id: str) -> Optional[Dict]:
+        row = self._conn().execute(
+            "SELECT * FROM publish_queue WHERE id = ?", (entry_id,)
+        ).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._conn().execute(
+            "SELECT status, COUNT(*) FROM publish_queue GROUP BY status"
+        ).fetchall()
+        return {status: n for status, n in rows}
 
     def enqueue(self, item: Dict) -> Dict:
-        obj = self._read()
         entry = {
-            "id": f"q_{int(datetime.utcnow().timestamp()*1000)}",
-            "status": "queued",
+            "id": self._new_id(),
+            "status": self.QUEUED,
             "created_at": datetime.utcnow().isoformat(),
             "item": item,
         }
-        obj["items"].append(entry)
-        self._write(obj)
+        self._conn().execute(
+            "INSERT INTO publish_queue (id, status, created_at, item) VALUES (?, ?, ?, ?)",
+            (entry["id"], entry["status"], entry["created_at"], json.dumps(item, ensure_ascii=False)),
+        )
         return entry
 
-    def mark_processed(self, entry_id: str, status: str = "posted") -> bool:
-        obj = self._read()
-        for e in obj.get("items", []):
-            if e.get("id") == entry_id:
-                e["status"] = status
-                e["processed_at"] = datetime.utcnow().isoformat()
-                self._write(obj)
-                return True
-        return False
+    def claim(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        visibility_timeout: Optional[float] = None,
+    ) -> List[Dict]:
+        """Atomically claim up to ``limit`` entries for ``worker_id``.
 
+        Picks queued entries plus claimed entries whose visibility timeout has
+        expired (crashed or stalled workers), oldest first.
+        """
+        now = time.time()
+        visible_at = now + (self.visibility_timeout if visibility_timeout is None else float(visibility_timeout))
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT seq FROM publish_queue "
+                "WHERE status = ? OR (status = ? AND visible_at <= ?) "
+                "ORDER BY seq LIMIT ?",
+                (self.QUEUED, self.CLAIMED, now, int(limit)),
+            ).fetchall()
+            seqs = [r["seq"] for r in rows]
+            claimed = []
+            for seq in seqs:
+                conn.execute(
+                    "UPDATE publish_queue SET status = ?, claimed_by = ?, visible_at = ?, "
+                    "attempts = attempts + 1 WHERE seq = ?",
+                    (self.CLAIMED, worker_id, visible_at, seq),
+                )
+                claimed.append(self._row_to_entry(
+                    conn.execute("SELECT * FROM publish_queue WHERE seq = ?", (seq,)).fetchone()
+                ))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return claimed
+
+    def ack(self, entry_id: str, status: str = "posted", worker_id: Optional[str] = None) -> bool:
+        """Finish a claimed entry. With ``worker_id`` the ack only succeeds if
+        that worker still holds the claim (i.e. it has not timed out and been
+        re-claimed by someone else)."""
+        sql = "UPDATE publish_queue SET status = ?, processed_at = ? WHERE id = ?"
+        params: list = [status, datetime.utcnow().isoformat(), entry_id]
+        if worker_id is not None:
+            sql += " AND status = ? AND claimed_by = ?"
+            params += [self.CLAIMED, worker_id]
+        return self._conn().execute(sql, params).rowcount == 1
 
+    def release(self, entry_id: str, worker_id: Optional[str] = None) -> bool:
+        """Return a claimed entry to the queue immediately (e.g. on a retryable error)."""
+        sql = "UPDATE publish_queue SET status = ?, claimed_by = NULL, visible_at = 0 WHERE id = ? AND status = ?"
+        params: list = [self.QUEUED, entry_id, self.CLAIMED]
+        if worker_id is not None:
+            sql += " AND claimed_by = ?"
+            params.append(worker_id)
+        return self._conn().execute(sql, params).rowcount == 1
+
+    def mark_processed(self, entry_id: str, status: str = "posted") -> bool:
+        return self.ack(entry_id, status)
@@ -1,6 +1,8 @@
 import random
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from dataclasses import dataclass
+
+import numpy as np
 from src.core.kpi import KPIDecider
 from src.core.config import settings
 
@@ -35,4 +37,20 @@ class QASampler:
             out.append(self.evaluate(it, a))
         return out
 
+    def evaluate_batch(self, projected_reach_48h: np.ndarray, astro_scores: np.ndarray) -> Tuple[np.ndarray, List[str]]:
+        """Vectorized :meth:`evaluate` over precomputed projections.
 
+        Returns ``(selected, reasons)``. Random draws happen only for eligible
+        items, in item order, exactly as repeated ``evaluate`` calls would.
+        """
+        eligible = (astro_scores < settings.qa_low_score_threshold) & (
+            projected_reach_48h >= settings.qa_high_spread_projected_reach
+        )
+        selected = np.zeros(len(eligible), dtype=bool)
+        reasons = ["not_eligible"] * len(eligible)
+        rate = max(0.0, min(1.0, settings.qa_sample_rate))
+        for i in np.flatnonzero(eligible).tolist():
+            pick = random.random() < rate
+            selected[i] = pick
+            reasons[i] = "random_pick" if pick else "random_miss"
+        return selected, reasons
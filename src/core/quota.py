@@ -0,0 +1,154 @@
+"""
+Per-provider quota scheduling for the source-retrieval APIs.
+
+NewsAPI, Google Fact Check, Google Custom Search, ClaimBuster and Semantic
+Scholar enforce strict quotas. :class:`QuotaScheduler` sits in front of a
+provider's upstream calls (see ``ResilientTransport`` in
+``src/core/resilience.py``) and:
+
+- enforces a token bucket (``quota_<provider>_per_minute`` with burst
+  ``quota_<provider>_burst`` from settings); a call that cannot get a token
+  waits for one if that takes at most ``quota_max_wait`` seconds and fewer
+  than ``quota_max_queue`` calls are already waiting, otherwise it is shed
+  with :class:`QuotaExceeded`;
+- coalesces identical in-flight calls (same key, e.g. method + URL) into one
+  upstream request whose result every caller receives.
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import asyncio
+import threading
+import time
+
+import httpx
+
+from src.core.config import settings
+from src.core.single_flight import SingleFlight
+
+
+class QuotaExceeded(httpx.TransportError):
+    """Raised when a provider call is shed because its quota is exhausted."""
+
+
+class TokenBucket:
+    """Token bucket with reservations: waiting callers pre-pay so they are served FIFO."""
+
+    def __init__(self, rate_per_sec: float, burst: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = float(rate_per_sec)
+        self.burst = max(1.0, float(burst))
+        self.clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """Take one token; return the seconds to wait before using it, or None to shed."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            wait = (1.0 - self._tokens) / self.rate if self.rate > 0 else float("inf")
+            if wait > max_wait:
+                return None
+            self._tokens -= 1.0
+            return wait
+
+
+class QuotaScheduler:
+    """Token-bucket admission and in-flight coalescing for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_minute: Optional[float] = None,
+        burst: float = 1,
+        max_wait: float = 2.0,
+        max_queue: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.bucket = TokenBucket(rate_per_minute / 60.0, burst, clock) if rate_per_minute else None
+        self.max_wait = float(max_wait)
+        self.max_queue = int(max_queue)
+        self._waiting = 0
+        self._inflight = SingleFlight()
+        self.stats = {"sent": 0, "queued": 0, "shed": 0, "coalesced": 0}
+
+    async def acquire(self, request: Optional[httpx.Request] = None) -> None:
+        """Wait for a token or raise :class:`QuotaExceeded` (no-op without a quota)."""
+        if self.bucket is None:
+            self.stats["sent"] += 1
+            return
+        wait = None if self._waiting >= self.max_queue else self.bucket.reserve(self.max_wait)
+        if wait is None:
+            self.stats["shed"] += 1
+            raise QuotaExceeded(f"{self.name}: quota exhausted, call shed", request=request)
+        if wait > 0:
+            self.stats["queued"] += 1
+            self._waiting += 1
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._waiting -= 1
+        self.stats["sent"] += 1
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now (always True without a quota)."""
+        if self.bucket is not None and self.bucket.reserve(0.0) is None:
+            return False
+        self.stats["sent"] += 1
+        return True
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Run ``fn`` once per ``key`` among concurrent callers.
+
+        Returns ``(result, shared)``; ``shared`` is True for callers that
+        received another caller's result. A cancelled caller does not cancel
+        the call for the others.
+        """
+        if key in self._inflight:
+            self.stats["coalesced"] += 1
+        return await self._inflight.do(key, fn)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "tokens": round(self.bucket.tokens, 2) if self.bucket else None,
+            "waiting": self._waiting,
+            **self.stats,
+        }
+
+
+_SCHEDULERS: Dict[str, QuotaScheduler] = {}
+_SCHEDULERS_LOCK = threading.Lock()
+
+
+def get_scheduler(name: str) -> QuotaScheduler:
+    """Get or create the shared scheduler for ``name`` (quota from ``quota_<name>_*`` settings)."""
+    scheduler = _SCHEDULERS.get(name)
+    if scheduler is None:
+        with _SCHEDULERS_LOCK:
+            scheduler = _SCHEDULERS.get(name)
+            if scheduler is None:
+                scheduler = _SCHEDULERS[name] = QuotaScheduler(
+                    name,
+                    rate_per_minute=getattr(settings, f"quota_{name}_per_minute", None),
+                    burst=getattr(settings, f"quota_{name}_burst", 1),
+                    max_wait=settings.quota_max_wait,
+                    max_queue=settings.quota_max_queue,
+                )
+    return scheduler
+
+
+def scheduler_snapshots() -> Dict[str, Dict[str, Any]]:
+    return {name: s.snapshot() for name, s in sorted(_SCHEDULERS.items())}
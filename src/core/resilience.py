@@ -0,0 +1,357 @@
+"""
+Resilience layer shared by the source-retrieval providers in ``src/services``.
+
+Each provider (Google Fact Check, ClaimBuster, NewsAPI, …) gets a
+:class:`ProviderHealth` that tracks a rolling window of call outcomes and
+latencies and derives from it:
+
+- an adaptive timeout: p99 latency × ``timeout_multiplier`` + margin, clamped
+  to [``min_timeout``, ``max_timeout``] (``max_timeout`` until enough samples);
+- a circuit breaker: *closed* → *open* after ``failure_threshold``
+  consecutive failures or an error rate ≥ ``error_rate_threshold``; while open
+  calls fail immediately with :class:`CircuitOpenError`; after ``cooldown``
+  seconds a single *half-open* probe decides whether to close again;
+- a hedge delay (p95 latency) for optional hedged idempotent GETs.
+
+``resilient_client(provider)`` returns an ``httpx.AsyncClient`` whose
+transport applies all of this, plus the provider's quota scheduler
+(``src/core/quota.py``), so wrappers only swap their client constructor.
+Every upstream attempt, hedges included, takes its own quota token; a hedge
+is skipped when no token is free right away. Errors surface as httpx
+transport errors, which the wrappers already catch and log.
+"""
+from typing import Any, Callable, Deque, Dict, Optional
+from collections import deque
+import asyncio
+import logging
+import threading
+import time
+
+import httpx
+
+from src.core.config import settings
+from src.core.quota import QuotaScheduler, get_scheduler
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+def _quantile(sorted_values, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[idx]
+
+
+class ProviderHealth:
+    """Rolling latency/error statistics, adaptive timeout and circuit breaker for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 100,
+        min_samples: int = 20,
+        min_timeout: float = 1.0,
+        max_timeout: float = 30.0,
+        timeout_multiplier: float = 1.5,
+        timeout_margin: float = 0.5,
+        failure_threshold: int = 5,
+        error_rate_threshold: float = 0.5,
+        min_calls: int = 10,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.min_samples = int(min_samples)
+        self.min_timeout = float(min_timeout)
+        self.max_timeout = float(max_timeout)
+        self.timeout_multiplier = float(timeout_multiplier)
+        self.timeout_margin = float(timeout_margin)
+        self.failure_threshold = int(failure_threshold)
+        self.error_rate_threshold = float(error_rate_threshold)
+        self.min_calls = int(min_calls)
+        self.cooldown = float(cooldown)
+        self.clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=int(window))
+        self._latencies: Deque[float] = deque(maxlen=int(window))
+        self._sorted: Optional[list] = None
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+        self.rejected = 0
+
+    # -- circuit breaker ---------------------------------------------------
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self.clock() - self._opened_at >= self.cooldown:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (claims the probe slot when half-open)."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and self.clock() - self._opened_at >= self.cooldown:
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def release(self) -> None:
+        """Give back a half-open probe slot without recording an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _trip(self) -> None:
+        if self._state != OPEN:
+            logger.warning("Circuit for provider %s opened", self.name)
+        self._state = OPEN
+        self._opened_at = self.clock()
+        self._probe_in_flight = False
+
+    def record(self, ok: bool, latency: Optional[float] = None) -> None:
+        with self._lock:
+            self._outcomes.append(ok)
+            if ok and latency is not None:
+                self._latencies.append(latency)
+                self._sorted = None
+            if self._state == HALF_OPEN:
+                if ok:
+                    logger.info("Circuit for provider %s closed after successful probe", self.name)
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                    self._consecutive_failures = 0
+                    self._probe_in_flight = False
+                else:
+                    self._trip()
+                return
+            if ok:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            calls = len(self._outcomes)
+            error_rate = self._outcomes.count(False) / calls if calls else 0.0
+            if self._consecutive_failures >= self.failure_threshold or (
+                calls >= self.min_calls and error_rate >= self.error_rate_threshold
+            ):
+                self._trip()
+
+    # -- latency-derived limits --------------------------------------------
+
+    def _latency_quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            if self._sorted is None:
+                self._sorted = sorted(self._latencies)
+            return _quantile(self._sorted, q)
+
+    def timeout(self) -> float:
+        p99 = self._latency_quantile(0.99)
+        if p99 is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, p99 * self.timeout_multiplier + self.timeout_margin))
+
+    def hedge_delay(self) -> Optional[float]:
+        """Delay after which a hedged GET is sent (p95 latency), None without enough samples."""
+        return self._latency_quantile(0.95)
+
+    def snapshot(self) -> Dict[str, Any]:
+        p50 = self._latency_quantile(0.5)
+        p99 = self._latency_quantile(0.99)
+        with self._lock:
+            calls = len(self._outcomes)
+            errors = self._outcomes.count(False)
+        return {
+            "state": self.state,
+            "calls": calls,
+            "error_rate": round(errors / calls, 3) if calls else 0.0,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p99_ms": round(p99 * 1000, 1) if p99 is not None else None,
+            "timeout_s": round(self.timeout(), 2),
+            "rejected": self.rejected,
+        }
+
+
+_PROVIDERS: Dict[str, ProviderHealth] = {}
+_PROVIDERS_LOCK = threading.Lock()
+
+
+def get_provider(name: str) -> ProviderHealth:
+    """Get or create the shared health tracker for ``name``."""
+    provider = _PROVIDERS.get(name)
+    if provider is None:
+        with _PROVIDERS_LOCK:
+            provider = _PROVIDERS.get(name)
+            if provider is None:
+                provider = _PROVIDERS[name] = ProviderHealth(
+                    name,
+                    window=settings.provider_window,
+                    min_timeout=settings.provider_timeout_min,
+                    max_timeout=settings.provider_timeout_max,
+                    timeout_margin=settings.provider_timeout_margin,
+                    failure_threshold=settings.provider_breaker_failures,
+                    error_rate_threshold=settings.provider_breaker_error_rate,
+                    cooldown=settings.provider_breaker_cooldown,
+                )
+    return provider
+
+
+def provider_states() -> Dict[str, str]:
+    """Breaker state per provider that has been used (``closed`` | ``open`` | ``half_open``)."""
+    return {name: p.state for name, p in sorted(_PROVIDERS.items())}
+
+
+def provider_snapshots() -> Dict[str, Dict[str, Any]]:
+    return {name: p.snapshot() for name, p in sorted(_PROVIDERS.items())}
+
+
+def _is_failure(response: httpx.Response) -> bool:
+    return response.status_code >= 500 or response.status_code == 429
+
+
+def _copy_response(response: httpx.Response, request: httpx.Request) -> httpx.Response:
+    """Independent copy of a buffered (already decoded) response for a coalesced caller."""
+    headers = [
+        (k, v) for k, v in response.headers.multi_items()
+        if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+    ]
+    return httpx.Response(response.status_code, headers=headers, content=response.content, request=request)
+
+
+def _close_discarded(task: "asyncio.Future[httpx.Response]") -> None:
+    """Close the response of a losing hedged attempt that finished despite cancellation."""
+    if not task.cancelled() and task.exception() is None:
+        asyncio.ensure_future(task.result().aclose())
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    """httpx transport applying a provider's breaker, adaptive timeout and hedging."""
+
+    def __init__(
+        self,
+        provider: ProviderHealth,
+        hedge: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        scheduler: Optional[QuotaScheduler] = None,
+        idempotent_posts: bool = False,
+        **transport_kwargs: Any,
+    ) -> None:
+        self.provider = provider
+        self.hedge = hedge
+        self.scheduler = scheduler
+        self.idempotent_posts = idempotent_posts
+        self._transport = transport or httpx.AsyncHTTPTransport(**transport_kwargs)
+
+    async def _attempt(self, request: httpx.Request, timeout: float) -> httpx.Response:
+        try:
+            return await asyncio.wait_for(self._transport.handle_async_request(request), timeout)
+        except asyncio.TimeoutError:
+            raise httpx.ReadTimeout(
+                f"{self.provider.name}: no response within adaptive timeout {timeout:.2f}s", request=request
+            ) from None
+
+    async def _hedged(self, request: httpx.Request, timeout: float, delay: float) -> httpx.Response:
+        """Send a second attempt if the first has not answered after ``delay``; first success wins."""
+        primary = asyncio.ensure_future(self._attempt(request, timeout))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+        if self.scheduler is not None and not self.scheduler.try_acquire():
+            return await primary  # the hedge would need a quota token we do not have
+        backup = asyncio.ensure_future(self._attempt(request, max(timeout - delay, self.provider.min_timeout)))
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winners = [t.result() for t in done if t.exception() is None]
+                if winners:
+                    for extra in winners[1:]:
+                        await extra.aclose()
+                    return winners[0]
+                error = error or next(iter(done)).exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_close_discarded)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        scheduler = self.scheduler
+        idempotent = request.method in ("GET", "HEAD") or (self.idempotent_posts and request.method == "POST")
+        if scheduler is not None and idempotent:
+            key = (request.method, str(request.url), request.content if request.method == "POST" else b"")
+            response, shared = await scheduler.run(key, lambda: self._send_buffered(request))
+            return _copy_response(response, request) if shared else response
+        return await self._send(request)
+
+    async def _send_buffered(self, request: httpx.Request) -> httpx.Response:
+        response = await self._send(request)
+        await response.aread()
+        return response
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        if self.scheduler is not None:
+            await self.scheduler.acquire(request)
+        provider = self.provider
+        if not provider.allow():
+            raise CircuitOpenError(f"{provider.name}: circuit open, skipping call", request=request)
+        timeout = provider.timeout()
+        start = time.perf_counter()
+        try:
+            delay = provider.hedge_delay() if self.hedge and request.method in ("GET", "HEAD") else None
+            if delay is not None and delay < timeout:
+                response = await self._hedged(request, timeout, delay)
+            else:
+                response = await self._attempt(request, timeout)
+        except asyncio.CancelledError:
+            provider.release()  # caller gave up; not the provider's fault
+            raise
+        except Exception:
+            provider.record(False)
+            raise
+        provider.record(not _is_failure(response), time.perf_counter() - start)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def resilient_client(
+    provider: str,
+    hedge: Optional[bool] = None,
+    idempotent_posts: bool = False,
+    verify: Any = True,
+    **client_kwargs: Any,
+) -> httpx.AsyncClient:
+    """``httpx.AsyncClient`` for ``provider`` with quota scheduling, breaker,
+    adaptive timeout and optional hedging.
+
+    ``timeout`` (default ``provider_timeout_max``) stays the hard cap for the
+    whole request; ``hedge`` defaults to ``settings.provider_hedging``.
+    Identical in-flight GETs are coalesced; ``idempotent_posts`` extends that
+    to POSTs with identical bodies (read-only scoring endpoints).
+    """
+    client_kwargs.setdefault("timeout", settings.provider_timeout_max)
+    transport = ResilientTransport(
+        get_provider(provider),
+        hedge=settings.provider_hedging if hedge is None else hedge,
+        scheduler=get_scheduler(provider),
+        idempotent_posts=idempotent_posts,
+        verify=verify,
+    )
+    return httpx.AsyncClient(transport=transport, **client_kwargs)
@@ -0,0 +1,272 @@
+"""
+Claim-level result cache for the full fact-check pipeline.
+
+One pipeline run costs an LLM analysis, every provider lookup and up to two
+LLM generations, and viral claims arrive thousands of times within minutes.
+:class:`ClaimResultCache` keeps finished results keyed on (normalized claim,
+company, language, generate_ai_response) with a TTL chosen from the claim's
+volatility, and coalesces concurrent identical requests onto one run.
+
+Each API worker and job worker keeps its own cache, so explicit invalidation
+goes through a shared :class:`InvalidationLog` (SQLite in WAL mode, like
+``JobQueue``): :meth:`ClaimResultCache.invalidate` records the invalidation
+there, and every cache replays new records before serving a lookup, at most
+``claim_cache_invalidation_poll`` seconds late.
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from pathlib import Path
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from src.core.config import settings
+from src.core.single_flight import SingleFlight
+from src.ml.guardian.claim_router import ClaimAnalysis, ClaimVolatility, TemporalMode
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str, bool]
+
+
+def normalize_claim(text: str) -> str:
+    """Case-, width- and whitespace-insensitive form of a claim."""
+    return " ".join(unicodedata.normalize("NFKC", text or "").casefold().split())
+
+
+class InvalidationLog:
+    """Invalidations shared by every process's caches through one SQLite file.
+
+    Records are ``(id, claim, company)`` with NULL meaning "any"; rows older
+    than ``retention`` seconds (the longest cache TTL) can no longer match a
+    live entry and are pruned on write.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 1.0, retention: float = 24 * 3600.0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.poll_interval = float(poll_interval)
+        self.retention = float(retention)
+        self._local = threading.local()
+        self._conn().execute("""
+            CREATE TABLE IF NOT EXISTS invalidations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                claim TEXT,
+                company TEXT,
+                created_at REAL NOT NULL
+            )
+        """)
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite3 connections are not thread-safe.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def record(self, claim: Optional[str], company: Optional[str]) -> int:
+        now = time.time()
+        conn = self._conn()
+        conn.execute("DELETE FROM invalidations WHERE created_at < ?", (now - self.retention,))
+        return conn.execute(
+            "INSERT INTO invalidations (claim, company, created_at) VALUES (?, ?, ?)", (claim, company, now)
+        ).lastrowid
+
+    def last_id(self) -> int:
+        return self._conn().execute("SELECT COALESCE(MAX(id), 0) FROM invalidations").fetchone()[0]
+
+    def since(self, last_id: int) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        return self._conn().execute(
+            "SELECT id, claim, company FROM invalidations WHERE id > ? ORDER BY id", (last_id,)
+        ).fetchall()
+
+
+class ClaimResultCache:
+    """
+    TTL + LRU cache with single-flight coalescing.
+
+    TTLs come from ``ttl_by_volatility``; a claim whose temporal mode is
+    LIVE_REQUIRED always gets ``live_ttl``. Values are stored as given;
+    callers that mutate results should store and hand out copies. With an
+    ``invalidation_log``, invalidations reach the caches of other processes;
+    a run that was in flight when an invalidation arrived is not cached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 5000,
+        live_ttl: float = 60.0,
+        ttl_by_volatility: Optional[Dict[ClaimVolatility, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        invalidation_log: Optional[InvalidationLog] = None,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.live_ttl = float(live_ttl)
+        self.ttl_by_volatility = ttl_by_volatility or {
+            ClaimVolatility.VERY_HIGH: 60.0,
+            ClaimVolatility.HIGH: 600.0,
+            ClaimVolatility.MEDIUM: 3600.0,
+            ClaimVolatility.LOW: 6 * 3600.0,
+            ClaimVolatility.STABLE: 24 * 3600.0,
+        }
+        self.clock = clock
+        # key -> (expires_at, stored_at, ttl, value)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, float, float, Any]]" = OrderedDict()
+        self._pending = SingleFlight()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "invalidated": 0}
+        self._generation = 0  # bumped by every applied invalidation
+        self.invalidation_log = invalidation_log
+        self._log_seen = invalidation_log.last_id() if invalidation_log is not None else 0
+        self._log_polled = clock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(text: str, company: str, language: str, generate_ai_response: bool) -> CacheKey:
+        return (normalize_claim(text), (company or "").lower(), (language or "").lower(), bool(generate_ai_response))
+
+    def ttl_for(self, analysis: Optional[ClaimAnalysis]) -> float:
+        if analysis is None:
+            return self.ttl_by_volatility.get(ClaimVolatility.MEDIUM, self.live_ttl)
+        if analysis.temporal_mode == TemporalMode.LIVE_REQUIRED:
+            return self.live_ttl
+        return self.ttl_by_volatility.get(analysis.volatility, self.live_ttl)
+
+    def _sync(self) -> None:
+        """Apply invalidations other processes recorded since the last poll."""
+        log = self.invalidation_log
+        if log is None or self.clock() - self._log_polled < log.poll_interval:
+            return
+        self._log_polled = self.clock()
+        try:
+            records = log.since(self._log_seen)
+        except sqlite3.Error as e:
+            logger.warning(f"Cache invalidation log unreadable, serving local entries: {e}")
+            return
+        for record_id, claim, company in records:
+            self._drop(claim, company)
+            self._log_seen = record_id
+
+    def get(self, key: CacheKey) -> Optional[Tuple[Any, float, float]]:
+        """``(value, age_seconds, ttl)`` for a live entry, else None."""
+        self._sync()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, stored_at, ttl, value = entry
+        now = self.clock()
+        if now >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value, now - stored_at, ttl
+
+    def put(self, key: CacheKey, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        now = self.clock()
+        self._entries[key] = (now + ttl, now, ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self,
+        key: CacheKey,
+        compute: Callable[[], Awaitable[Tuple[Any, float]]],
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Return a cached value or run ``compute`` once for all concurrent callers.
+
+        ``compute`` returns ``(value, ttl)``; a ttl of 0 leaves the value
+        uncached (e.g. degraded results). The second element of the result
+        describes the cache outcome (``hit``, ``coalesced``, ``age_seconds``,
+        ``ttl_seconds``). A cancelled caller does not cancel the run for the
+        callers it was coalesced with.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            value, age, ttl = cached
+            self.stats["hits"] += 1
+            return value, {"hit": True, "coalesced": False, "age_seconds": round(age, 1), "ttl_seconds": ttl}
+
+        if key in self._pending:
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["misses"] += 1
+
+        async def run() -> Tuple[Any, float]:
+            generation = self._generation
+            value, ttl = await compute()
+            self._sync()
+            if generation == self._generation:
+                self.put(key, value, ttl)
+            return value, ttl
+
+        (value, ttl), shared = await self._pending.do(key, run)
+        return value, {"hit": shared, "coalesced": shared, "age_seconds": 0.0, "ttl_seconds": ttl}
+
+    def invalidate(self, text: Optional[str] = None, company: Optional[str] = None) -> int:
+        """Drop entries for a claim and/or a company (everything when both are None).
+
+        Returns the number of local entries removed; other processes drop
+        theirs when they next poll the invalidation log.
+        """
+        claim = normalize_claim(text) if text is not None else None
+        company = company.lower() if company is not None else None
+        if self.invalidation_log is not None:
+            self.invalidation_log.record(claim, company)
+        return self._drop(claim, company)
+
+    def _drop(self, claim: Optional[str], company: Optional[str]) -> int:
+        self._generation += 1
+        doomed = [
+            k for k in self._entries
+            if (claim is None or k[0] == claim) and (company is None or k[1] == company)
+        ]
+        for k in doomed:
+            del self._entries[k]
+        self.stats["invalidated"] += len(doomed)
+        return len(doomed)
+
+    def summary(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "max_entries": self.max_entries, **self.stats}
+
+
+_invalidation_log: Optional[InvalidationLog] = None
+_invalidation_log_lock = threading.Lock()
+
+
+def get_invalidation_log() -> InvalidationLog:
+    """The process-wide log at ``claim_cache_invalidation_db``."""
+    global _invalidation_log
+    with _invalidation_log_lock:
+        if _invalidation_log is None:
+            _invalidation_log = InvalidationLog(
+                settings.claim_cache_invalidation_db,
+                poll_interval=settings.claim_cache_invalidation_poll,
+                retention=max(settings.claim_cache_ttl_stable, settings.claim_cache_ttl_low),
+            )
+    return _invalidation_log
+
+
+def claim_cache_from_settings() -> ClaimResultCache:
+    """A cache sized and timed by the ``claim_cache_*`` settings, sharing invalidations across processes."""
+    return ClaimResultCache(
+        invalidation_log=get_invalidation_log(),
+        max_entries=settings.claim_cache_max_entries,
+        live_ttl=settings.claim_cache_ttl_live,
+        ttl_by_volatility={
+            ClaimVolatility.VERY_HIGH: settings.claim_cache_ttl_live,
+            ClaimVolatility.HIGH: settings.claim_cache_ttl_high,
+            ClaimVolatility.MEDIUM: settings.claim_cache_ttl_medium,
+            ClaimVolatility.LOW: settings.claim_cache_ttl_low,
+            ClaimVolatility.STABLE: settings.claim_cache_ttl_stable,
+        },
+    )
@@ -0,0 +1,337 @@
+"""
+Claim-aware source retrieval planning.
+
+Instead of querying every generic provider for every claim,
+:class:`RetrievalPlanner` picks a minimal provider set from the claim's
+``ClaimAnalysis`` (claim types, volatility, temporal mode):
+
+- fact-check databases and MediaWiki reference context for every claim;
+- news context only where facts move (not for LOW/STABLE archive claims);
+- PubMed + WHO for HEALTH_MISINFORMATION, Semantic Scholar + CORE/arXiv
+  for SCIENCE_DENIAL;
+- RSS freshness for LIVE_REQUIRED claims;
+- none of the generic live providers (fact-check, news, reference, claim
+  scoring) when the local fact-check index already returned enough
+  published fact-checks for a claim that is not LIVE_REQUIRED;
+- no academic/health lookups and no claim-worthiness scoring for hate or
+  threat claims (they are not answered with literature).
+
+:meth:`RetrievalPlanner.execute` runs the chosen providers concurrently,
+each bounded by its class budget (``retrieval_budget_<class>`` seconds).
+Inside :func:`shared_retrieval` (batch runs), lookups go through a
+:class:`SharedRetrieval` so claims grouped by overlapping keywords reuse one
+provider call per group.
+"""
+from dataclasses import dataclass, field
+from enum import Enum
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import logging
+import time
+
+from src.core.config import settings
+from src.core.result_cache import normalize_claim
+from src.ml.guardian.claim_router import ClaimAnalysis, ClaimType, ClaimVolatility, TemporalMode
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderClass(str, Enum):
+    FACT_CHECK = "fact_check"
+    NEWS = "news"
+    REFERENCE = "reference"
+    CLAIM_SCORING = "claim_scoring"
+    ACADEMIC = "academic"
+    HEALTH = "health"
+    FRESHNESS = "freshness"
+
+
+# provider -> (class, max results kept)
+PROVIDERS: Dict[str, Tuple[ProviderClass, int]] = {
+    "google_fact_check": (ProviderClass.FACT_CHECK, 5),
+    "news_api": (ProviderClass.NEWS, 3),
+    "mediawiki": (ProviderClass.REFERENCE, 5),
+    "claimbuster": (ProviderClass.CLAIM_SCORING, 1),
+    "pubmed": (ProviderClass.ACADEMIC, 3),
+    "semantic_scholar": (ProviderClass.ACADEMIC, 3),
+    "core": (ProviderClass.ACADEMIC, 2),
+    "arxiv": (ProviderClass.ACADEMIC, 2),
+    "who": (ProviderClass.HEALTH, 3),
+    "rss_freshness": (ProviderClass.FRESHNESS, 5),
+}
+
+NO_LITERATURE_TYPES = {ClaimType.HATE_OR_DEHUMANIZATION, ClaimType.THREAT_OR_INCITEMENT}
+ARCHIVE_VOLATILITY = {ClaimVolatility.LOW, ClaimVolatility.STABLE}
+LOCAL_INDEX_COVERS = {
+    ProviderClass.FACT_CHECK, ProviderClass.NEWS, ProviderClass.REFERENCE, ProviderClass.CLAIM_SCORING,
+}
+
+Fetcher = Callable[[str, str, Optional[ClaimAnalysis], int], Awaitable[Any]]
+
+
+@dataclass
+class RetrievalPlan:
+    """Providers chosen for one claim, why, and the per-class time budgets."""
+    providers: List[str] = field(default_factory=list)
+    reasons: Dict[str, str] = field(default_factory=dict)
+    skipped: Dict[str, str] = field(default_factory=dict)
+    budgets: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, provider: str, reason: str) -> None:
+        if provider not in self.reasons and provider not in self.skipped:
+            self.providers.append(provider)
+            self.reasons[provider] = reason
+
+    def skip(self, provider: str, reason: str) -> None:
+        if provider not in self.reasons:
+            self.skipped.setdefault(provider, reason)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "providers": list(self.providers),
+            "reasons": dict(self.reasons),
+            "skipped": dict(self.skipped),
+            "budgets": dict(self.budgets),
+        }
+
+
+@dataclass
+class ProviderOutcome:
+    """Result of one planned provider call."""
+    provider: str
+    results: Any = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    elapsed_ms: int = 0
+
+
+class SharedRetrieval:
+    """Provider lookups shared by the claims of one batch.
+
+    :meth:`assign` maps a claim to its group's lead claim; every provider is
+    then called once per (group, language) and all members get that result.
+    """
+
+    def __init__(self) -> None:
+        self._groups: Dict[str, str] = {}
+        self._calls: Dict[Tuple[str, str, str], "asyncio.Future[Any]"] = {}
+        self.stats = {"lookups": 0, "shared": 0}
+
+    @staticmethod
+    def _key(text: str) -> str:
+        # Provider queries are the claim trimmed to 120 characters (see _search_sources)
+        return normalize_claim((text or "").strip()[:120])
+
+    def assign(self, text: str, lead: str) -> None:
+        self._groups[self._key(text)] = (lead or "").strip()[:120]
+
+    async def fetch(self, provider: str, query: str, language: str, call: Callable[[str], Awaitable[Any]]) -> Any:
+        lead = self._groups.get(self._key(query), query)
+        key = (provider, language, self._key(lead))
+        task = self._calls.get(key)
+        if task is None:
+            self.stats["lookups"] += 1
+            task = self._calls[key] = asyncio.ensure_future(call(lead))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())  # retrieved even if all waiters gave up
+        else:
+            self.stats["shared"] += 1
+        return await asyncio.shield(task)
+
+
+_shared: ContextVar[Optional[SharedRetrieval]] = ContextVar("shared_retrieval", default=None)
+
+
+@contextmanager
+def shared_retrieval(shared: SharedRetrieval) -> Iterator[SharedRetrieval]:
+    """Route provider lookups made in this context (and tasks started in it) through ``shared``."""
+    token = _shared.set(shared)
+    try:
+        yield shared
+    finally:
+        _shared.reset(token)
+
+
+class RetrievalPlanner:
+    """Chooses and runs the source providers for a claim."""
+
+    def __init__(
+        self,
+        fetchers: Optional[Dict[str, Fetcher]] = None,
+        budgets: Optional[Dict[ProviderClass, float]] = None,
+    ) -> None:
+        self.fetchers = dict(DEFAULT_FETCHERS if fetchers is None else fetchers)
+        self.budgets = budgets or {
+            cls: float(getattr(settings, f"retrieval_budget_{cls.value}")) for cls in ProviderClass
+        }
+
+    def plan(
+        self,
+        analysis: Optional[ClaimAnalysis],
+        available: Optional[Dict[str, bool]] = None,
+        local_sufficient: bool = False,
+    ) -> RetrievalPlan:
+        """Pick providers for ``analysis``.
+
+        ``available`` marks unconfigured providers False; ``local_sufficient``
+        says the local fact-check index already answered the claim.
+        """
+        available = available or {}
+        plan = RetrievalPlan()
+        types = set(analysis.claim_types) if analysis else set()
+        volatility = analysis.volatility if analysis else ClaimVolatility.MEDIUM
+        temporal = analysis.temporal_mode if analysis else TemporalMode.AMBIGUOUS
+        no_literature = bool(types & NO_LITERATURE_TYPES)
+
+        if local_sufficient and temporal != TemporalMode.LIVE_REQUIRED:
+            for provider, (cls, _) in PROVIDERS.items():
+                if cls in LOCAL_INDEX_COVERS:
+                    plan.skip(provider, "covered by local index")
+
+        plan.add("google_fact_check", "published fact-checks")
+        plan.add("mediawiki", "reference context")
+
+        if temporal == TemporalMode.LIVE_REQUIRED:
+            plan.add("rss_freshness", "live claim needs fresh coverage")
+            plan.add("news_api", "live claim needs current reporting")
+        elif volatility in ARCHIVE_VOLATILITY and temporal == TemporalMode.ARCHIVE_OK:
+            plan.skip("news_api", f"{volatility.value} volatility, archive sources suffice")
+        else:
+            plan.add("news_api", f"{volatility.value} volatility")
+
+        if no_literature:
+            for provider, (cls, _) in PROVIDERS.items():
+                if cls in (ProviderClass.ACADEMIC, ProviderClass.HEALTH, ProviderClass.CLAIM_SCORING):
+                    plan.skip(provider, "hate/threat claim")
+        else:
+            plan.add("claimbuster", "claim-worthiness score")
+            if ClaimType.HEALTH_MISINFORMATION in types:
+                plan.add("pubmed", "health claim")
+                plan.add("who", "health claim")
+            if ClaimType.SCIENCE_DENIAL in types:
+                plan.add("semantic_scholar", "science claim")
+                plan.add("core", "science claim")
+                plan.add("arxiv", "science claim (fallback without CORE key)")
+
+        for provider in list(plan.providers):
+            if not available.get(provider, True) or provider not in self.fetchers:
+                plan.providers.remove(provider)
+                plan.skipped[provider] = "unavailable"
+                del plan.reasons[provider]
+        if "core" in plan.providers and "arxiv" in plan.providers:
+            # One open-access full-text index is enough when CORE is configured
+            plan.providers.remove("arxiv")
+            del plan.reasons["arxiv"]
+            plan.skipped["arxiv"] = "covered by CORE"
+
+        plan.budgets = {
+            PROVIDERS[p][0].value: self.budgets[PROVIDERS[p][0]] for p in plan.providers
+        }
+        return plan
+
+    async def execute(
+        self,
+        plan: RetrievalPlan,
+        query: str,
+        language: str,
+        analysis: Optional[ClaimAnalysis] = None,
+    ) -> Dict[str, ProviderOutcome]:
+        """Run the planned providers concurrently; a slow or failing one never blocks the rest."""
+        shared = _shared.get()
+
+        async def run(provider: str) -> ProviderOutcome:
+            cls, limit = PROVIDERS[provider]
+            start = time.perf_counter()
+            outcome = ProviderOutcome(provider)
+
+            def call(q: str) -> Awaitable[Any]:
+                return self.fetchers[provider](q, language, analysis, limit)
+
+            try:
+                outcome.results = await asyncio.wait_for(
+                    shared.fetch(provider, query, language, call) if shared else call(query), self.budgets[cls]
+                )
+            except asyncio.TimeoutError:
+                outcome.timed_out = True
+                outcome.error = f"exceeded {cls.value} budget of {self.budgets[cls]:.1f}s"
+                logger.warning(f"⏱️ {provider}: {outcome.error}")
+            except Exception as e:
+                outcome.error = str(e) or type(e).__name__
+                logger.error(f"❌ {provider} error: {outcome.error}")
+            outcome.elapsed_ms = int((time.perf_counter() - start) * 1000)
+            return outcome
+
+        outcomes = await asyncio.gather(*(run(p) for p in plan.providers))
+        return {o.provider: o for o in outcomes}
+
+
+# ---------------------------------------------------------------------------
+# Default fetchers: (query, language, analysis, max_results) -> provider results
+# ---------------------------------------------------------------------------
+
+async def _fetch_google_fact_check(query, language, analysis, limit):
+    from src.services.google_factcheck import search_google_factchecks
+    return (await search_google_factchecks(query, language))[:limit]
+
+
+async def _fetch_news_api(query, language, analysis, limit):
+    from src.services.news_api import search_news_context
+    return (await search_news_context(query, language))[:limit]
+
+
+async def _fetch_mediawiki(query, language, analysis, limit):
+    from src.services.wiki_api import search_mediawiki_sources
+    return await search_mediawiki_sources(query, language)
+
+
+async def _fetch_claimbuster(query, language, analysis, limit):
+    from src.services.claimbuster_api import score_claim_worthiness
+    return await score_claim_worthiness(query)
+
+
+async def _fetch_pubmed(query, language, analysis, limit):
+    from src.services.pubmed_api import search_pubmed
+    return await search_pubmed(query, limit)
+
+
+async def _fetch_semantic_scholar(query, language, analysis, limit):
+    from src.services.semantic_scholar_api import search_semantic_scholar
+    return await search_semantic_scholar(query, limit)
+
+
+async def _fetch_core(query, language, analysis, limit):
+    from src.services.core_api import search_core
+    return await search_core(query, limit)
+
+
+async def _fetch_arxiv(query, language, analysis, limit):
+    from src.services.arxiv_api import search_arxiv
+    return await search_arxiv(query, limit)
+
+
+async def _fetch_who(query, language, analysis, limit):
+    from src.services.who_api import search_who
+    return await search_who(query, limit)
+
+
+async def _fetch_rss_freshness(query, language, analysis, limit):
+    from src.services.rss_freshness import get_rss_service
+    keywords = (analysis.keywords if analysis else []) or query.split()
+    locations = analysis.entities if analysis and analysis.is_territorial else None
+    hits = await get_rss_service().check_freshness(keywords=keywords, locations=locations)
+    return [hit.to_result() for hit in hits[:limit]]
+
+
+DEFAULT_FETCHERS: Dict[str, Fetcher] = {
+    "google_fact_check": _fetch_google_fact_check,
+    "news_api": _fetch_news_api,
+    "mediawiki": _fetch_mediawiki,
+    "claimbuster": _fetch_claimbuster,
+    "pubmed": _fetch_pubmed,
+    "semantic_scholar": _fetch_semantic_scholar,
+    "core": _fetch_core,
+    "arxiv": _fetch_arxiv,
+    "who": _fetch_who,
+    "rss_freshness": _fetch_rss_freshness,
+}
@@ -0,0 +1,178 @@
+from typing import Any, Dict, List, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.config import settings
+from src.core.coordinated_behavior import CoordinatedBehaviorDetector
+from src.core.kpi import KPIDecider
+from src.core.prioritization import PrioritizationEngine
+from src.core.qa import QASampler
+from src.core.virality import ViralityPredictor
+
+
+@dataclass
+class RouteBatch:
+    """Routing outcome for a batch, one list entry per input item."""
+    action: List[str]  # ALERT_HITL | SEMI_HITL | ARCHIVE
+    watchlist: List[bool]
+    astro_score: List[float]
+    virality_score: List[float]
+    reasons: List[List[str]]
+    qa_selected: List[bool]
+
+
+@dataclass
+class TriageBatch:
+    """Triage scores for a batch, one list entry per input item."""
+    priority: List[str]
+    watchlist: List[bool]
+    astro_score: List[float]
+    virality_score: List[float]
+    projected_reach_48h: List[float]
+
+
+def _getter(items: Sequence[Any]):
+    if items and isinstance(items[0], dict):
+        return lambda it, name: it.get(name)
+    return lambda it, name: getattr(it, name, None)
+
+
+class BatchRouter:
+    """
+    Columnar pre-filter → astro score → KPI routing for large batches.
+
+    Items (dicts or attribute objects such as pydantic models) are turned into
+    float columns once; virality, pool membership, astro score, projected reach
+    and the KPI decision are then evaluated with array operations instead of
+    per-item calls. Decisions match the per-item path in
+    ``src/api/monitoring.py`` (same rules, same rounding, same QA draw order).
+    """
+
+    def __init__(
+        self,
+        prioritizer: PrioritizationEngine,
+        virality: ViralityPredictor,
+        astro_detector: CoordinatedBehaviorDetector,
+        kpi_decider: KPIDecider,
+        qa_sampler: QASampler,
+        watchlists=None,
+    ) -> None:
+        self.prioritizer = prioritizer
+        self.virality = virality
+        self.astro_detector = astro_detector
+        self.kpi_decider = kpi_decider
+        self.qa_sampler = qa_sampler
+        self.watchlists = watchlists
+
+    def _columns(self, items: Sequence[Any], names: Sequence[str]) -> Dict[str, np.ndarray]:
+        get = _getter(items)
+        n = len(items)
+        return {
+            name: np.fromiter(((get(it, name) or 0.0) for it in items), dtype=float, count=n)
+            for name in names
+        }
+
+    def _roi_thresholds(self, items: Sequence[Any]) -> np.ndarray:
+        if self.watchlists is None:
+            return np.ones(len(items))
+        get = _getter(items)
+        out = np.ones(len(items))
+        for i, it in enumerate(items):
+            wl = self.watchlists.lookup(get(it, "author_username"), get(it, "content_text"))
+            if wl:
+                out[i] = wl.get("roi_threshold", 1.0)
+        return out
+
+    def route(self, items: Sequence[Any]) -> RouteBatch:
+        n = len(items)
+        if n == 0:
+            return RouteBatch([], [], [], [], [], [])
+        get = _getter(items)
+        c = self._columns(items, (
+            "views", "growth_rate_24h", "author_followers", "follower_spike_24h", "coordination_score",
+        ))
+
+        virality = self.virality.predict_batch(c["views"], c["growth_rate_24h"], c["author_followers"])
+        in_track, in_account, _ = self.prioritizer.prioritize_batch(
+            c["views"], c["growth_rate_24h"], c["author_followers"],
+            c["follower_spike_24h"], c["coordination_score"],
+        )
+        watchlist = in_track | in_account
+        vt = settings.virality_threshold * self._roi_thresholds(items)
+        passes_prefilter = watchlist | (virality >= vt)
+
+        # Astro score only for items that pass the pre-filter
+        astro_score = np.zeros(n)
+        astro_notes: List[List[str]] = [[] for _ in range(n)]
+        passing = np.flatnonzero(passes_prefilter).tolist()
+        if passing:
+            scores, notes = self.astro_detector.score_batch([get(items[i], "astro_signals") for i in passing])
+            astro_score[passing] = scores
+            for i, note in zip(passing, notes):
+                astro_notes[i] = note
+
+        kpi = self.kpi_decider.decide_batch(
+            views=c["views"],
+            growth_rate_24h=c["growth_rate_24h"],
+            harm_topics=[get(it, "harm_topic") for it in items],
+            harm_weight_overrides=[get(it, "harm_weight_override") for it in items],
+            astro_score=astro_score,
+            avg_analyst_seconds=[get(it, "avg_analyst_seconds") for it in items],
+            salary_rate_per_hour=[get(it, "salary_rate_per_hour") for it in items],
+            client_max_cpr=[get(it, "client_max_cpr") for it in items],
+        )
+
+        # Map KPI actions to routing actions
+        action = np.where(
+            ~passes_prefilter,
+            "ARCHIVE",
+            np.where(kpi.action == "HITL", "ALERT_HITL", np.where(kpi.action == "SEMI_HITL", "SEMI_HITL", "ARCHIVE")),
+        )
+
+        # QA sampling for low-score but high-spread (even if ARCHIVE)
+        qa_pick, qa_reasons = self.qa_sampler.evaluate_batch(kpi.projected_reach_48h, astro_score)
+        qa_selected = (action == "ARCHIVE") & qa_pick
+
+        projected = kpi.projected_reach_48h.tolist()
+        reasons = [
+            astro_notes[i] + [f"kpi:{kpi.reasons[i]}", f"qa:{qa_reasons[i]}:{projected[i]}"]
+            for i in range(n)
+        ]
+        return RouteBatch(
+            action=action.tolist(),
+            watchlist=watchlist.tolist(),
+            astro_score=astro_score.tolist(),
+            virality_score=virality.tolist(),
+            reasons=reasons,
+            qa_selected=qa_selected.tolist(),
+        )
+
+    def triage(self, items: Sequence[Any]) -> TriageBatch:
+        n = len(items)
+        if n == 0:
+            return TriageBatch([], [], [], [], [])
+        get = _getter(items)
+        c = self._columns(items, (
+            "views", "growth_rate_24h", "author_followers", "follower_spike_24h", "coordination_score",
+        ))
+        virality = self.virality.predict_batch(c["views"], c["growth_rate_24h"], c["author_followers"])
+        in_track, in_account, priority = self.prioritizer.prioritize_batch(
+            c["views"], c["growth_rate_24h"], c["author_followers"],
+            c["follower_spike_24h"], c["coordination_score"],
+        )
+
+        astro_score = np.zeros(n)
+        with_signals = [i for i, it in enumerate(items) if get(it, "astro_signals")]
+        if with_signals:
+            scores, _ = self.astro_detector.score_batch([get(items[i], "astro_signals") for i in with_signals])
+            astro_score[with_signals] = scores
+
+        projected = self.kpi_decider.estimate_projected_reach_48h_batch(c["views"], c["growth_rate_24h"])
+        return TriageBatch(
+            priority=priority.tolist(),
+            watchlist=(in_track | in_account).tolist(),
+            astro_score=astro_score.tolist(),
+            virality_score=virality.tolist(),
+            projected_reach_48h=projected.tolist(),
+        )
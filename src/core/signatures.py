@@ -0,0 +1,217 @@
+"""
+Near-duplicate text fingerprints for coordinated-posting detection.
+
+``text_signature`` only matches byte-identical texts, so a single-character
+edit defeats it. This module adds two locality-sensitive fingerprints and
+banded indexes for sub-linear candidate lookup:
+
+- MinHash over hashed character n-gram shingles (estimates Jaccard
+  similarity), indexed with banded LSH in :class:`MinHashLSH`.
+- 64-bit SimHash over word tokens (Hamming distance), indexed by exact-match
+  bit bands in :class:`SimHashIndex`.
+
+:class:`NearDuplicateIndex` maps each text to a canonical signature (the exact
+signature of the first near-identical text seen), so it can be plugged into
+``CoPostingGraph.add_items`` and ``StreamingTemporalClusterer`` as their
+``signature_fn``.
+"""
+from typing import Dict, Hashable, List, Optional, Tuple
+from collections import Counter, defaultdict
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def shingle_hashes(text: str, n: int = 5) -> np.ndarray:
+    """Unique 32-bit hashes of the character n-grams of the normalized text."""
+    t = _normalize(text)
+    if not t:
+        return np.zeros(0, dtype=np.uint64)
+    if len(t) <= n:
+        grams = {t}
+    else:
+        grams = {t[i : i + n] for i in range(len(t) - n + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+class MinHasher:
+    """MinHash with ``num_perm`` universal hash functions (a·x + b) mod p."""
+
+    def __init__(self, num_perm: int = 64, ngram: int = 5, seed: int = 1) -> None:
+        rng = np.random.default_rng(seed)
+        self.num_perm = int(num_perm)
+        self.ngram = int(ngram)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=(self.num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=(self.num_perm, 1), dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        x = shingle_hashes(text, self.ngram) % np.uint64(_MERSENNE_PRIME)
+        if x.size == 0:
+            return np.full(self.num_perm, _MERSENNE_PRIME, dtype=np.uint32)
+        return ((self._a * x + self._b) % np.uint64(_MERSENNE_PRIME)).min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        return float(np.count_nonzero(sig_a == sig_b)) / max(len(sig_a), 1)
+
+
+class MinHashLSH:
+    """Banded LSH over MinHash signatures: ``bands`` × ``rows`` = ``num_perm``.
+
+    Two texts become candidates when any band of their signatures is
+    identical; candidates are then checked against ``threshold`` with the
+    MinHash Jaccard estimate.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 8, threshold: float = 0.8) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.bands = int(bands)
+        self.rows = num_perm // bands
+        self.threshold = float(threshold)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [defaultdict(list) for _ in range(self.bands)]
+        self._sigs: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._sigs)
+
+    def _band_keys(self, sig: np.ndarray):
+        for b in range(self.bands):
+            yield b, sig[b * self.rows : (b + 1) * self.rows].tobytes()
+
+    def add(self, key: Hashable, sig: np.ndarray) -> None:
+        self._sigs[key] = sig
+        for b, k in self._band_keys(sig):
+            self._buckets[b][k].append(key)
+
+    def candidates(self, sig: np.ndarray) -> List[Hashable]:
+        seen: Dict[Hashable, None] = {}
+        for b, k in self._band_keys(sig):
+            for key in self._buckets[b].get(k, ()):
+                seen[key] = None
+        return list(seen)
+
+    def query(self, sig: np.ndarray) -> List[Tuple[Hashable, float]]:
+        """Keys with estimated Jaccard ≥ threshold, most similar first."""
+        hits = []
+        for key in self.candidates(sig):
+            j = MinHasher.jaccard(sig, self._sigs[key])
+            if j >= self.threshold:
+                hits.append((key, j))
+        hits.sort(key=lambda kv: kv[1], reverse=True)
+        return hits
+
+
+def simhash(text: str, bits: int = 64) -> int:
+    """Weighted SimHash over word tokens (token counts as weights)."""
+    counts = Counter(_TOKEN_RE.findall(_normalize(text)))
+    if not counts:
+        return 0
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(tok.encode("utf-8"), digest_size=8).digest(), "little") for tok in counts),
+        dtype=np.uint64, count=len(counts),
+    )
+    weights = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    bit_matrix = (hashes[:, None] >> np.arange(bits, dtype=np.uint64)) & np.uint64(1)
+    votes = (np.where(bit_matrix == 1, 1, -1) * weights[:, None]).sum(axis=0)
+    return int(sum(1 << i for i in np.flatnonzero(votes > 0).tolist()))
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class SimHashIndex:
+    """Finds fingerprints within ``max_distance`` bits via ``max_distance + 1`` exact bands.
+
+    By pigeonhole, two 64-bit fingerprints differing in at most k bits agree
+    exactly on at least one of k + 1 bands.
+    """
+
+    def __init__(self, max_distance: int = 3, bits: int = 64) -> None:
+        self.max_distance = int(max_distance)
+        self.bits = int(bits)
+        nb = self.max_distance + 1
+        edges = [round(i * self.bits / nb) for i in range(nb + 1)]
+        self._bands = [(lo, (1 << (hi - lo)) - 1) for lo, hi in zip(edges, edges[1:])]
+        self._buckets: List[Dict[int, List[Hashable]]] = [defaultdict(list) for _ in self._bands]
+        self._fps: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._fps)
+
+    def add(self, key: Hashable, fp: int) -> None:
+        self._fps[key] = fp
+        for i, (shift, mask) in enumerate(self._bands):
+            self._buckets[i][(fp >> shift) & mask].append(key)
+
+    def query(self, fp: int) -> List[Tuple[Hashable, int]]:
+        """Keys within ``max_distance``, closest first."""
+        seen = set()
+        hits = []
+        for i, (shift, mask) in enumerate(self._bands):
+            for key in self._buckets[i].get((fp >> shift) & mask, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                d = hamming(fp, self._fps[key])
+                if d <= self.max_distance:
+                    hits.append((key, d))
+        hits.sort(key=lambda kv: kv[1])
+        return hits
+
+
+class NearDuplicateIndex:
+    """Maps texts to canonical signatures shared by near-identical texts.
+
+    Exact repeats resolve through a dict of exact signatures; new texts are
+    matched with MinHash LSH and join the first near-duplicate's canonical
+    signature. Use :meth:`canonical` as the ``signature_fn`` of
+    ``CoPostingGraph.add_items`` or ``StreamingTemporalClusterer``.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 8, ngram: int = 5) -> None:
+        self.hasher = MinHasher(num_perm=num_perm, ngram=ngram)
+        self.lsh = MinHashLSH(num_perm=num_perm, bands=bands, threshold=threshold)
+        self._exact: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.lsh)
+
+    def canonical(self, text: str) -> str:
+        from .temporal import text_signature
+
+        exact = text_signature(text)
+        if not exact:
+            return ""
+        known = self._exact.get(exact)
+        if known is not None:
+            return known
+        sig = self.hasher.signature(text)
+        hits = self.lsh.query(sig)
+        if hits:
+            canon = hits[0][0]
+        else:
+            canon = exact
+            self.lsh.add(canon, sig)
+        self._exact[exact] = canon
+        return canon
+
+    def lookup(self, text: str) -> Optional[str]:
+        """Canonical signature of a previously seen near-duplicate, without registering ``text``."""
+        from .temporal import text_signature
+
+        exact = text_signature(text)
+        if exact in self._exact:
+            return self._exact[exact]
+        hits = self.lsh.query(self.hasher.signature(text))
+        return hits[0][0] if hits else None
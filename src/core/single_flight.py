@@ -0,0 +1,56 @@
+"""
+Single-flight execution of concurrent identical async calls.
+
+:class:`ClaimResultCache`, :class:`QuotaScheduler` and :class:`OCRPool` each
+coalesce concurrent identical requests onto one run. The run happens in its
+own task that every caller awaits through ``asyncio.shield``, so a caller that
+is cancelled (client disconnect, timeout) only stops waiting; the others still
+get the result. The task itself is cancelled once no caller is left.
+"""
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+import asyncio
+
+
+@dataclass
+class _Flight:
+    task: "asyncio.Task[Any]"
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Per-key in-flight tasks shared by concurrent callers."""
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._flights
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Await ``fn()`` once per ``key`` among concurrent callers.
+
+        Returns ``(result, shared)``; ``shared`` is True for callers that
+        joined a run another caller started.
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(fn()))
+            flight.task.add_done_callback(lambda task, key=key, flight=flight: self._finish(key, flight))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), shared
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+
+    def _finish(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled():
+            flight.task.exception()  # mark retrieved when every caller has gone
@@ -0,0 +1,168 @@
+"""
+API startup orchestration: lazy subsystems and background startup checks.
+
+Heavy singletons (``ai_engine``, ``ml_system``) are exposed as
+:class:`LazySubsystem` stand-ins, so importing the routers no longer builds
+them; the instance is constructed on first attribute access. The
+:class:`StartupOrchestrator` runs blocking startup checks (e.g. the LLM model
+lookup) and subsystem warm-ups concurrently in worker threads from the
+FastAPI lifespan, and reports readiness separately from liveness.
+"""
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_SUBSYSTEMS: Dict[str, "LazySubsystem"] = {}
+
+
+class LazySubsystem:
+    """Module-level stand-in for a heavy singleton, constructed on first use.
+
+    Attribute reads and writes are forwarded to the instance, so existing
+    ``from module import ai_engine`` call sites keep working. Construction
+    is thread-safe and happens once; a failed construction is retried on
+    the next access. The proxy's own methods are underscore-prefixed so they
+    do not shadow attributes of the wrapped object.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]) -> None:
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_error", None)
+        object.__setattr__(self, "_load_ms", None)
+        _SUBSYSTEMS[name] = self
+
+    def _state(self) -> str:
+        if self._instance is not None:
+            return "ready"
+        return "failed" if self._error else "idle"
+
+    def _get(self) -> Any:
+        instance = self._instance
+        if instance is not None:
+            return instance
+        with self._lock:
+            if self._instance is None:
+                start = time.perf_counter()
+                try:
+                    instance = self._factory()
+                except Exception as exc:
+                    object.__setattr__(self, "_error", type(exc).__name__)
+                    logger.error("Subsystem %s failed to initialize: %s", self._name, exc)
+                    raise
+                object.__setattr__(self, "_load_ms", round((time.perf_counter() - start) * 1000, 1))
+                object.__setattr__(self, "_error", None)
+                object.__setattr__(self, "_instance", instance)
+                logger.info("Subsystem %s initialized in %.1f ms", self._name, self._load_ms)
+            return self._instance
+
+    def _status(self) -> Dict[str, Any]:
+        return {"state": self._state(), "load_ms": self._load_ms}
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._get(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._get(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._get(), attr)
+
+    def __repr__(self) -> str:
+        return f"<LazySubsystem {self._name} ({self._state()})>"
+
+
+def subsystem_states() -> Dict[str, Dict[str, Any]]:
+    """State of every registered lazy subsystem (``idle`` | ``ready`` | ``failed``)."""
+    return {name: sub._status() for name, sub in _SUBSYSTEMS.items()}
+
+
+class StartupOrchestrator:
+    """
+    Runs blocking startup work concurrently in the background.
+
+    ``add_check`` registers a blocking callable whose return value is kept in
+    :attr:`results`; ``add_warmup`` registers a lazy subsystem to construct
+    ahead of its first request. :meth:`start` schedules everything in worker
+    threads and returns immediately, so the app accepts connections at once.
+    The orchestrator is *ready* once every critical task has finished
+    (successfully or not — a failed check leaves the API running degraded).
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, Callable[[], Any]] = {}
+        self._critical: Dict[str, bool] = {}
+        self.results: Dict[str, Any] = {}
+        self.states: Dict[str, str] = {}
+        self._runner: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def add_check(self, name: str, fn: Callable[[], Any], critical: bool = True) -> None:
+        self._tasks[name] = fn
+        self._critical[name] = critical
+        self.states[name] = "pending"
+
+    def add_warmup(self, subsystem: LazySubsystem, critical: bool = False) -> None:
+        def warm() -> None:
+            subsystem._get()
+
+        self.add_check(f"warmup:{subsystem._name}", warm, critical=critical)
+
+    @property
+    def ready(self) -> bool:
+        return all(
+            self.states.get(name) in ("ok", "failed")
+            for name, critical in self._critical.items()
+            if critical
+        )
+
+    async def _run_one(self, name: str, fn: Callable[[], Any]) -> None:
+        try:
+            self.results[name] = await asyncio.to_thread(fn)
+            self.states[name] = "ok"
+        except Exception as exc:
+            self.states[name] = "failed"
+            logger.warning("Startup task %s failed (%s)", name, type(exc).__name__)
+
+    async def run(self) -> None:
+        """Run all registered tasks concurrently and wait for them."""
+        self._started_at = time.monotonic()
+        await asyncio.gather(*(self._run_one(name, fn) for name, fn in self._tasks.items()))
+        self._finished_at = time.monotonic()
+        logger.info("Startup tasks finished in %.0f ms", (self._finished_at - self._started_at) * 1000)
+
+    def start(self) -> asyncio.Task:
+        """Schedule :meth:`run` on the running loop without waiting for it."""
+        if self._runner is None:
+            self._runner = asyncio.get_running_loop().create_task(self.run())
+        return self._runner
+
+    async def stop(self) -> None:
+        if self._runner is not None and not self._runner.done():
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+        self._runner = None
+
+    def status(self) -> Dict[str, Any]:
+        elapsed = None
+        if self._started_at is not None:
+            end = self._finished_at or time.monotonic()
+            elapsed = round((end - self._started_at) * 1000, 1)
+        pending: List[str] = [name for name, state in self.states.items() if state == "pending"]
+        return {
+            "ready": self.ready,
+            "tasks": dict(self.states),
+            "pending": pending,
+            "elapsed_ms": elapsed,
+            "subsystems": subsystem_states(),
+        }
@@ -1,6 +1,9 @@
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
 import hashlib
 
+import numpy as np
+
 
 def ngram_shingle(text: str, n: int = 3) -> Dict[str, int]:
     t = (text or "").lower()
@@ -32,3 +35,144 @@ def stylometry_similarity(text_a: str, text_b: str, n: int = 3) -> float:
     return cosine_similarity(ngram_shingle(text_a, n), ngram_shingle(text_b, n))
 
 
+
+
+# ---------------------------------------------------------------------------
+# Batch stylometry engine
+# ---------------------------------------------------------------------------
+# stylometry_similarity() rebuilds both n-gram dicts on every call. For
+# one-vs-many and many-vs-many comparisons (thousands of suspected sockpuppet
+# accounts) StylometryEngine hashes char n-grams into a fixed 2**dim_bits
+# space, stores L2-normalised sparse vectors once (so cosine is a plain dot
+# product with cached norms) and answers queries from an inverted index:
+# a query only touches documents sharing at least one hashed n-gram.
+
+_GOLDEN64 = np.uint64(0x9E3779B97F4A7C15)
+_POLY_BASE = np.uint64(1_000_003)
+
+
+@dataclass
+class SparseVector:
+    indices: np.ndarray  # sorted unique feature ids (int64)
+    values: np.ndarray   # L2-normalised weights (float32)
+
+
+def hashed_ngram_vector(text: str, n: int = 3, dim_bits: int = 18) -> SparseVector:
+    """Char n-gram counts hashed into ``2**dim_bits`` buckets, L2-normalised.
+
+    n-gram hashes are computed with a vectorised polynomial rolling hash over
+    the code points, so no per-gram Python strings are created.
+    """
+    t = (text or "").lower()
+    if len(t) < n:
+        return SparseVector(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32))
+    cps = np.frombuffer(t.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    m = len(cps) - n + 1
+    h = np.zeros(m, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for j in range(n):
+            h = h * _POLY_BASE + cps[j : j + m]
+        idx = ((h * _GOLDEN64) >> np.uint64(64 - dim_bits)).astype(np.int64)
+    features, counts = np.unique(idx, return_counts=True)
+    values = counts.astype(np.float32)
+    values /= np.sqrt(np.dot(values, values))
+    return SparseVector(features, values)
+
+
+class StylometryEngine:
+    """Hashed n-gram stylometry with batched one-vs-many / many-vs-many cosine."""
+
+    def __init__(self, n: int = 3, dim_bits: int = 18) -> None:
+        self.n = int(n)
+        self.dim_bits = int(dim_bits)
+        self.keys: List[Hashable] = []
+        self._key_ids: dict = {}
+        self._vectors: List[SparseVector] = []
+        self._indptr: Optional[np.ndarray] = None  # inverted index, rebuilt lazily after adds
+        self._docs: Optional[np.ndarray] = None
+        self._vals: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def vectorize(self, text: str) -> SparseVector:
+        return hashed_ngram_vector(text, self.n, self.dim_bits)
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Add or replace a document (e.g. one account's concatenated posts)."""
+        vec = self.vectorize(text)
+        if key in self._key_ids:
+            self._vectors[self._key_ids[key]] = vec
+        else:
+            self._key_ids[key] = len(self.keys)
+            self.keys.append(key)
+            self._vectors.append(vec)
+        self._indptr = None
+
+    def add_many(self, docs: Sequence[Tuple[Hashable, str]]) -> None:
+        for key, text in docs:
+            self.add(key, text)
+
+    def _build_index(self) -> None:
+        sizes = [len(v.indices) for v in self._vectors]
+        feats = np.concatenate([v.indices for v in self._vectors]) if sizes else np.zeros(0, dtype=np.int64)
+        vals = np.concatenate([v.values for v in self._vectors]) if sizes else np.zeros(0, dtype=np.float32)
+        docs = np.repeat(np.arange(len(self._vectors), dtype=np.int64), sizes)
+        order = np.argsort(feats, kind="stable")
+        self._docs, self._vals = docs[order], vals[order]
+        self._indptr = np.zeros((1 << self.dim_bits) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(feats, minlength=1 << self.dim_bits), out=self._indptr[1:])
+
+    def _scores(self, vec: SparseVector) -> np.ndarray:
+        if self._indptr is None:
+            self._build_index()
+        scores = np.zeros(len(self.keys), dtype=np.float32)
+        if len(vec.indices) == 0 or len(self.keys) == 0:
+            return scores
+        starts = self._indptr[vec.indices]
+        lens = self._indptr[vec.indices + 1] - starts
+        total = int(lens.sum())
+        if total == 0:
+            return scores
+        # Positions of every posting of every query feature, without a Python loop
+        offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lens)[:-1])), lens)
+        pos = offsets + np.arange(total)
+        contrib = self._vals[pos] * np.repeat(vec.values, lens)
+        scores += np.bincount(self._docs[pos], weights=contrib, minlength=len(self.keys)).astype(np.float32)
+        return np.clip(scores, 0.0, 1.0)
+
+    def similarity(self, text_a: str, text_b: str) -> float:
+        a, b = self.vectorize(text_a), self.vectorize(text_b)
+        _, ia, ib = np.intersect1d(a.indices, b.indices, assume_unique=True, return_indices=True)
+        return float(min(1.0, max(0.0, np.dot(a.values[ia], b.values[ib]))))
+
+    def one_vs_many(self, text: str) -> np.ndarray:
+        """Cosine similarity of ``text`` against every document, aligned with ``keys``."""
+        return self._scores(self.vectorize(text))
+
+    def top_k(self, text: str, k: int = 10, exclude: Optional[Hashable] = None) -> List[Tuple[Hashable, float]]:
+        scores = self.one_vs_many(text)
+        if exclude in self._key_ids:
+            scores[self._key_ids[exclude]] = -1.0
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.keys[i], float(scores[i])) for i in top.tolist() if scores[i] > 0.0]
+
+    def many_vs_many(self, keys: Optional[Sequence[Hashable]] = None) -> np.ndarray:
+        """Cosine matrix of ``keys`` (default: all documents) against all documents."""
+        rows = [self._key_ids[k] for k in keys] if keys is not None else range(len(self.keys))
+        if not len(rows):
+            return np.zeros((0, len(self.keys)))
+        return np.vstack([self._scores(self._vectors[i]) for i in rows])
+
+    def similar_pairs(self, threshold: float = 0.8) -> List[Tuple[Hashable, Hashable, float]]:
+        """All document pairs with cosine ≥ ``threshold`` (each pair once)."""
+        pairs = []
+        for i, vec in enumerate(self._vectors):
+            scores = self._scores(vec)
+            for j in np.flatnonzero(scores[i + 1 :] >= threshold).tolist():
+                pairs.append((self.keys[i], self.keys[i + 1 + j], float(scores[i + 1 + j])))
+        return pairs
@@ -1,62 +1,222 @@
-from typing import List, Dict, Tuple
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 import hashlib
 
 
 def text_signature(text: str, n: int = 5) -> str:
+    """Exact-match signature of the lowercased, stripped text.
+
+    A text's n-gram sequence identifies it uniquely, so hashing the text
+    itself groups the same posts as hashing its joined n-grams without
+    allocating an ~n×len string. ``n`` is kept for call compatibility. For
+    near-identical matching see ``src/core/signatures.py``.
+    """
     t = (text or "").lower().strip()
     if not t:
         return ""
-    # Simple n-gram hashing for speed
-    grams = [t[i : i + n] for i in range(max(0, len(t) - n + 1))]
-    h = hashlib.sha256("|".join(grams).encode("utf-8")).hexdigest()
-    return h[:16]
+    return hashlib.blake2b(t.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """Naive UTC datetime from a datetime or ISO string (``now`` when missing or invalid).
+
+    Platforms mix naive and offset-aware timestamps; normalizing keeps them
+    comparable.
+    """
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
+        except Exception:
+            value = None
+        if value is None:
+            return datetime.utcnow()
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@dataclass
+class ClusterEvent:
+    kind: str  # "open" | "grow" | "close"
+    signature: str
+    size: int
+    members: List[Any]
+    first_seen: datetime
+    last_seen: datetime
+
+
+@dataclass
+class _SignatureState:
+    window: deque = field(default_factory=deque)  # (key, ts) within the time window
+    members: List[Any] = field(default_factory=list)
+    size: int = 0
+    first_seen: Optional[datetime] = None
+    last_seen: Optional[datetime] = None
+    open: bool = False
+
+
+class StreamingTemporalClusterer:
+    """
+    Incremental same-text clustering over a time-ordered stream.
+
+    Items are ingested one at a time. Per signature we keep only the items
+    inside the sliding window; once ``min_size`` of them fall within
+    ``window_minutes`` a cluster opens, every further item within the window
+    of the previous one grows it, and the cluster closes after a gap longer
+    than the window. Each transition is emitted once as a :class:`ClusterEvent`.
+
+    Memory is bounded: at most ``max_signatures`` signatures are tracked
+    (least recently active evicted first, closing any open cluster) and each
+    cluster stores at most ``max_members`` member keys (``size`` keeps
+    counting).
+
+    Repeated scans return the same posts again: an item whose key was already
+    ingested within the window is skipped, and an item older than the window
+    (relative to the newest item seen) is too late for any live cluster and
+    is skipped too. Without new items nothing closes, so long-running callers
+    call :meth:`expire` with the wall clock periodically.
+    """
+
+    def __init__(
+        self,
+        window_minutes: int = 10,
+        min_size: int = 2,
+        ngram: int = 5,
+        max_signatures: int = 100_000,
+        max_members: int = 1_000,
+        signature_fn: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        self.window = timedelta(minutes=window_minutes)
+        self.min_size = max(2, int(min_size))
+        self.max_signatures = int(max_signatures)
+        self.max_members = int(max_members)
+        self.signature_fn = signature_fn or (lambda text: text_signature(text, n=ngram))
+        self._states: "OrderedDict[str, _SignatureState]" = OrderedDict()
+        self._seen: "OrderedDict[Any, datetime]" = OrderedDict()  # keys ingested within the window
+        self._now: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def _close(self, sig: str, st: _SignatureState) -> List[ClusterEvent]:
+        if not st.open:
+            return []
+        st.open = False
+        return [ClusterEvent("close", sig, st.size, list(st.members), st.first_seen, st.last_seen)]
+
+    def expire(self, now: datetime) -> List[ClusterEvent]:
+        """Close clusters and drop signatures idle for longer than the window."""
+        events: List[ClusterEvent] = []
+        while self._states:
+            sig, st = next(iter(self._states.items()))
+            if now - st.last_seen <= self.window:
+                break
+            self._states.popitem(last=False)
+            events.extend(self._close(sig, st))
+        return events
+
+    def ingest(self, item: Dict, key: Any = None) -> List[ClusterEvent]:
+        """Add one item (``content_text`` + ``created_at``/``timestamp``).
+
+        ``key`` identifies the item in emitted events (defaults to
+        ``content_id``). Items must arrive in non-decreasing time order.
+        """
+        ts = parse_timestamp(item.get("created_at") or item.get("timestamp"))
+        if key is None:
+            key = item.get("content_id")
+        if self._now is not None and (ts < self._now - self.window or (key is not None and key in self._seen)):
+            return []
+        if self._now is None or ts > self._now:
+            self._now = ts
+        events = self.expire(self._now)
+        if key is not None:
+            self._seen[key] = ts
+            while self._seen and next(iter(self._seen.values())) < self._now - self.window:
+                self._seen.popitem(last=False)
+
+        sig = self.signature_fn(item.get("content_text") or "")
+        if not sig:
+            return events
+
+        st = self._states.get(sig)
+        if st is None:
+            if len(self._states) >= self.max_signatures:
+                old_sig, old_st = self._states.popitem(last=False)
+                events.extend(self._close(old_sig, old_st))
+            st = self._states[sig] = _SignatureState()
+        else:
+            self._states.move_to_end(sig)
+
+        st.window.append((key, ts))
+        while st.window and ts - st.window[0][1] > self.window:
+            st.window.popleft()
+        st.last_seen = ts
+
+        if st.open:
+            st.size += 1
+            if len(st.members) < self.max_members:
+                st.members.append(key)
+            events.append(ClusterEvent("grow", sig, st.size, [key], st.first_seen, ts))
+        elif len(st.window) >= self.min_size:
+            st.open = True
+            st.members = [k for k, _ in st.window][: self.max_members]
+            st.size = len(st.window)
+            st.first_seen = st.window[0][1]
+            events.append(ClusterEvent("open", sig, st.size, list(st.members), st.first_seen, ts))
+        return events
+
+    def flush(self) -> List[ClusterEvent]:
+        """Close every open cluster (end of stream) and reset state."""
+        events: List[ClusterEvent] = []
+        for sig, st in self._states.items():
+            events.extend(self._close(sig, st))
+        self._states.clear()
+        self._seen.clear()
+        self._now = None
+        return events
 
 
 def temporal_cluster_same_text(
-    items: List[Dict], window_minutes: int = 10, ngram: int = 5
+    items: List[Dict], window_minutes: int = 10, ngram: int = 5, near_duplicates: bool = False
 ) -> List[Dict]:
     """
     Group items that share same text signature within a sliding time window.
-    Returns clusters with item indices and summary stats.
+    Returns one cluster per burst with item indices and summary stats.
+
+    With ``near_duplicates`` texts are grouped by MinHash LSH (see
+    ``NearDuplicateIndex``) instead of exact signature.
     """
-    # Precompute signatures and timestamps
-    enriched = []
-    for idx, it in enumerate(items):
-        sig = text_signature((it.get("content_text") or ""), n=ngram)
-        ts_str = it.get("created_at") or it.get("timestamp")
-        try:
-            ts = datetime.fromisoformat(ts_str) if ts_str else datetime.utcnow()
-        except Exception:
-            ts = datetime.utcnow()
-        enriched.append((idx, sig, ts))
-
-    # Group by signature
-    sig_to_items: Dict[str, List[Tuple[int, datetime]]] = defaultdict(list)
-    for idx, sig, ts in enriched:
-        if sig:
-            sig_to_items[sig].append((idx, ts))
-
-    clusters = []
-    window = timedelta(minutes=window_minutes)
-    for sig, entries in sig_to_items.items():
-        entries.sort(key=lambda x: x[1])
-        q: deque = deque()
-        current: List[int] = []
-        for idx, ts in entries:
-            q.append((idx, ts))
-            # Pop outside window
-            while q and (ts - q[0][1]) > window:
-                q.popleft()
-            if len(q) >= 2:
-                current = [i for i, _ in q]
-                clusters.append({
-                    "signature": sig,
-                    "size": len(current),
-                    "indices": current[:],
-                    "window_minutes": window_minutes,
-                })
-    return clusters
+    # Precompute timestamps once and feed the stream in time order
+    order: List[Tuple[datetime, int]] = sorted(
+        ((parse_timestamp(it.get("created_at") or it.get("timestamp")), idx) for idx, it in enumerate(items)),
+        key=lambda x: x[0],
+    )
+    signature_fn = None
+    if near_duplicates:
+        from .signatures import NearDuplicateIndex
 
+        signature_fn = NearDuplicateIndex(ngram=ngram).canonical
+    clusterer = StreamingTemporalClusterer(
+        window_minutes=window_minutes, ngram=ngram, max_members=max(1, len(items)),
+        signature_fn=signature_fn,
+    )
+    closed: List[ClusterEvent] = []
+    for ts, idx in order:
+        it = items[idx]
+        events = clusterer.ingest(
+            {"content_text": it.get("content_text"), "created_at": ts}, key=idx
+        )
+        closed.extend(e for e in events if e.kind == "close")
+    closed.extend(clusterer.flush())
 
+    return [
+        {
+            "signature": e.signature,
+            "size": e.size,
+            "indices": e.members,
+            "window_minutes": window_minutes,
+        }
+        for e in closed
+    ]
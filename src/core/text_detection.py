@@ -9,7 +9,8 @@ Note: For network-level coordinated behavior detection,
 see src/core/coordinated_behavior.py (14-feature weighted model).
 """
 
-from typing import Dict, List, Optional, Any
+import re
+from typing import Dict, Iterable, List, Optional, Any, Sequence, Set
 
 # ---------------------------------------------------------------------------
 # Political Astroturfing
@@ -46,13 +47,19 @@ CONSPIRACY_LANGUAGE = [
 ]
 
 
-def detect_political_astroturfing(text_lower: str) -> Dict[str, Any]:
-    """Detect specific political astroturfing patterns."""
-    targets_elected = any(p in text_lower for p in ELECTED_POLITICIANS)
-    targets_appointed = any(p in text_lower for p in APPOINTED_OFFICIALS)
+def detect_political_astroturfing(text_lower: str, found: Optional[Set[str]] = None) -> Dict[str, Any]:
+    """Detect specific political astroturfing patterns.
+
+    ``found`` is the phrase set from :func:`find_phrases` when the caller
+    has already scanned the text.
+    """
+    if found is None:
+        found = find_phrases(text_lower)
+    targets_elected = any(p in found for p in ELECTED_POLITICIANS)
+    targets_appointed = any(p in found for p in APPOINTED_OFFICIALS)
     targets_politician = targets_elected or targets_appointed
-    has_corruption = any(p in text_lower for p in CORRUPTION_PATTERNS)
-    has_conspiracy = any(p in text_lower for p in CONSPIRACY_LANGUAGE)
+    has_corruption = any(p in found for p in CORRUPTION_PATTERNS)
+    has_conspiracy = any(p in found for p in CONSPIRACY_LANGUAGE)
 
     score = 0.0
     if targets_politician and has_corruption:
@@ -71,11 +78,11 @@ def detect_political_astroturfing(text_lower: str) -> Dict[str, Any]:
         "political_astroturfing_score": min(score, 1.0),
         "is_political_astroturfing": score > 0.7,
         "detected_patterns": {
-            "corruption_terms": [p for p in CORRUPTION_PATTERNS if p in text_lower],
-            "conspiracy_terms": [p for p in CONSPIRACY_LANGUAGE if p in text_lower],
-            "targeted_politicians": [p for p in LEGITIMATE_POLITICIANS if p in text_lower],
-            "targeted_elected": [p for p in ELECTED_POLITICIANS if p in text_lower],
-            "targeted_appointed": [p for p in APPOINTED_OFFICIALS if p in text_lower],
+            "corruption_terms": [p for p in CORRUPTION_PATTERNS if p in found],
+            "conspiracy_terms": [p for p in CONSPIRACY_LANGUAGE if p in found],
+            "targeted_politicians": [p for p in LEGITIMATE_POLITICIANS if p in found],
+            "targeted_elected": [p for p in ELECTED_POLITICIANS if p in found],
+            "targeted_appointed": [p for p in APPOINTED_OFFICIALS if p in found],
         },
     }
 
@@ -117,19 +124,21 @@ ASTROTURF_PATTERNS = [
 
 
 def detect_astroturfing_indicators(
-    text: str, context: Optional[Dict] = None
+    text: str, context: Optional[Dict] = None, found: Optional[Set[str]] = None
 ) -> Dict[str, Any]:
     """Detect potential astroturfing indicators in text and context."""
     text_lower = text.lower()
+    if found is None:
+        found = find_phrases(text_lower)
 
     # 1. Coordinated language
-    found_coordinated = [p for p in COORDINATED_PHRASES if p in text_lower]
+    found_coordinated = [p for p in COORDINATED_PHRASES if p in found]
 
     # 2. Emotional manipulation
-    found_emotional = [t for t in EMOTIONAL_TRIGGERS if t in text_lower]
+    found_emotional = [t for t in EMOTIONAL_TRIGGERS if t in found]
 
     # 3. Astroturf language
-    found_astroturf = [p for p in ASTROTURF_PATTERNS if p in text_lower]
+    found_astroturf = [p for p in ASTROTURF_PATTERNS if p in found]
 
     # 4. Suspicious repetition
     words = text_lower.split()
@@ -163,7 +172,7 @@ def detect_astroturfing_indicators(
             score += 0.3
 
     # 7. Political astroturfing sub-score
-    political = detect_political_astroturfing(text_lower)
+    political = detect_political_astroturfing(text_lower, found)
 
     return {
         "astroturfing_score": min(score, 1.0),
@@ -207,15 +216,16 @@ AMBIGUOUS_PHRASES = [
 ]
 
 
-def detect_logical_contradictions(text: str) -> Dict[str, Any]:
+def detect_logical_contradictions(text: str, found: Optional[Set[str]] = None) -> Dict[str, Any]:
     """Detect logical contradictions in the text."""
-    text_lower = text.lower()
+    if found is None:
+        found = find_phrases(text.lower())
 
     found_contradictions = [
         f"{a} and {b}" for a, b in CONTRADICTION_PAIRS
-        if a in text_lower and b in text_lower
+        if a in found and b in found
     ]
-    found_ambiguous = [p for p in AMBIGUOUS_PHRASES if p in text_lower]
+    found_ambiguous = [p for p in AMBIGUOUS_PHRASES if p in found]
 
     return {
         "has_contradictions": len(found_contradictions) > 0,
@@ -224,3 +234,93 @@ def detect_logical_contradictions(text: str) -> Dict[str, Any]:
         "ambiguous_phrases": found_ambiguous,
         "logical_consistency_score": 0.0 if found_contradictions or found_ambiguous else 1.0,
     }
+
+
+# ---------------------------------------------------------------------------
+# Phrase Automaton (all lists, one pass)
+# ---------------------------------------------------------------------------
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Regex for a character trie of ``phrases`` that prefers the longest match."""
+    trie: Dict[str, Dict] = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class PhraseAutomaton:
+    """
+    Named phrase lists compiled into one substring matcher.
+
+    The phrases form a character trie compiled to a single regex inside a
+    lookahead, so one scan reports, at every position, the longest phrase
+    starting there. All shorter phrases starting at the same position are
+    prefixes of it and are precomputed, which makes :meth:`find` exactly
+    ``{p for p in phrases if p in text}``.
+    """
+
+    def __init__(self, lists: Dict[str, Sequence[str]]) -> None:
+        self.lists = {name: list(phrases) for name, phrases in lists.items()}
+        self.phrases = sorted({p for phrases in self.lists.values() for p in phrases})
+        self._regex = re.compile(f"(?=({_trie_pattern(self.phrases)}))")
+        self._prefixes: Dict[str, List[str]] = {
+            longest: [p for p in self.phrases if longest.startswith(p)] for longest in self.phrases
+        }
+
+    def find(self, text_lower: str) -> Set[str]:
+        """All phrases occurring in ``text_lower`` as substrings."""
+        found: Set[str] = set()
+        for longest in set(self._regex.findall(text_lower)):
+            found.update(self._prefixes[longest])
+        return found
+
+    def hits(self, text_lower: str) -> Dict[str, List[str]]:
+        """Per-list entries occurring in ``text_lower``, in list order."""
+        found = self.find(text_lower)
+        return {name: [p for p in phrases if p in found] for name, phrases in self.lists.items()}
+
+
+PHRASE_AUTOMATON = PhraseAutomaton({
+    "elected_politicians": ELECTED_POLITICIANS,
+    "appointed_officials": APPOINTED_OFFICIALS,
+    "corruption": CORRUPTION_PATTERNS,
+    "conspiracy": CONSPIRACY_LANGUAGE,
+    "coordinated": COORDINATED_PHRASES,
+    "emotional": EMOTIONAL_TRIGGERS,
+    "astroturf": ASTROTURF_PATTERNS,
+    "contradiction_terms": [phrase for pair in CONTRADICTION_PAIRS for phrase in pair],
+    "ambiguous": AMBIGUOUS_PHRASES,
+})
+
+
+def find_phrases(text_lower: str) -> Set[str]:
+    """Phrases from every detector list that occur in ``text_lower``."""
+    return PHRASE_AUTOMATON.find(text_lower)
+
+
+def analyze_text(text: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+    """Astroturfing indicators and logical contradictions from one phrase scan."""
+    found = find_phrases(text.lower())
+    return {
+        "astroturfing": detect_astroturfing_indicators(text, context, found=found),
+        "logical_contradictions": detect_logical_contradictions(text, found=found),
+    }
+
+
+def analyze_texts(
+    texts: Sequence[str], contexts: Optional[Sequence[Optional[Dict]]] = None
+) -> List[Dict[str, Any]]:
+    """Batch :func:`analyze_text` (e.g. every post of a monitoring batch)."""
+    contexts = contexts or [None] * len(texts)
+    return [analyze_text(text or "", ctx) for text, ctx in zip(texts, contexts)]
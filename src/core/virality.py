@@ -1,5 +1,7 @@
 from typing import Dict
 
+import numpy as np
+
 
 class ViralityPredictor:
     """
@@ -25,4 +27,11 @@ class ViralityPredictor:
         score_0_1 = min(1.0, 0.5 * v_growth + 0.3 * v_views + 0.2 * v_followers)
         return round(score_0_1 * 10.0, 2)
 
+    def predict_batch(self, views: np.ndarray, growth_rate_24h: np.ndarray, author_followers: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`predict` over equal-length float arrays."""
+        v_views = np.minimum(1.5, views / self.views_scale)
+        v_growth = np.minimum(1.5, growth_rate_24h)
+        v_followers = np.minimum(1.5, author_followers / self.followers_scale)
 
+        score_0_1 = np.minimum(1.0, 0.5 * v_growth + 0.3 * v_views + 0.2 * v_followers)
+        return np.array([round(x, 2) for x in (score_0_1 * 10.0).tolist()])
@@ -1,16 +1,40 @@
 import json
+import re
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Pattern, Set
+
+
+def _norm_handle(handle: Optional[str]) -> str:
+    return (handle or "").strip().lstrip("@").lower()
 
 
 class WatchlistStore:
-    """File-backed watchlists with custom ROI thresholds per client."""
+    """File-backed watchlists with custom ROI thresholds per client.
+
+    The file is parsed once and kept in memory together with two indexes:
+    account handle → clients and topic term → clients. Topic terms are
+    compiled into a single word-bounded regex, so matching a post against
+    every client's topics is one scan of its text. The file's mtime is
+    re-checked at most every ``reload_interval`` seconds and the indexes are
+    rebuilt when it changes on disk.
+    """
 
-    def __init__(self, path: str = "demo_data/watchlists.json") -> None:
+    def __init__(self, path: str = "demo_data/watchlists.json", reload_interval: float = 2.0) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.reload_interval = float(reload_interval)
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict] = {}
+        self._accounts: Dict[str, Set[str]] = {}
+        self._topics: Dict[str, Set[str]] = {}
+        self._topic_re: Optional[Pattern] = None
+        self._stamp = None
+        self._checked_at = 0.0
         if not self.path.exists():
             self._write({})
+        self._load()
 
     def _read(self) -> Dict:
         try:
@@ -21,23 +45,97 @@ class WatchlistStore:
     def _write(self, obj: Dict) -> None:
         self.path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
 
+    def _file_stamp(self):
+        try:
+            st = self.path.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _load(self) -> None:
+        self._stamp = self._file_stamp()
+        self._checked_at = time.monotonic()
+        self._index(self._read())
+
+    def _index(self, data: Dict) -> None:
+        accounts: Dict[str, Set[str]] = {}
+        topics: Dict[str, Set[str]] = {}
+        for client, wl in data.items():
+            for handle in wl.get("accounts") or []:
+                h = _norm_handle(handle)
+                if h:
+                    accounts.setdefault(h, set()).add(client)
+            for term in wl.get("topics") or []:
+                t = (term or "").strip().lower()
+                if t:
+                    topics.setdefault(t, set()).add(client)
+        topic_re = None
+        if topics:
+            # Longest first so overlapping terms prefer the most specific match
+            alternation = "|".join(re.escape(t) for t in sorted(topics, key=len, reverse=True))
+            topic_re = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+        self._data, self._accounts, self._topics, self._topic_re = data, accounts, topics, topic_re
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        with self._lock:
+            self._checked_at = now
+            stamp = self._file_stamp()
+            if stamp != self._stamp:
+                self._stamp = stamp
+                self._index(self._read())
+
     def list(self) -> Dict:
-        return self._read()
+        self._maybe_reload()
+        return self._data
 
     def upsert(self, client: str, data: Dict) -> Dict:
         client = (client or "").strip().lower()
-        obj = self._read()
-        wl = obj.get(client, {
-            "topics": [],
-            "accounts": [],
-            "roi_threshold": 1.0,  # multiplier applied to default thresholds
-        })
-        wl.update({k: v for k, v in data.items() if k in ("topics", "accounts", "roi_threshold")})
-        obj[client] = wl
-        self._write(obj)
+        with self._lock:
+            obj = self._read()
+            wl = obj.get(client, {
+                "topics": [],
+                "accounts": [],
+                "roi_threshold": 1.0,  # multiplier applied to default thresholds
+            })
+            wl.update({k: v for k, v in data.items() if k in ("topics", "accounts", "roi_threshold")})
+            obj[client] = wl
+            self._write(obj)
+            self._stamp = self._file_stamp()
+            self._checked_at = time.monotonic()
+            self._index(obj)
         return wl
 
     def get(self, client: str) -> Optional[Dict]:
-        return self._read().get((client or "").strip().lower())
+        self._maybe_reload()
+        return self._data.get((client or "").strip().lower())
+
+    def clients_for_account(self, handle: Optional[str]) -> List[str]:
+        self._maybe_reload()
+        return sorted(self._accounts.get(_norm_handle(handle), ()))
+
+    def clients_for_text(self, text: Optional[str]) -> List[str]:
+        """Clients whose topic terms occur (as whole words) in ``text``."""
+        self._maybe_reload()
+        topic_re = self._topic_re
+        if not text or topic_re is None:
+            return []
+        clients: Set[str] = set()
+        for m in topic_re.finditer(text):
+            clients |= self._topics.get(m.group(0).lower(), set())
+        return sorted(clients)
 
+    def lookup(self, author_username: Optional[str] = None, content_text: Optional[str] = None) -> Optional[Dict]:
+        """Watchlist that applies to a post: account match first, then topic match.
 
+        When several clients match, the one with the lowest ``roi_threshold``
+        (most sensitive) wins.
+        """
+        clients = self.clients_for_account(author_username) or self.clients_for_text(content_text)
+        if not clients:
+            return None
+        data = self._data
+        best = min(clients, key=lambda c: float(data.get(c, {}).get("roi_threshold", 1.0)))
+        return {"client": best, **data.get(best, {})}
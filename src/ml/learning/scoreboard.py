@@ -11,10 +11,12 @@ Metrics tracked:
 
 This is the "ehrlichste KPI" - honest quality tracking.
 """
-from typing import Dict, List, Optional, Set
+from typing import Any, Deque, Dict, Iterable, List, Optional, Pattern, Sequence, Set, Tuple
 from pydantic import BaseModel
+from collections import deque
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 import re
 import logging
 
@@ -94,6 +96,153 @@ class ScoreboardSummary(BaseModel):
     violation_counts: Dict[str, int] = {}
 
 
+class _ScoreAggregate:
+    """Running sums behind a ScoreboardSummary; scores can be added and removed."""
+
+    __slots__ = (
+        "total", "chars", "sentences", "sources", "violations", "with_violations",
+        "high_generic", "high_escalation", "qa_count", "qa_sum", "violation_counts",
+    )
+
+    def __init__(self):
+        self.total = 0
+        self.chars = 0
+        self.sentences = 0
+        self.sources = 0
+        self.violations = 0
+        self.with_violations = 0
+        self.high_generic = 0
+        self.high_escalation = 0
+        self.qa_count = 0
+        self.qa_sum = 0.0
+        self.violation_counts: Dict[str, int] = {}
+
+    def add(self, score: ResponseScore, sign: int = 1) -> None:
+        self.total += sign
+        self.chars += sign * score.char_count
+        self.sentences += sign * score.sentence_count
+        self.sources += sign * score.source_count
+        self.violations += sign * score.violation_count
+        self.with_violations += sign * (score.violation_count > 0)
+        self.high_generic += sign * (score.genericness_score > 0.3)
+        self.high_escalation += sign * (score.escalation_risk > 0.3)
+        self.add_qa(score.source_relevance_rate, sign)
+        for v in score.violations:
+            n = self.violation_counts.get(v.value, 0) + sign
+            if n:
+                self.violation_counts[v.value] = n
+            else:
+                self.violation_counts.pop(v.value, None)
+
+    def remove(self, score: ResponseScore) -> None:
+        self.add(score, -1)
+
+    def add_qa(self, rate: Optional[float], sign: int = 1) -> None:
+        if rate is not None:
+            self.qa_count += sign
+            self.qa_sum += sign * rate
+
+    def summary(self) -> ScoreboardSummary:
+        total = self.total
+        if total <= 0:
+            return ScoreboardSummary()
+        return ScoreboardSummary(
+            total_responses=total,
+            avg_chars=round(self.chars / total, 1),
+            avg_sentences=round(self.sentences / total, 1),
+            avg_sources=round(self.sources / total, 1),
+            avg_violations=round(self.violations / total, 2),
+            violation_rate=round(self.with_violations / total, 3),
+            genericness_rate=round(self.high_generic / total, 3),
+            escalation_rate=round(self.high_escalation / total, 3),
+            source_relevance_rate=round(self.qa_sum / self.qa_count, 3) if self.qa_count else 0.0,
+            violation_counts=dict(self.violation_counts),
+        )
+
+
+class RuleScanner:
+    """
+    Compiled matcher for all scoreboard rule families.
+
+    Rules that are plain word/phrase alternations (``\\b(a|b c)\\b``) are
+    folded into one phrase table and matched in a single tokenizing pass
+    over the text; that pass also yields the sentence-ending punctuation
+    runs. The remaining rules (wildcards, optional letters, punctuation) are
+    compiled once and, for families where any hit is enough, combined into
+    a single alternation that only runs if the phrase pass found nothing.
+
+    Matching is equivalent to ``re.search(pattern, text_lower, re.IGNORECASE)``
+    per rule.
+    """
+
+    _TOKEN_RE = re.compile(r"(\w+)|[.!?]+")
+    _PHRASE_RE = re.compile(r"\w+(?: \w+)*")
+
+    def __init__(self, families: Dict[str, Sequence[str]], count_families: Sequence[str] = ()):
+        self.count_families = set(count_families)
+        self._phrases: Dict[str, List[Tuple[str, int]]] = {}
+        self._max_words = 1
+        self._regexes: Dict[str, List[Tuple[int, Pattern]]] = {}
+        self._any_regex: Dict[str, Pattern] = {}
+        self.families = list(families)
+
+        for family, patterns in families.items():
+            rest = []
+            for idx, pattern in enumerate(patterns):
+                phrases = self._literal_alternatives(pattern)
+                if phrases is None:
+                    rest.append((idx, pattern))
+                    continue
+                for phrase in phrases:
+                    self._phrases.setdefault(phrase, []).append((family, idx))
+                    self._max_words = max(self._max_words, phrase.count(" ") + 1)
+            if family in self.count_families:
+                self._regexes[family] = [(idx, re.compile(p, re.IGNORECASE)) for idx, p in rest]
+            elif rest:
+                self._any_regex[family] = re.compile("|".join(f"(?:{p})" for _, p in rest), re.IGNORECASE)
+
+    @classmethod
+    def _literal_alternatives(cls, pattern: str) -> Optional[List[str]]:
+        if not (pattern.startswith(r"\b") and pattern.endswith(r"\b")):
+            return None
+        body = pattern[2:-2]
+        if body.startswith("(") and body.endswith(")"):
+            body = body[1:-1]
+        alternatives = body.split("|")
+        if all(cls._PHRASE_RE.fullmatch(a) for a in alternatives):
+            return alternatives
+        return None
+
+    def scan(self, text_lower: str) -> Tuple[Dict[str, Set[int]], int]:
+        """Matched rule indices per family, and the number of ``[.!?]+`` runs."""
+        hits: Dict[str, Set[int]] = {family: set() for family in self.families}
+        words: List[Tuple[int, int]] = []
+        punct_runs = 0
+        for m in self._TOKEN_RE.finditer(text_lower):
+            if m.group(1) is None:
+                punct_runs += 1
+            else:
+                words.append(m.span())
+
+        phrases = self._phrases
+        n_words = len(words)
+        for i, (start, _) in enumerate(words):
+            for j in range(i, min(i + self._max_words, n_words)):
+                rules = phrases.get(text_lower[start:words[j][1]])
+                if rules:
+                    for family, idx in rules:
+                        hits[family].add(idx)
+
+        for family, regex in self._any_regex.items():
+            if not hits[family] and regex.search(text_lower):
+                hits[family].add(-1)
+        for family, regexes in self._regexes.items():
+            for idx, regex in regexes:
+                if idx not in hits[family] and regex.search(text_lower):
+                    hits[family].add(idx)
+        return hits, punct_runs
+
+
 class GuardianScoreboard:
     """
     Automatic quality scoring for Guardian responses.
@@ -103,6 +252,12 @@ class GuardianScoreboard:
     2. Format compliance (length, sources)
     3. Quality signals (genericness, escalation risk)
     4. Source relevance (when QA labels available)
+
+    Memory is bounded: only the last ``max_in_memory`` detailed scores are
+    kept (older ones are appended to ``spill_path`` as JSONL). Summaries
+    come from running aggregates, one over all responses and one per
+    ``windows`` size (last N responses, kept with ring buffers), all
+    updated incrementally in ``score_response``.
     """
 
     # Question patterns (Guardian never asks questions)
@@ -250,10 +405,85 @@ class GuardianScoreboard:
         "blanket claims",
     ]
 
-    def __init__(self):
-        self.scores: List[ResponseScore] = []
+    @classmethod
+    def _rule_scanner(cls) -> RuleScanner:
+        """Scanner for this class's rule tables, compiled on first use."""
+        scanner = cls.__dict__.get("_compiled_scanner")
+        if scanner is None:
+            scanner = RuleScanner(
+                {
+                    "question": cls.QUESTION_PATTERNS,
+                    "irony": cls.IRONY_PATTERNS,
+                    "emotional": cls.EMOTIONAL_PATTERNS,
+                    "hard_boundary": cls.HARD_BOUNDARY_PATTERNS,
+                    "soft_boundary": cls.SOFT_BOUNDARY_PATTERNS,
+                    "generic": cls.GENERIC_PATTERNS,
+                    "escalation": cls.ESCALATION_PATTERNS,
+                },
+                count_families=("generic", "escalation"),
+            )
+            cls._compiled_scanner = scanner
+        return scanner
+
+    def __init__(
+        self,
+        max_in_memory: int = 10_000,
+        windows: Sequence[int] = (100, 1000),
+        spill_path: Optional[str] = "demo_data/ml/logs/scoreboard_scores.jsonl",
+    ):
+        self.max_in_memory = max(1, int(max_in_memory))
+        self.scores: Deque[ResponseScore] = deque(maxlen=self.max_in_memory)
+        self._by_id: Dict[str, ResponseScore] = {}
+        self._seq: Dict[str, int] = {}
+        self._count = 0
+        self._total = _ScoreAggregate()
+        self._windows: Dict[int, _ScoreAggregate] = {}
+        self._window_buffers: Dict[int, Deque[ResponseScore]] = {}
+        for n in sorted({int(w) for w in windows if 0 < int(w) <= self.max_in_memory}):
+            self._windows[n] = _ScoreAggregate()
+            self._window_buffers[n] = deque(maxlen=n)
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.spilled = 0
         logger.info("GuardianScoreboard initialized")
 
+    def _record(self, score: ResponseScore) -> None:
+        """Add a new score to the aggregates, windows and bounded history."""
+        self._total.add(score)
+        for n, buf in self._window_buffers.items():
+            if len(buf) == n:
+                self._windows[n].remove(buf[0])
+            buf.append(score)
+            self._windows[n].add(score)
+
+        if len(self.scores) == self.max_in_memory:
+            self._spill(self.scores[0])
+        self.scores.append(score)
+        self._count += 1
+        self._by_id[score.response_id] = score
+        self._seq[score.response_id] = self._count
+
+    def _spill(self, score: ResponseScore) -> None:
+        if self._by_id.get(score.response_id) is score:
+            del self._by_id[score.response_id]
+            del self._seq[score.response_id]
+        self.spilled += 1
+        if self.spill_path is None:
+            return
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                f.write(score.model_dump_json() + "\n")
+        except OSError as e:
+            logger.warning("Scoreboard spill failed: %s", e)
+
+    def _iter_spilled_tail(self, n: int) -> Iterable[ResponseScore]:
+        """Last ``n`` spilled scores, oldest first (slow path, reads the spill file)."""
+        if n <= 0 or self.spill_path is None or not self.spill_path.exists():
+            return []
+        with open(self.spill_path, encoding="utf-8") as f:
+            tail = deque(f, maxlen=n)
+        return [ResponseScore.model_validate_json(line) for line in tail]
+
     def score_response(
         self,
         response_id: str,
@@ -261,7 +491,8 @@ class GuardianScoreboard:
         sources: List[str],
         max_chars: int = 450,
         risk_level: str = "medium",
-        claim_types: Optional[List[str]] = None
+        claim_types: Optional[List[str]] = None,
+        record: bool = True
     ) -> ResponseScore:
         """
         Score a Guardian response for quality metrics.
@@ -273,6 +504,7 @@ class GuardianScoreboard:
             max_chars: Maximum allowed characters
             risk_level: Risk level (low, medium, high, critical)
             claim_types: List of claim type strings
+            record: Add the score to the scoreboard history and aggregates
 
         Returns:
             ResponseScore with all metrics
@@ -280,37 +512,25 @@ class GuardianScoreboard:
         text_lower = response_text.lower()
         violations = []
         claim_types = claim_types or []
+        hits, sentence_count = self._rule_scanner().scan(text_lower)
 
         # Check character limit
         char_count = len(response_text)
         if char_count > max_chars:
             violations.append(RuleViolationType.EXCEEDED_LENGTH)
 
-        # Count sentences (rough estimate)
-        sentence_count = len(re.findall(r'[.!?]+', response_text))
-
         # Check source count
         source_count = len(sources)
         if source_count < 3:
             violations.append(RuleViolationType.INSUFFICIENT_SOURCES)
 
-        # Check for questions
-        for pattern in self.QUESTION_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                violations.append(RuleViolationType.ASKED_QUESTION)
-                break
-
-        # Check for irony
-        for pattern in self.IRONY_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                violations.append(RuleViolationType.USED_IRONY)
-                break
-
-        # Check for emotional language
-        for pattern in self.EMOTIONAL_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                violations.append(RuleViolationType.EMOTIONAL_LANGUAGE)
-                break
+        # Check for questions, irony and emotional language
+        if hits["question"]:
+            violations.append(RuleViolationType.ASKED_QUESTION)
+        if hits["irony"]:
+            violations.append(RuleViolationType.USED_IRONY)
+        if hits["emotional"]:
+            violations.append(RuleViolationType.EMOTIONAL_LANGUAGE)
 
         # =======================================================================
         # RISK-AWARE BOUNDARY CHECK
@@ -321,35 +541,16 @@ class GuardianScoreboard:
             any(ct in self.HIGH_RISK_CLAIM_TYPES for ct in claim_types)
         )
 
-        # Check for hard boundary (regex OR sentence-start)
-        has_hard_boundary = False
-        for pattern in self.HARD_BOUNDARY_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                has_hard_boundary = True
-                break
-
-        # Sentence-start hard boundary detection
-        if not has_hard_boundary:
-            first_sentence = text_lower.split('.')[0].strip() if text_lower else ""
-            for start in self.HARD_BOUNDARY_STARTS:
-                if first_sentence.startswith(start) or text_lower.startswith(start):
-                    has_hard_boundary = True
-                    break
-
-        # Check for soft boundary (regex OR sentence-start)
-        has_soft_boundary = False
-        for pattern in self.SOFT_BOUNDARY_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                has_soft_boundary = True
-                break
-
-        # Sentence-start soft boundary detection
-        if not has_soft_boundary:
-            first_sentence = text_lower.split('.')[0].strip() if text_lower else ""
-            for start in self.SOFT_BOUNDARY_STARTS:
-                if first_sentence.startswith(start) or text_lower.startswith(start):
-                    has_soft_boundary = True
-                    break
+        # Boundaries: regex OR sentence-start
+        first_sentence = text_lower.split('.')[0].strip() if text_lower else ""
+        hard_starts = tuple(self.HARD_BOUNDARY_STARTS)
+        soft_starts = tuple(self.SOFT_BOUNDARY_STARTS)
+        has_hard_boundary = bool(hits["hard_boundary"]) or (
+            first_sentence.startswith(hard_starts) or text_lower.startswith(hard_starts)
+        )
+        has_soft_boundary = bool(hits["soft_boundary"]) or (
+            first_sentence.startswith(soft_starts) or text_lower.startswith(soft_starts)
+        )
 
         # Determine boundary type and violation
         if has_hard_boundary:
@@ -371,22 +572,14 @@ class GuardianScoreboard:
             violations.append(RuleViolationType.MISSING_BOUNDARY)
         # LOW risk: boundary optional, no violation
 
-        # Calculate genericness score
-        generic_matches = 0
-        for pattern in self.GENERIC_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                generic_matches += 1
-        genericness_score = min(1.0, generic_matches / 3)
+        # Calculate genericness score (one count per matching rule)
+        genericness_score = min(1.0, len(hits["generic"]) / 3)
 
         if genericness_score > 0.3:
             violations.append(RuleViolationType.GENERIC_RESPONSE)
 
         # Calculate escalation risk
-        escalation_matches = 0
-        for pattern in self.ESCALATION_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                escalation_matches += 1
-        escalation_risk = min(1.0, escalation_matches / 2)
+        escalation_risk = min(1.0, len(hits["escalation"]) / 2)
 
         # Create score
         score = ResponseScore(
@@ -403,15 +596,51 @@ class GuardianScoreboard:
             boundary_type=boundary_type,
         )
 
-        self.scores.append(score)
+        if record:
+            self._record(score)
+            logger.info(
+                "Scored response %s: %d chars, %d violations, boundary=%s (%s)",
+                response_id[:8], char_count, score.violation_count,
+                boundary_detected, boundary_type.value
+            )
 
+        return score
+
+    def score_batch(
+        self,
+        responses: Sequence[Dict[str, Any]],
+        max_chars: int = 450,
+        risk_level: str = "medium",
+    ) -> List[ResponseScore]:
+        """
+        Score many responses in one call.
+
+        Each item needs ``response_id``, ``response_text`` and ``sources``
+        and may override ``max_chars``, ``risk_level`` and ``claim_types``.
+        Scores are recorded like ``score_response`` but logged as one line.
+
+        Returns:
+            ResponseScore per item, in input order
+        """
+        scores = [
+            self.score_response(
+                response_id=r["response_id"],
+                response_text=r.get("response_text") or "",
+                sources=r.get("sources") or [],
+                max_chars=r.get("max_chars", max_chars),
+                risk_level=r.get("risk_level") or risk_level,
+                claim_types=r.get("claim_types"),
+                record=False,
+            )
+            for r in responses
+        ]
+        for score in scores:
+            self._record(score)
         logger.info(
-            "Scored response %s: %d chars, %d violations, boundary=%s (%s)",
-            response_id[:8], char_count, score.violation_count,
-            boundary_detected, boundary_type.value
+            "Scored batch of %d responses: %d with violations",
+            len(scores), sum(1 for sc in scores if sc.violation_count)
         )
-
-        return score
+        return scores
 
     def add_source_qa(
         self,
@@ -428,26 +657,33 @@ class GuardianScoreboard:
         Returns:
             Source relevance rate (% SUPPORTED or REFUTED)
         """
-        for score in self.scores:
-            if score.response_id == response_id:
-                score.source_labels = source_labels
-
-                # Calculate relevance rate
-                total = len(source_labels)
-                if total > 0:
-                    relevant = sum(
-                        1 for label in source_labels.values()
-                        if label in (SourceRelevanceLabel.SUPPORTED, SourceRelevanceLabel.REFUTED)
-                    )
-                    score.source_relevance_rate = relevant / total
-                else:
-                    score.source_relevance_rate = 0.0
-
-                logger.info(
-                    "Added QA labels for %s: relevance_rate=%.2f",
-                    response_id[:8], score.source_relevance_rate
+        score = self._by_id.get(response_id)
+        if score is not None:
+            old_rate = score.source_relevance_rate
+            score.source_labels = source_labels
+
+            # Calculate relevance rate
+            total = len(source_labels)
+            if total > 0:
+                relevant = sum(
+                    1 for label in source_labels.values()
+                    if label in (SourceRelevanceLabel.SUPPORTED, SourceRelevanceLabel.REFUTED)
                 )
-                return score.source_relevance_rate
+                score.source_relevance_rate = relevant / total
+            else:
+                score.source_relevance_rate = 0.0
+
+            # Move the score's QA contribution in every aggregate that holds it
+            age = self._count - self._seq[response_id]
+            for agg in [self._total] + [w for n, w in self._windows.items() if age < n]:
+                agg.add_qa(old_rate, -1)
+                agg.add_qa(score.source_relevance_rate)
+
+            logger.info(
+                "Added QA labels for %s: relevance_rate=%.2f",
+                response_id[:8], score.source_relevance_rate
+            )
+            return score.source_relevance_rate
 
         logger.warning("Response not found for QA: %s", response_id)
         return None
@@ -456,63 +692,31 @@ class GuardianScoreboard:
         """
         Get aggregate scoreboard summary.
 
+        O(1) for all responses and for ``last_n`` matching a configured
+        window; other ``last_n`` values are aggregated from the retained
+        scores (and the spill file if ``last_n`` reaches past them).
+
         Args:
             last_n: Only consider last N responses
 
         Returns:
             ScoreboardSummary with aggregate metrics
         """
-        scores = self.scores[-last_n:] if last_n else self.scores
-
-        if not scores:
-            return ScoreboardSummary()
-
-        total = len(scores)
-
-        # Calculate averages
-        avg_chars = sum(s.char_count for s in scores) / total
-        avg_sentences = sum(s.sentence_count for s in scores) / total
-        avg_sources = sum(s.source_count for s in scores) / total
-        avg_violations = sum(s.violation_count for s in scores) / total
-
-        # Calculate rates
-        with_violations = sum(1 for s in scores if s.violation_count > 0)
-        violation_rate = with_violations / total
-
-        high_generic = sum(1 for s in scores if s.genericness_score > 0.3)
-        genericness_rate = high_generic / total
-
-        high_escalation = sum(1 for s in scores if s.escalation_risk > 0.3)
-        escalation_rate = high_escalation / total
-
-        # Source relevance (only for scores with QA)
-        with_qa = [s for s in scores if s.source_relevance_rate is not None]
-        if with_qa:
-            source_relevance_rate = sum(s.source_relevance_rate for s in with_qa) / len(with_qa)
-        else:
-            source_relevance_rate = 0.0
-
-        # Violation breakdown
-        violation_counts: Dict[str, int] = {}
-        for score in scores:
-            for v in score.violations:
-                violation_counts[v.value] = violation_counts.get(v.value, 0) + 1
-
-        return ScoreboardSummary(
-            total_responses=total,
-            avg_chars=round(avg_chars, 1),
-            avg_sentences=round(avg_sentences, 1),
-            avg_sources=round(avg_sources, 1),
-            avg_violations=round(avg_violations, 2),
-            violation_rate=round(violation_rate, 3),
-            genericness_rate=round(genericness_rate, 3),
-            escalation_rate=round(escalation_rate, 3),
-            source_relevance_rate=round(source_relevance_rate, 3),
-            violation_counts=violation_counts,
-        )
+        if not last_n or last_n >= self._count:
+            return self._total.summary()
+        if last_n in self._windows:
+            return self._windows[last_n].summary()
+
+        agg = _ScoreAggregate()
+        in_memory = list(self.scores)
+        for score in in_memory[-last_n:]:
+            agg.add(score)
+        for score in self._iter_spilled_tail(last_n - len(in_memory)):
+            agg.add(score)
+        return agg.summary()
 
     def get_problem_responses(self, min_violations: int = 2) -> List[ResponseScore]:
-        """Get responses with multiple violations for review."""
+        """Get retained responses (last ``max_in_memory``) with multiple violations for review."""
         return [s for s in self.scores if s.violation_count >= min_violations]
 
 
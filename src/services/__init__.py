@@ -1,28 +1,59 @@
 # TruthShield Services
 
-# Fact-Checking APIs
-from .google_factcheck import search_google_factchecks, GoogleFactCheckAPI
-from .claimbuster_api import score_claim_worthiness, search_similar_claims, ClaimBusterAPI
-from .news_api import search_news_context, get_headlines_context, NewsAPIClient
+# Re-exports are resolved on first access (PEP 562), so importing one service
+# module does not import every client in the package.
+_EXPORTS = {
+    # Fact-Checking APIs
+    "search_google_factchecks": ".google_factcheck",
+    "GoogleFactCheckAPI": ".google_factcheck",
+    "score_claim_worthiness": ".claimbuster_api",
+    "search_similar_claims": ".claimbuster_api",
+    "ClaimBusterAPI": ".claimbuster_api",
+    "search_news_context": ".news_api",
+    "get_headlines_context": ".news_api",
+    "NewsAPIClient": ".news_api",
 
-# Knowledge Base APIs
-from .wiki_api import search_mediawiki_sources, fetch_wikipedia_pages, fetch_wikidata_entities
+    # Knowledge Base APIs
+    "search_mediawiki_sources": ".wiki_api",
+    "fetch_wikipedia_pages": ".wiki_api",
+    "fetch_wikidata_entities": ".wiki_api",
 
-# Academic/Scientific APIs
-from .pubmed_api import search_pubmed, PubMedAPI
-from .arxiv_api import search_arxiv, ArXivAPI
-from .core_api import search_core, CoreAPI
-from .semantic_scholar_api import search_semantic_scholar, SemanticScholarAPI
+    # Academic/Scientific APIs
+    "search_pubmed": ".pubmed_api",
+    "PubMedAPI": ".pubmed_api",
+    "search_arxiv": ".arxiv_api",
+    "ArXivAPI": ".arxiv_api",
+    "search_core": ".core_api",
+    "CoreAPI": ".core_api",
+    "search_semantic_scholar": ".semantic_scholar_api",
+    "SemanticScholarAPI": ".semantic_scholar_api",
 
-# Health APIs
-from .who_api import search_who, get_who_stats, WHOAPI
+    # Health APIs
+    "search_who": ".who_api",
+    "get_who_stats": ".who_api",
+    "WHOAPI": ".who_api",
 
-# RSS News Aggregator
-from .rss_news import search_rss_news, get_headlines, RSSNewsAggregator
+    # RSS News Aggregator
+    "search_rss_news": ".rss_news",
+    "get_headlines": ".rss_news",
+    "RSSNewsAggregator": ".rss_news",
+
+    # Utility Services
+    "OCRService": ".ocr_service",
+    "WebScraper": ".web_scraper",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Utility Services
-from .ocr_service import OCRService
-from .web_scraper import WebScraper
 
 __all__ = [
     # Fact-Checking
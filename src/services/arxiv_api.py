@@ -10,6 +10,7 @@ from typing import Dict, List, Optional
 import httpx
 from datetime import datetime
 import re
+from src.core.resilience import resilient_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class ArXivAPI:
         self.session = None
 
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self.session = resilient_client("arxiv")
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -41,7 +42,7 @@ class ArXivAPI:
         """
         try:
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("arxiv")
 
             logger.info(f"📄 Searching arXiv for: '{query[:50]}...'")
 
@@ -161,7 +162,7 @@ class ArXivAPI:
         """
         try:
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("arxiv")
 
             search_query = f"cat:{category} AND all:{query}"
 
@@ -9,6 +9,7 @@ from typing import Dict, List, Optional
 import httpx
 from datetime import datetime
 from src.core.config import settings
+from src.core.resilience import resilient_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class ClaimBusterAPI:
         self.session = None
         
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self.session = resilient_client("claimbuster", idempotent_posts=True)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -51,7 +52,7 @@ class ClaimBusterAPI:
             logger.info(f"🔍 Scoring text with ClaimBuster ({'GET' if use_get else 'POST'}): '{text[:50]}...'")
             
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("claimbuster", idempotent_posts=True)
             
             if use_get:
                 # GET Request - text in URL path
@@ -121,7 +122,7 @@ class ClaimBusterAPI:
             logger.info(f"🔍 Searching ClaimBuster for: '{query[:50]}...'")
             
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("claimbuster", idempotent_posts=True)
                 
             response = await self.session.get(
                 f"{self.base_url}/query/search/",
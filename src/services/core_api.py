@@ -9,6 +9,7 @@ import logging
 from typing import Dict, List, Optional
 import httpx
 from src.core.config import settings
+from src.core.resilience import resilient_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class CoreAPI:
         self.session = None
 
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self.session = resilient_client("core")
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -45,7 +46,7 @@ class CoreAPI:
 
         try:
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("core")
 
             logger.info(f"📖 Searching CORE.ac.uk for: '{query[:50]}...'")
 
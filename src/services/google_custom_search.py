@@ -8,6 +8,7 @@ import logging
 from typing import Dict, List, Optional
 import httpx
 from src.core.config import settings
+from src.core.resilience import resilient_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ class GoogleCustomSearchAPI:
         self.session = None
 
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self.session = resilient_client("google_custom_search")
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -67,7 +68,7 @@ class GoogleCustomSearchAPI:
             logger.info(f"Searching Custom Search for: '{query[:50]}...' (sites: {site_restrict or 'all'})")
 
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("google_custom_search")
 
             response = await self.session.get(self.base_url, params=params)
             response.raise_for_status()
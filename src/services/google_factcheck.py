@@ -9,6 +9,7 @@ from typing import Dict, List, Optional
 import httpx
 from datetime import datetime
 from src.core.config import settings
+from src.core.resilience import resilient_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class GoogleFactCheckAPI:
         self.session = None
         
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self.session = resilient_client("google_fact_check")
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -55,7 +56,7 @@ class GoogleFactCheckAPI:
             logger.info(f"🔍 Searching Google Fact Check for: '{query[:50]}...'")
             
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("google_fact_check")
                 
             response = await self.session.get(self.base_url, params=params)
             response.raise_for_status()
@@ -9,6 +9,7 @@ from typing import Dict, List, Optional
 import httpx
 from datetime import datetime, timedelta
 from src.core.config import settings
+from src.core.resilience import resilient_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class NewsAPIClient:
         self.session = None
         
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self.session = resilient_client("news_api")
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -62,7 +63,7 @@ class NewsAPIClient:
             logger.info(f"🔍 Searching News API for: '{query[:50]}...' (lang={language})")
             
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("news_api")
                 
             response = await self.session.get(f"{self.base_url}/everything", params=params)
             response.raise_for_status()
@@ -123,7 +124,7 @@ class NewsAPIClient:
                 params['category'] = category
             
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("news_api")
                 
             response = await self.session.get(f"{self.base_url}/top-headlines", params=params)
             response.raise_for_status()
@@ -1,27 +1,38 @@
 import io
+import os
+import hashlib
 import logging
 import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import lru_cache
-from typing import List
+from typing import Callable, List, Optional, Tuple
 
-# Optional import - OCR is not critical for fact-checking
-try:
-    import easyocr
-    from PIL import Image
-    import numpy as np
-    EASYOCR_AVAILABLE = True
-except ImportError:
-    EASYOCR_AVAILABLE = False
-    easyocr = None
+from src.core.config import settings
+from src.core.lazy_imports import feature_enabled, lazy_import, module_available
+from src.core.single_flight import SingleFlight
+
+# Optional dependencies - OCR is not critical for fact-checking. EasyOCR pulls
+# in torch, so it is only imported inside the OCR worker processes.
+PIL_AVAILABLE = module_available("PIL")
+EASYOCR_AVAILABLE = feature_enabled("ocr") and PIL_AVAILABLE and module_available("easyocr")
+easyocr = lazy_import("easyocr", feature="ocr")
 
 logger = logging.getLogger(__name__)
 
 
+class OCRQueueFull(Exception):
+    """Raised when the OCR pool already has its maximum number of jobs waiting."""
+
+
 @lru_cache(maxsize=1)
 def get_ocr_reader(languages: tuple = ("en", "de")):
     """
     Returns a singleton EasyOCR reader instance.
-    Using lru_cache avoids expensive re-initialization for every request.
+    Using lru_cache avoids expensive re-initialization for every request
+    (in the pool, each worker process initializes its reader once).
     """
     if not EASYOCR_AVAILABLE:
         logger.warning("EasyOCR not installed - OCR features disabled")
@@ -30,40 +41,190 @@ def get_ocr_reader(languages: tuple = ("en", "de")):
     return easyocr.Reader(list(languages), gpu=False)
 
 
-async def extract_text_from_image(file_bytes: bytes, languages: List[str] = None) -> str:
+def preprocess_image(file_bytes: bytes, max_side: int = 1600):
     """
-    Extract text from an image using EasyOCR.
-    Executed in a background thread to avoid blocking the event loop.
+    Decode an image, convert it to grayscale and downscale it so its longest
+    side is at most ``max_side`` pixels. Screenshots keep legible text at
+    that size while recognition time drops with the pixel count.
     """
-    if not file_bytes:
+    import numpy as np
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(file_bytes))
+    image = image.convert("L")
+    if max_side and max(image.size) > max_side:
+        image.thumbnail((max_side, max_side), Image.LANCZOS)
+    return np.array(image)
+
+
+def _init_ocr_worker() -> None:
+    """Keep each worker process to one compute thread; the pool provides parallelism."""
+    try:
+        import torch
+        torch.set_num_threads(1)
+    except Exception:
+        pass
+
+
+def _run_ocr(file_bytes: bytes, languages: Tuple[str, ...], max_side: int) -> str:
+    """OCR job executed inside a pool worker process."""
+    image_np = preprocess_image(file_bytes, max_side)
+
+    reader = get_ocr_reader(tuple(languages))
+    if reader is None:
         return ""
+    results = reader.readtext(image_np, detail=0, paragraph=True)
 
-    if not EASYOCR_AVAILABLE:
-        logger.warning("OCR requested but EasyOCR not installed")
+    if not results:
         return ""
 
-    def _run_ocr() -> str:
-        try:
-            image = Image.open(io.BytesIO(file_bytes))
-            image = image.convert("RGB")
-            image_np = np.array(image)
+    cleaned = [segment.strip() for segment in results if segment.strip()]
+    return "\n".join(cleaned).strip()
+
+
+class OCRPool:
+    """
+    Bounded OCR execution with a result cache.
+
+    - Jobs run in a process pool with ``workers`` processes (defaults to the
+      CPU count), so OCR uses every core without starving the event loop.
+    - At most ``workers + max_queue`` jobs are admitted at once; further
+      submissions raise :class:`OCRQueueFull` (mapped to HTTP 429).
+    - Results are cached by SHA-256 of the image bytes (LRU,
+      ``cache_size`` entries) and concurrent uploads of the same image share
+      one job, so re-uploaded screenshots skip OCR. A cancelled request
+      leaves that job running for the others.
+    - A job counts against the limit until its worker process finishes it,
+      even when every request waiting for it was cancelled.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_queue: int = 16,
+        cache_size: int = 256,
+        max_side: int = 1600,
+        ocr_fn: Callable[[bytes, Tuple[str, ...], int], str] = _run_ocr,
+    ):
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.max_queue = max(0, int(max_queue))
+        self.cache_size = max(0, int(cache_size))
+        self.max_side = int(max_side)
+        self.ocr_fn = ocr_fn
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()  # decremented from the executor's callback thread
+        self._pending = SingleFlight()
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "rejected": 0}
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_ocr_worker)
+        return self._executor
+
+    @staticmethod
+    def _key(file_bytes: bytes, languages: Tuple[str, ...]) -> str:
+        digest = hashlib.sha256(file_bytes).hexdigest()
+        return f"{digest}:{','.join(languages)}"
+
+    def _cache_put(self, key: str, text: str) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = text
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def extract(self, file_bytes: bytes, languages: Tuple[str, ...] = ("en", "de")) -> str:
+        """OCR ``file_bytes``; raises :class:`OCRQueueFull` when the pool is saturated."""
+        key = self._key(file_bytes, languages)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return cached
+
+        job = None
+        if key in self._pending:
+            self.stats["hits"] += 1
+        elif self._in_flight >= self.capacity:
+            self.stats["rejected"] += 1
+            raise OCRQueueFull(f"OCR queue full ({self._in_flight} jobs)")
+        else:
+            self.stats["misses"] += 1
+            try:
+                job = self._get_executor().submit(self.ocr_fn, file_bytes, languages, self.max_side)
+            except BrokenProcessPool:
+                self._executor = None
+                raise
+            # Counted until the worker process is done with it, not until we stop waiting
+            with self._in_flight_lock:
+                self._in_flight += 1
+            job.add_done_callback(self._job_done)
+
+        async def run() -> str:  # only called for the request that submitted ``job``
+            try:
+                text = await asyncio.wrap_future(job)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM); start a fresh pool for later jobs
+                self._executor = None
+                raise
+            self._cache_put(key, text)
+            return text
+
+        text, _ = await self._pending.do(key, run)
+        return text
+
+    def _job_done(self, _job) -> None:
+        with self._in_flight_lock:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global OCR pool (process pool is started on first use)
+ocr_pool = OCRPool(
+    workers=settings.ocr_workers or None,
+    max_queue=settings.ocr_max_queue,
+    cache_size=settings.ocr_cache_size,
+    max_side=settings.ocr_max_side,
+)
 
-            reader = get_ocr_reader(tuple(languages or ["en", "de"]))
-            if reader is None:
-                return ""
-            results = reader.readtext(image_np, detail=0, paragraph=True)
 
-            if not results:
-                return ""
+async def extract_text_from_image(file_bytes: bytes, languages: List[str] = None) -> str:
+    """
+    Extract text from an image using EasyOCR.
+    Executed in the OCR process pool to avoid blocking the event loop.
 
-            cleaned = [segment.strip() for segment in results if segment.strip()]
-            return "\n".join(cleaned).strip()
+    Raises:
+        OCRQueueFull: when too many OCR jobs are already queued
+    """
+    if not file_bytes:
+        return ""
 
-        except Exception as exc:
-            logger.error(f"OCR extraction failed: {exc}")
-            return ""
+    if not EASYOCR_AVAILABLE:
+        logger.warning("OCR requested but EasyOCR not installed")
+        return ""
 
-    return await asyncio.to_thread(_run_ocr)
+    try:
+        return await ocr_pool.extract(file_bytes, tuple(languages or ["en", "de"]))
+    except OCRQueueFull:
+        raise
+    except Exception as exc:
+        logger.error(f"OCR extraction failed: {exc}")
+        return ""
 
 
 class OCRService:
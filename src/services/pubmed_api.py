@@ -9,6 +9,7 @@ import logging
 from typing import Dict, List, Optional
 import httpx
 from datetime import datetime
+from src.core.resilience import resilient_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ class PubMedAPI:
         self.tool = "TruthShield"
 
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self.session = resilient_client("pubmed")
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -43,7 +44,7 @@ class PubMedAPI:
         """
         try:
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("pubmed")
 
             logger.info(f"🔬 Searching PubMed for: '{query[:50]}...'")
 
@@ -166,7 +167,7 @@ class PubMedAPI:
         """Fetch full abstract for a specific article"""
         try:
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("pubmed")
 
             params = {
                 "db": "pubmed",
@@ -14,7 +14,11 @@ import hashlib
 import re
 
 import httpx
-import feedparser
+
+from src.core.factcheck_index import index_documents
+from src.core.lazy_imports import lazy_import
+
+feedparser = lazy_import("feedparser", feature="rss")
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +135,16 @@ class FreshnessHit:
     # Does this source require corroboration for this claim type?
     requires_corroboration: bool = False
 
+    def to_result(self) -> Dict:
+        """Provider-style result dict (as returned by the search services)."""
+        return {
+            "url": self.url,
+            "title": self.title,
+            "snippet": self.snippet,
+            "credibility_score": 0.85 if self.trust_tier == "A" else 0.7,
+            "date_published": self.published.isoformat(),
+        }
+
 
 class RSSFreshnessService:
     """
@@ -232,6 +246,7 @@ class RSSFreshnessService:
             # Update cache
             self._cache[source_id] = hits
             self._last_poll[source_id] = datetime.now()
+            await asyncio.to_thread(index_documents, [hit.to_result() for hit in hits], f"rss:{source_id}")
 
             logger.info(f"📰 Polled {source_id}: {len(hits)} articles in {self.cache_hours}h window")
             return hits
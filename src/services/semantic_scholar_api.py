@@ -8,6 +8,7 @@ import asyncio
 import logging
 from typing import Dict, List, Optional
 import httpx
+from src.core.resilience import resilient_client
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,7 @@ class SemanticScholarAPI:
         self.session = None
 
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self.session = resilient_client("semantic_scholar")
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -39,7 +40,7 @@ class SemanticScholarAPI:
         """
         try:
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("semantic_scholar")
 
             logger.info(f"🎓 Searching Semantic Scholar for: '{query[:50]}...'")
 
@@ -145,7 +146,7 @@ class SemanticScholarAPI:
         """Get detailed information about a specific paper"""
         try:
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("semantic_scholar")
 
             fields = "paperId,title,abstract,authors,year,citationCount,references,citations,venue,url"
 
@@ -174,7 +175,7 @@ class SemanticScholarAPI:
         """
         try:
             if not self.session:
-                self.session = httpx.AsyncClient(timeout=30.0)
+                self.session = resilient_client("semantic_scholar")
 
             # Add field filter to query
             filtered_query = f"{query} fieldsOfStudy:{field}"
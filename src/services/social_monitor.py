@@ -1,11 +1,14 @@
-import tweepy
 import logging
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import asyncio
+import threading
 from src.core.config import settings
 from src.core.prioritization import PrioritizationEngine, PrioritizedItem
 from src.core.virality import ViralityPredictor
+from src.core.lazy_imports import feature_enabled, lazy_import
+
+tweepy = lazy_import("tweepy", feature="twitter")
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +16,9 @@ class SocialMediaMonitor:
     """Monitor social media platforms for misinformation"""
     
     def __init__(self):
-        self.twitter_api = None
+        self._twitter_api = None
+        self._twitter_checked = False
+        self._twitter_lock = threading.Lock()
         self.prioritizer = PrioritizationEngine(
             track_pool_min_views=settings.track_pool_min_views,
             track_pool_min_growth_rate_24h=settings.track_pool_min_growth_rate_24h,
@@ -30,11 +35,27 @@ class SocialMediaMonitor:
             "sap": ["SAP", "SAP Deutschland", "@SAP"],
             "siemens": ["Siemens", "Siemens AG", "@Siemens"]
         }
-        
-        self._init_twitter()
-    
+
+    @property
+    def twitter_api(self):
+        """Twitter client, connected and verified on first use (or by ``connect``)."""
+        if not self._twitter_checked:
+            self.connect()
+        return self._twitter_api
+
+    def connect(self) -> bool:
+        """Verify Twitter credentials once (network call); safe to run in a thread."""
+        with self._twitter_lock:
+            if not self._twitter_checked:
+                self._init_twitter()
+                self._twitter_checked = True
+        return self._twitter_api is not None
+
     def _init_twitter(self):
         """Initialize Twitter API connection"""
+        if not feature_enabled("twitter"):
+            logger.info("Twitter monitoring disabled (FEATURE_TWITTER=false)")
+            return
         if not settings.twitter_api_key or not settings.twitter_api_secret:
             logger.warning("⚠️ Twitter API credentials not configured")
             return
@@ -44,10 +65,11 @@ class SocialMediaMonitor:
                 settings.twitter_api_key, 
                 settings.twitter_api_secret
             )
-            self.twitter_api = tweepy.API(auth, wait_on_rate_limit=True)
+            api = tweepy.API(auth, wait_on_rate_limit=True)
             
             # Test API connection
-            self.twitter_api.verify_credentials()
+            api.verify_credentials()
+            self._twitter_api = api
             logger.info("✅ Twitter API initialized and verified")
             
         except Exception as e:
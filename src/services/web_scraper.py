@@ -8,7 +8,11 @@ import logging
 from typing import Dict, List, Optional
 from urllib.parse import quote, urlparse
 import httpx
-from bs4 import BeautifulSoup
+
+from src.core.factcheck_index import index_documents
+from src.core.lazy_imports import lazy_import
+
+bs4 = lazy_import("bs4", feature="web_scraping")
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +49,7 @@ class WebScraper:
             response = await self.session.get(search_url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = bs4.BeautifulSoup(response.text, 'html.parser')
             articles = []
 
             # Find article entries
@@ -81,6 +85,7 @@ class WebScraper:
                     continue
 
             logger.info(f"Found {len(articles)} articles from FactCheck.org")
+            await asyncio.to_thread(index_documents, articles, "factcheck_org")
             return articles
 
         except Exception as e:
@@ -99,7 +104,7 @@ class WebScraper:
             response = await self.session.get(search_url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = bs4.BeautifulSoup(response.text, 'html.parser')
             articles = []
 
             # Find article entries (Snopes uses different structure)
@@ -140,6 +145,7 @@ class WebScraper:
                     continue
 
             logger.info(f"Found {len(articles)} articles from Snopes")
+            await asyncio.to_thread(index_documents, articles, "snopes")
             return articles
 
         except Exception as e:
@@ -158,7 +164,7 @@ class WebScraper:
             response = await self.session.get(search_url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = bs4.BeautifulSoup(response.text, 'html.parser')
             articles = []
 
             # Find article entries
@@ -198,6 +204,7 @@ class WebScraper:
                     continue
 
             logger.info(f"Found {len(articles)} articles from Correctiv")
+            await asyncio.to_thread(index_documents, articles, "correctiv")
             return articles
 
         except Exception as e:
@@ -16,7 +16,7 @@ import os
 import certifi
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-import httpx
+from src.core.resilience import resilient_client
 
 # Check if SSL verification should be disabled (for dev environments with proxies)
 DISABLE_SSL = os.getenv("DISABLE_SSL_VERIFY", "false").lower() == "true"
@@ -67,7 +67,7 @@ class WHOAPI:
         results = []
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, verify=SSL_VERIFY) as client:
+            async with resilient_client("who", timeout=self.timeout, verify=SSL_VERIFY) as client:
                 # Search indicators
                 response = await client.get(
                     f"{self.gho_base_url}/Indicator",
@@ -248,7 +248,7 @@ class WHOAPI:
         country: ISO 3-letter code (DEU, USA, etc.)
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, verify=SSL_VERIFY) as client:
+            async with resilient_client("who", timeout=self.timeout, verify=SSL_VERIFY) as client:
                 response = await client.get(
                     f"{self.gho_base_url}/{indicator_code}",
                     params={
@@ -7,6 +7,7 @@ import logging
 from typing import Dict, List
 
 import httpx
+from src.core.resilience import resilient_client
 
 HEADERS = {
     "User-Agent": "TruthShield/1.0 (contact: support@truthshield.eu)",
@@ -43,7 +44,7 @@ async def fetch_wikipedia_pages(query: str, language: str = "de", limit: int = 5
     }
 
     try:
-        async with httpx.AsyncClient(timeout=20.0, headers=HEADERS) as client:
+        async with resilient_client("mediawiki", timeout=20.0, headers=HEADERS) as client:
             response = await client.get(base_url, params=params)
             response.raise_for_status()
             data = response.json()
@@ -94,7 +95,7 @@ async def fetch_wikidata_entities(query: str, language: str = "de", limit: int =
     }
 
     try:
-        async with httpx.AsyncClient(timeout=20.0, headers=HEADERS) as client:
+        async with resilient_client("mediawiki", timeout=20.0, headers=HEADERS) as client:
             response = await client.get(WIKIDATA_BASE, params=params)
             response.raise_for_status()
             data = response.json()
@@ -145,7 +146,7 @@ async def fetch_meta_wiki_pages(query: str, limit: int = 5) -> List[Dict]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=20.0, headers=HEADERS) as client:
+        async with resilient_client("mediawiki", timeout=20.0, headers=HEADERS) as client:
             response = await client.get(META_WIKI_BASE, params=params)
             response.raise_for_status()
             data = response.json()
@@ -24,7 +24,8 @@ async def main():
     print(f"Test claim: '{test_claim}'")
 
     try:
-        sources = await ai_engine._search_sources(test_claim, "GuardianAvatar")
+        search = await ai_engine._search_sources(test_claim, "GuardianAvatar")
+        sources = search.sources
         print(f"\nTotal sources found: {len(sources)}")
 
         print("\nSOURCE LIST:")
@@ -34,9 +35,9 @@ async def main():
             print(f"      Credibility: {src.credibility_score}")
 
         # Check API usage
-        if hasattr(ai_engine, 'last_api_usage'):
+        if search.api_usage:
             print("\n\nAPI USAGE DETAILS:")
-            usage = ai_engine.last_api_usage
+            usage = search.api_usage
             for api_name, data in usage.items():
                 if isinstance(data, dict):
                     print(f"\n  {api_name}:")
@@ -59,7 +60,7 @@ async def main():
 
         for persona, claim in personas.items():
             print(f"\n{persona}: '{claim}'")
-            sources = await ai_engine._search_sources(claim, persona)
+            sources = (await ai_engine._search_sources(claim, persona)).sources
             print(f"  Sources: {len(sources)}")
 
             # Show unique domains
@@ -34,7 +34,8 @@ async def test_api_availability():
     test_claim = "Ursula von der Leyen was not elected"
 
     try:
-        sources = await ai_engine._search_sources(test_claim, "GuardianAvatar")
+        search = await ai_engine._search_sources(test_claim, "GuardianAvatar")
+        sources = search.sources
 
         print(f"\n  Total sources returned: {len(sources)}")
 
@@ -68,9 +69,9 @@ async def test_api_availability():
                 print(f"        URL: {src.url}")
 
         # Check API usage metadata
-        if hasattr(ai_engine, 'last_api_usage'):
+        if search.api_usage:
             print("\n  📡 API CALL DETAILS:")
-            usage = ai_engine.last_api_usage
+            usage = search.api_usage
             for api_name, api_data in usage.items():
                 if isinstance(api_data, dict):
                     available = api_data.get('available', False)
@@ -118,7 +119,7 @@ async def test_persona_source_routing():
         print(f"   Expected sources: {_get_expected_sources(persona)}")
 
         try:
-            sources = await ai_engine._search_sources(claim, persona)
+            sources = (await ai_engine._search_sources(claim, persona)).sources
             persona_sources[persona] = sources
 
             print(f"   Total sources: {len(sources)}")
@@ -28,7 +28,7 @@ async def test_charlie_kirk_claim():
         
         # Test other sources
         print("--- Testing other sources ---")
-        all_sources = await ai._search_sources(claim)
+        all_sources = (await ai._search_sources(claim)).sources
         print(f"Total sources found: {len(all_sources)}")
         
         # Show source breakdown